@@ -7,31 +7,100 @@ and file management.
 """
 
 import os
+import re
 import sys
 import json
+import asyncio
+import time
 import base64
+import itertools
+import platform
+from collections import OrderedDict
 from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
 
 # Try to import FastAPI - if not available, provide helpful error
 try:
-    from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTasks
+    from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTasks, Request, Response
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.middleware.gzip import GZipMiddleware
     from fastapi.staticfiles import StaticFiles
-    from fastapi.responses import FileResponse, JSONResponse
-    from pydantic import BaseModel, Field
+    from fastapi.responses import FileResponse, ORJSONResponse
+    from pydantic import BaseModel, Field, TypeAdapter, field_serializer, field_validator
     import uvicorn
+    import aiofiles
+    import anyio.to_thread
+    import orjson
     FASTAPI_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️  FastAPI not installed: {e}")
-    print("📦 Install with: pip install fastapi uvicorn python-multipart")
+    print("📦 Install with: pip install fastapi uvicorn python-multipart aiofiles orjson")
     FASTAPI_AVAILABLE = False
 
 # Add project root to path for imports
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
+# Data directories, joined once instead of on every request
+OUTPUTS_DIR = project_root / "outputs"
+UPLOADS_DIR = project_root / "uploads"
+LOGS_DIR = project_root / "logs"
+FRONTEND_DIR = project_root / "frontend"
+FRONTEND_INDEX = FRONTEND_DIR / "index.html"
+OUTPUTS_STR = str(OUTPUTS_DIR)
+UPLOADS_STR = str(UPLOADS_DIR)
+
+# Event loop and HTTP parser for uvicorn (uvloop is not available on Windows)
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+UVICORN_HTTP = "httptools"
+
+# Production runs several worker processes without per-request access logging;
+# development keeps one auto-reloading worker
+IS_PRODUCTION = os.getenv("APP_ENV", os.getenv("ENV", "development")).lower() in ("production", "prod")
+UVICORN_WORKERS = int(os.getenv("UVICORN_WORKERS", os.cpu_count() or 4))
+
+# Worker threads available for blocking calls offloaded from the event loop
+THREAD_POOL_SIZE = 100
+
+# Uploads are streamed to disk in chunks of this size (256 KiB)
+UPLOAD_CHUNK_SIZE = 256 * 1024
+# Largest accepted upload in bytes (100 MiB by default)
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", 100 << 20))
+# File types accepted by the upload endpoint and the MIME type reported for each
+UPLOAD_MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.svg': 'image/svg+xml',
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.txt': 'text/plain',
+}
+ALLOWED_UPLOAD_EXTENSIONS = frozenset(UPLOAD_MIME_TYPES)
+ALLOWED_UPLOAD_HELP = ', '.join(sorted(ALLOWED_UPLOAD_EXTENSIONS))
+# Static file names carrying a content hash (e.g. app.3f9c2b1e.js); only these are safe to cache as immutable
+HASHED_ASSET_PATTERN = re.compile(r'[.-][0-9a-fA-F]{8,}\.\w+$')
+# Paths serving files as-is: presentations and images are already compressed, and a
+# gzipped body must not be sent under the file's strong ETag
+GZIP_EXCLUDED_PREFIXES = ("/api/presentations/", "/outputs/", "/uploads/")
+# Presentation downloads are read in chunks of this size (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Number of generated AI results kept for repeated identical requests
+AI_CACHE_SIZE = 512
+
+# Sequence for generated file names, seeded from the clock so restarts do not reuse names
+FILE_SEQ = itertools.count(int(time.time() * 1000))
+
+
+def unique_file_id() -> str:
+    """Return a collision-free id for generated file names (unique per process and worker)."""
+    return f"{next(FILE_SEQ):x}-{os.getpid():x}"
+
 # Import existing modules with error handling
 try:
     from ppt_generator import PPTGenerator
@@ -48,7 +117,7 @@ except ImportError as e:
     VOICE_AVAILABLE = False
 
 try:
-    from voice_command_parser import VoiceCommandParser
+    from voice_command_parser import get_command_parser
     PARSER_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️  Command parser not available: {e}")
@@ -62,12 +131,51 @@ except ImportError as e:
     AI_AVAILABLE = False
 
 try:
-    from config import get_config, get_logger
+    from config import get_config, get_logger, stop_logging
     CONFIG_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️  Config not available: {e}")
     CONFIG_AVAILABLE = False
 
+try:
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.inmemory import InMemoryBackend
+    from fastapi_cache.coder import Coder
+    from fastapi_cache.decorator import cache
+    CACHE_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️  Response cache not available: {e}")
+    print("📦 Install with: pip install fastapi-cache2")
+    CACHE_AVAILABLE = False
+
+    def cache(expire=None, **kwargs):
+        """No-op stand-in for fastapi_cache.decorator.cache."""
+        def decorator(func):
+            return func
+        return decorator
+
+if CACHE_AVAILABLE:
+    class ORJSONCoder(Coder):
+        """Cache coder that stores responses as orjson bytes instead of stdlib json."""
+        
+        @classmethod
+        def encode(cls, value: Any) -> bytes:
+            if isinstance(value, BaseModel):
+                return value.model_dump_json().encode()
+            return orjson.dumps(value)
+        
+        @classmethod
+        def decode(cls, value: bytes) -> Any:
+            return orjson.loads(value)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️  System statistics not available: {e}")
+    print("📦 Install with: pip install psutil")
+    PSUTIL_AVAILABLE = False
+
 # Exit if FastAPI is not available
 if not FASTAPI_AVAILABLE:
     print("❌ Cannot start server without FastAPI. Please install required dependencies.")
@@ -89,17 +197,32 @@ else:
         'gemini_api_key': '',
         'ai_temperature': 0.7,
         'ai_max_tokens': 1000,
+        'ai_concurrency': 4,
         'auto_save': True,
         'max_slide_count': 50
     })()
 
+# Resolve the configuration values the API reports once, so handlers read plain attributes
+CONFIG_SNAPSHOT = SimpleNamespace(
+    voice_recognition_engine=getattr(config, 'voice_recognition_engine', 'google'),
+    voice_language=getattr(config, 'voice_language', 'en-US'),
+    enable_voice_feedback=getattr(config, 'enable_voice_feedback', True),
+    log_level=getattr(config, 'log_level', 'INFO'),
+    ai_available=bool(getattr(config, 'gemini_api_key', '')),
+    ai_temperature=getattr(config, 'ai_temperature', 0.7),
+    ai_max_tokens=getattr(config, 'ai_max_tokens', 1000),
+    auto_save=getattr(config, 'auto_save', True),
+    max_slide_count=getattr(config, 'max_slide_count', 50)
+)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI-PPT Agent",
     description="AI-powered voice-controlled PowerPoint generation system",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -111,19 +234,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes file downloads through uncompressed."""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(GZIP_EXCLUDED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress JSON and static text responses
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1000, compresslevel=5)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles mount that lets browsers reuse content-hashed files without re-downloading."""
+    
+    def __init__(self, *args, immutable_hashed: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.immutable_hashed = immutable_hashed
+    
+    def file_response(self, full_path, *args, **kwargs):
+        response = super().file_response(full_path, *args, **kwargs)
+        # A hashed name changes whenever its content does, so it can be cached for good;
+        # anything else is revalidated (ETag/Last-Modified) so a deploy is picked up at once
+        if self.immutable_hashed and HASHED_ASSET_PATTERN.search(os.path.basename(full_path)):
+            response.headers.setdefault("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            response.headers.setdefault("Cache-Control", "no-cache")
+        return response
+
+
+class PresentationFileResponse(FileResponse):
+    """
+    FileResponse for presentation downloads.
+    
+    Servers that support the ASGI pathsend extension send the file straight from disk;
+    otherwise it is read in large chunks to keep per-chunk overhead low.
+    """
+    chunk_size = DOWNLOAD_CHUNK_SIZE
+
+
 # Mount static directories
 try:
-    frontend_path = project_root / "frontend"
-    if frontend_path.exists():
-        app.mount("/static", StaticFiles(directory=str(frontend_path)), name="static")
+    if FRONTEND_DIR.exists():
+        app.mount("/static", CachedStaticFiles(directory=str(FRONTEND_DIR)), name="static")
     
-    outputs_path = project_root / "outputs"
-    if outputs_path.exists():
-        app.mount("/outputs", StaticFiles(directory=str(outputs_path)), name="outputs")
+    if OUTPUTS_DIR.exists():
+        # Presentations can be re-saved under the same name, so they are always revalidated
+        app.mount("/outputs", CachedStaticFiles(directory=OUTPUTS_STR, immutable_hashed=False), name="outputs")
         
-    uploads_path = project_root / "uploads"
-    if uploads_path.exists():
-        app.mount("/uploads", StaticFiles(directory=str(uploads_path)), name="uploads")
+    if UPLOADS_DIR.exists():
+        app.mount("/uploads", StaticFiles(directory=str(UPLOADS_DIR)), name="uploads")
         
 except Exception as e:
     logger.warning(f"Could not mount static directories: {e}")
@@ -146,7 +309,7 @@ if VOICE_AVAILABLE:
 command_parser = None
 if PARSER_AVAILABLE:
     try:
-        command_parser = VoiceCommandParser()
+        command_parser = get_command_parser()
     except Exception as e:
         logger.error(f"Failed to initialize Command Parser: {e}")
 
@@ -157,6 +320,199 @@ if AI_AVAILABLE:
     except Exception as e:
         logger.error(f"Failed to initialize AI Agent: {e}")
 
+# The shared presentation is not thread-safe, so generator calls run one at a time
+ppt_lock = asyncio.Lock()
+
+
+async def run_ppt(func, *args, **kwargs):
+    """Run a blocking PPTGenerator call in a worker thread without blocking the event loop."""
+    async with ppt_lock:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+# Gemini calls share one client, so bound how many run concurrently instead of
+# letting a burst of requests occupy every worker thread (AI_CONCURRENCY setting)
+ai_semaphore = asyncio.Semaphore(getattr(config, 'ai_concurrency', 4))
+
+
+async def run_ai(func, *args, **kwargs):
+    """Run a blocking GeminiAI call in a worker thread, bounded by the AI semaphore."""
+    async with ai_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+# Recently generated AI content in least-recently-used order
+ai_content_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+
+
+async def run_ai_cached(key: tuple, func, *args, **kwargs):
+    """Run a GeminiAI call through run_ai, reusing the result of an identical earlier request."""
+    if key in ai_content_cache:
+        ai_content_cache.move_to_end(key)
+        return ai_content_cache[key]
+    
+    content = await run_ai(func, *args, **kwargs)
+    # Failed generations come back as None and are retried on the next request
+    if content is not None:
+        ai_content_cache[key] = content
+        if len(ai_content_cache) > AI_CACHE_SIZE:
+            ai_content_cache.popitem(last=False)
+    return content
+
+
+def collect_system_info() -> Dict[str, Any]:
+    """Gather platform, disk and directory statistics; blocking, so call it from a worker thread."""
+    if PSUTIL_AVAILABLE:
+        # Get disk usage for outputs directory
+        disk_usage = psutil.disk_usage(str(project_root))
+        
+        system_info = {
+            "platform": platform.system(),
+            "python_version": platform.python_version(),
+            "cpu_count": psutil.cpu_count(),
+            "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
+            "disk_usage": {
+                "total_gb": round(disk_usage.total / (1024**3), 2),
+                "used_gb": round(disk_usage.used / (1024**3), 2),
+                "free_gb": round(disk_usage.free / (1024**3), 2)
+            }
+        }
+    else:
+        system_info = {
+            "platform": platform.system(),
+            "python_version": platform.python_version(),
+            "psutil_available": False
+        }
+    
+    # Add directory info
+    system_info["directories"] = {
+        "outputs": count_entries(OUTPUTS_DIR, ".pptx"),
+        "uploads": count_entries(UPLOADS_DIR)
+    }
+    return system_info
+
+
+# Last outputs listing: the .pptx names, keyed by the directory mtime so unchanged
+# directories are not rescanned, and the formatted entry for each file version
+presentation_listing: Dict[str, Any] = {"mtime": None, "names": [], "entries": {}}
+
+
+def scan_presentations() -> List[Dict[str, Any]]:
+    """
+    List generated presentations, newest first.
+    
+    The directory is only re-read when its mtime changes, which covers files
+    being added or removed. Every file is still stat'ed on each call, since
+    rewriting a file in place does not change the directory mtime.
+    """
+    try:
+        dir_mtime = os.stat(OUTPUTS_STR).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    
+    if presentation_listing["mtime"] != dir_mtime:
+        # scandir yields names and file types from a single directory read
+        with os.scandir(OUTPUTS_STR) as entries:
+            presentation_listing["names"] = [entry.name for entry in entries
+                                             if entry.name.endswith(".pptx") and entry.is_file()]
+        presentation_listing["mtime"] = dir_mtime
+    
+    found = []
+    for name in presentation_listing["names"]:
+        path = os.path.join(OUTPUTS_STR, name)
+        try:
+            found.append((name, path, os.stat(path)))
+        except FileNotFoundError:
+            continue
+    
+    # Sort by creation time (newest first) on the raw timestamps
+    found.sort(key=lambda item: item[2].st_ctime, reverse=True)
+    
+    # Files that have not changed since the last call reuse their already formatted entry
+    previous = presentation_listing["entries"]
+    entries = {}
+    presentations = []
+    for name, path, stat in found:
+        key = (name, stat.st_ctime_ns, stat.st_mtime_ns, stat.st_size)
+        item = previous.get(key)
+        if item is None:
+            item = {
+                "name": name,
+                "path": path,
+                "size": stat.st_size,
+                "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "url": f"/outputs/{name}"
+            }
+        entries[key] = item
+        presentations.append(item)
+    
+    presentation_listing["entries"] = entries
+    return presentations
+
+
+def copy_upload(source, file_path: str, expected_size: Optional[int] = None) -> int:
+    """
+    Copy an uploaded file to disk in chunks, stopping once MAX_UPLOAD_SIZE is exceeded.
+    
+    Runs in a worker thread so the whole copy costs a single hop off the event loop
+    rather than one per chunk.
+    
+    Returns:
+        int: Number of bytes read from the upload
+    """
+    size = 0
+    with open(file_path, "wb") as f:
+        # Reserve the full size up front so the filesystem can lay the file out contiguously
+        if expected_size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(f.fileno(), 0, expected_size)
+            except OSError:
+                pass
+        
+        # Large uploads have already been spooled to a temp file, so the kernel can copy
+        # them directly without passing every chunk through Python buffers
+        if getattr(source, "_rolled", False) and hasattr(os, "copy_file_range"):
+            try:
+                src_fd, dst_fd, start = source.fileno(), f.fileno(), source.tell()
+                while size <= MAX_UPLOAD_SIZE:
+                    copied = os.copy_file_range(src_fd, dst_fd, MAX_UPLOAD_SIZE + 1 - size, start + size, size)
+                    if not copied:
+                        break
+                    size += copied
+                return size
+            except OSError:
+                # Explicit offsets leave both file positions untouched, so the chunked copy
+                # below can simply start over
+                size = 0
+        
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_UPLOAD_SIZE:
+                break
+            f.write(chunk)
+    return size
+
+
+async def save_presentation_in_background(save_path: str):
+    """Save the shared presentation after the response has been sent."""
+    try:
+        # Only the in-memory snapshot needs the generator lock; the disk write happens
+        # after it is released so other presentation edits are not held up
+        data = await run_ppt(ppt_generator.to_bytes)
+        async with aiofiles.open(save_path, "wb") as f:
+            await f.write(data)
+    except Exception as e:
+        logger.error(f"Background save to {save_path} failed: {e}")
+
+
+def count_entries(directory: Path, suffix: str = "") -> int:
+    """Count directory entries ending with suffix using a single scandir pass."""
+    if not directory.exists():
+        return 0
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.name.endswith(suffix))
+
+
 # Pydantic models for request/response validation
 class APIResponse(BaseModel):
     """Standard API response model."""
@@ -164,7 +520,20 @@ class APIResponse(BaseModel):
     message: str
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: float = Field(default_factory=time.time)
+    
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def parse_timestamp(cls, v):
+        """Accept ISO strings, e.g. when re-validating a cached JSON payload."""
+        if isinstance(v, str):
+            return datetime.fromisoformat(v).timestamp()
+        return v
+    
+    @field_serializer("timestamp", when_used="json")
+    def format_timestamp(self, v: float) -> str:
+        """Format the epoch timestamp as ISO 8601 only when rendering JSON."""
+        return datetime.fromtimestamp(v).isoformat()
 
 
 class VoiceCommandRequest(BaseModel):
@@ -192,44 +561,57 @@ class AIContentRequest(BaseModel):
     tone: str = Field(default="professional", description="Content tone")
 
 
+# Serializer for APIResponse, built once and reused
+API_RESPONSE_ADAPTER = TypeAdapter(APIResponse)
+
+def render_api_response(message: str, data: Dict[str, Any]) -> bytes:
+    """Render a successful APIResponse, stamped with the current time, to JSON bytes."""
+    return API_RESPONSE_ADAPTER.dump_json(APIResponse(success=True, message=message, data=data))
+
+
+# Endpoints listed by the root endpoint
+ROOT_ENDPOINTS = {
+    "health": "/api/health",
+    "voice_command": "/api/voice-command",
+    "ppt_action": "/api/ppt-action",
+    "ai_content": "/api/ai-content",
+    "presentations": "/api/presentations"
+}
+
+# Configuration payload; the settings never change while the server runs, so only
+# the response envelope (with its timestamp) is built per request
+CONFIG_DATA = vars(CONFIG_SNAPSHOT)
+
+
 # Root endpoint
 @app.get("/", response_model=APIResponse)
 async def root():
     """Root endpoint - serves frontend or API info."""
     try:
-        frontend_file = project_root / "frontend" / "index.html"
-        if frontend_file.exists():
-            return FileResponse(str(frontend_file))
-        
-        return APIResponse(
-            success=True,
-            message="AI-PPT Agent API is running",
-            data={
-                "version": "1.0.0",
-                "docs": "/api/docs",
-                "status": "healthy",
-                "components": {
-                    "ppt_generator": PPT_AVAILABLE and ppt_generator is not None,
-                    "voice_processor": VOICE_AVAILABLE and voice_processor is not None,
-                    "ai_agent": AI_AVAILABLE and ai_agent is not None,
-                    "command_parser": PARSER_AVAILABLE and command_parser is not None
-                },
-                "endpoints": {
-                    "health": "/api/health",
-                    "voice_command": "/api/voice-command",
-                    "ppt_action": "/api/ppt-action",
-                    "ai_content": "/api/ai-content",
-                    "presentations": "/api/presentations"
-                }
-            }
-        )
+        if FRONTEND_INDEX.exists():
+            return FileResponse(str(FRONTEND_INDEX), headers={"Cache-Control": "no-cache"})
+        
+        body = render_api_response("AI-PPT Agent API is running", {
+            "version": "1.0.0",
+            "docs": "/api/docs",
+            "status": "healthy",
+            "components": {
+                "ppt_generator": PPT_AVAILABLE and ppt_generator is not None,
+                "voice_processor": VOICE_AVAILABLE and voice_processor is not None,
+                "ai_agent": AI_AVAILABLE and ai_agent is not None,
+                "command_parser": PARSER_AVAILABLE and command_parser is not None
+            },
+            "endpoints": ROOT_ENDPOINTS
+        })
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Root endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Health check endpoint
-@app.get("/api/health", response_model=APIResponse)
+# Polled frequently, so the APIResponse is serialized directly without response-model re-validation
+@app.get("/api/health", response_model=None)
 async def health_check():
     """Check the health status of all system components."""
     try:
@@ -243,9 +625,9 @@ async def health_check():
         
         # Check directories
         directories_status = {
-            "outputs": (project_root / "outputs").exists(),
-            "uploads": (project_root / "uploads").exists(),
-            "logs": (project_root / "logs").exists()
+            "outputs": OUTPUTS_DIR.exists(),
+            "uploads": UPLOADS_DIR.exists(),
+            "logs": LOGS_DIR.exists()
         }
         
         all_healthy = any(components_status.values())  # At least one component should work
@@ -258,9 +640,9 @@ async def health_check():
                 "components": components_status,
                 "directories": directories_status,
                 "config": {
-                    "ai_available": bool(getattr(config, 'gemini_api_key', '')),
-                    "voice_engine": getattr(config, 'voice_recognition_engine', 'unknown'),
-                    "log_level": getattr(config, 'log_level', 'INFO')
+                    "ai_available": CONFIG_SNAPSHOT.ai_available,
+                    "voice_engine": CONFIG_SNAPSHOT.voice_recognition_engine,
+                    "log_level": CONFIG_SNAPSHOT.log_level
                 }
             }
         )
@@ -338,7 +720,7 @@ async def process_voice_command(request: VoiceCommandRequest):
                 # Simple command execution based on command type
                 if hasattr(parsed_command, 'command') and parsed_command.command == 'add_slide':
                     title = getattr(parsed_command, 'title', 'New Slide')
-                    slide_num = ppt_generator.add_slide(title=title)
+                    slide_num = await run_ppt(ppt_generator.add_slide, title=title)
                     execution_result = {"action": "add_slide", "slide_number": slide_num, "title": title}
                 else:
                     execution_result = {"message": "Command parsed but execution not yet fully implemented"}
@@ -371,7 +753,7 @@ async def process_voice_command(request: VoiceCommandRequest):
 
 # PPT action execution endpoint
 @app.post("/api/ppt-action", response_model=APIResponse)
-async def execute_ppt_action(request: PPTActionRequest):
+async def execute_ppt_action(request: PPTActionRequest, background_tasks: BackgroundTasks):
     """Execute specific PowerPoint manipulation action."""
     try:
         logger.info(f"Executing PPT action: {request.action}")
@@ -386,32 +768,32 @@ async def execute_ppt_action(request: PPTActionRequest):
             title = request.parameters.get("title", "New Slide")
             content = request.parameters.get("content", "")
             layout_index = request.parameters.get("layout", 0)
-            result = ppt_generator.add_slide(layout_index=layout_index, title=title, subtitle=content)
+            result = await run_ppt(ppt_generator.add_slide, layout_index=layout_index, title=title, subtitle=content)
             
         elif request.action == "delete_slide":
             slide_number = request.parameters.get("slide_number")
             if slide_number is None:
                 raise HTTPException(status_code=400, detail="slide_number parameter required")
-            result = ppt_generator.delete_slide(slide_number)
+            result = await run_ppt(ppt_generator.delete_slide, slide_number)
             
         elif request.action == "update_text":
             slide_number = request.parameters.get("slide_number")
             new_text = request.parameters.get("text")
             if slide_number is None or new_text is None:
                 raise HTTPException(status_code=400, detail="slide_number and text parameters required")
-            result = ppt_generator.update_text(slide_number, new_text)
+            result = await run_ppt(ppt_generator.update_text, slide_number, new_text)
             
         else:
             raise HTTPException(status_code=400, detail=f"Action '{request.action}' not yet implemented")
         
-        # Auto-save if requested
+        # Auto-save if requested; the pptx is written after the response goes out
         save_path = None
         if request.auto_save:
-            save_path = project_root / "outputs" / f"presentation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pptx"
-            ppt_generator.save_presentation(str(save_path))
+            save_path = os.path.join(OUTPUTS_STR, f"presentation_{unique_file_id()}.pptx")
+            background_tasks.add_task(save_presentation_in_background, save_path)
             result = result or {}
             if isinstance(result, dict):
-                result["saved_to"] = str(save_path)
+                result["saved_to"] = save_path
         
         return APIResponse(
             success=True,
@@ -420,7 +802,7 @@ async def execute_ppt_action(request: PPTActionRequest):
                 "action": request.action,
                 "parameters": request.parameters,
                 "result": result,
-                "saved_to": str(save_path) if save_path else None
+                "saved_to": save_path
             }
         )
         
@@ -445,16 +827,21 @@ async def generate_ai_content(request: AIContentRequest):
         if not ai_agent:
             raise HTTPException(status_code=503, detail="AI agent not available")
         
-        # Generate content based on type
+        # Generate content based on type; identical requests are served from the cache
         content = None
+        cache_key = (request.content_type, request.topic, request.tone, request.slide_count, request.additional_context)
         
         if request.content_type == "slide_content":
-            content = ai_agent.generate_slide_content(
+            content = await run_ai_cached(
+                cache_key,
+                ai_agent.generate_slide_content,
                 topic=request.topic,
                 context=request.additional_context or ""
             )
         elif request.content_type == "presentation_outline":
-            content = ai_agent.generate_presentation_outline(
+            content = await run_ai_cached(
+                cache_key,
+                ai_agent.generate_presentation_outline,
                 topic=request.topic,
                 slide_count=request.slide_count or 5,
                 context=request.additional_context or ""
@@ -492,28 +879,32 @@ async def upload_file(file: UploadFile = File(...)):
         logger.info(f"Uploading file: {file.filename}")
         
         # Validate file type
-        allowed_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.pdf', '.docx', '.txt'}
-        file_ext = Path(file.filename or 'unknown').suffix.lower()
+        file_ext = os.path.splitext(file.filename or '')[1].lower()
         
-        if file_ext not in allowed_extensions:
+        if file_ext not in ALLOWED_UPLOAD_EXTENSIONS:
             raise HTTPException(
                 status_code=400, 
-                detail=f"File type {file_ext} not allowed. Supported: {', '.join(allowed_extensions)}"
+                detail=f"File type {file_ext} not allowed. Supported: {ALLOWED_UPLOAD_HELP}"
             )
         
         # Create upload directory if it doesn't exist
-        upload_dir = project_root / "uploads"
-        upload_dir.mkdir(exist_ok=True)
+        UPLOADS_DIR.mkdir(exist_ok=True)
         
         # Generate unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{timestamp}_{file.filename}"
-        file_path = upload_dir / filename
+        filename = f"{unique_file_id()}_{file.filename}"
+        file_path = os.path.join(UPLOADS_STR, filename)
+        
+        too_large = f"File exceeds the {MAX_UPLOAD_SIZE} byte upload limit"
+        if file.size and file.size > MAX_UPLOAD_SIZE:
+            raise HTTPException(status_code=413, detail=too_large)
         
-        # Save file
-        content = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(content)
+        # Stream file to disk in chunks so large uploads never sit fully in memory
+        size = await asyncio.to_thread(copy_upload, file.file, file_path, file.size)
+        
+        # Stop copying as soon as the limit is crossed and discard the partial file
+        if size > MAX_UPLOAD_SIZE:
+            os.unlink(file_path)
+            raise HTTPException(status_code=413, detail=too_large)
         
         return APIResponse(
             success=True,
@@ -521,9 +912,9 @@ async def upload_file(file: UploadFile = File(...)):
             data={
                 "filename": filename,
                 "original_filename": file.filename,
-                "path": str(file_path),
-                "size": len(content),
-                "type": file.content_type,
+                "path": file_path,
+                "size": size,
+                "type": UPLOAD_MIME_TYPES[file_ext],
                 "url": f"/uploads/{filename}"
             }
         )
@@ -542,25 +933,14 @@ async def upload_file(file: UploadFile = File(...)):
 # List presentations endpoint
 @app.get("/api/presentations", response_model=APIResponse)
 async def list_presentations():
-    """List all generated presentations."""
+    """
+    List all generated presentations.
+    
+    Not response-cached: the listing must show a file as soon as it is saved,
+    and scan_presentations re-stats each file on every call.
+    """
     try:
-        outputs_dir = project_root / "outputs"
-        presentations = []
-        
-        if outputs_dir.exists():
-            for ppt_file in outputs_dir.glob("*.pptx"):
-                stat = ppt_file.stat()
-                presentations.append({
-                    "name": ppt_file.name,
-                    "path": str(ppt_file),
-                    "size": stat.st_size,
-                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "url": f"/outputs/{ppt_file.name}"
-                })
-        
-        # Sort by creation time (newest first)
-        presentations.sort(key=lambda x: x["created"], reverse=True)
+        presentations = await asyncio.to_thread(scan_presentations)
         
         return APIResponse(
             success=True,
@@ -584,73 +964,19 @@ async def list_presentations():
 @app.get("/api/config", response_model=APIResponse)
 async def get_configuration():
     """Get current system configuration."""
-    try:
-        config_data = {
-            "voice_recognition_engine": getattr(config, 'voice_recognition_engine', 'google'),
-            "voice_language": getattr(config, 'voice_language', 'en-US'),
-            "enable_voice_feedback": getattr(config, 'enable_voice_feedback', True),
-            "log_level": getattr(config, 'log_level', 'INFO'),
-            "ai_available": bool(getattr(config, 'gemini_api_key', '')),
-            "ai_temperature": getattr(config, 'ai_temperature', 0.7),
-            "ai_max_tokens": getattr(config, 'ai_max_tokens', 1000),
-            "auto_save": getattr(config, 'auto_save', True),
-            "max_slide_count": getattr(config, 'max_slide_count', 50)
-        }
-        
-        return APIResponse(
-            success=True,
-            message="Configuration retrieved successfully",
-            data=config_data
-        )
-        
-    except Exception as e:
-        logger.error(f"Configuration retrieval error: {e}")
-        return APIResponse(
-            success=False,
-            message="Failed to retrieve configuration",
-            error=str(e)
-        )
+    return Response(
+        content=render_api_response("Configuration retrieved successfully", CONFIG_DATA),
+        media_type="application/json"
+    )
 
 
 # System information endpoint
 @app.get("/api/system-info", response_model=APIResponse)
+@cache(expire=10)
 async def get_system_info():
     """Get system information and statistics."""
     try:
-        try:
-            import psutil
-            import platform
-            
-            # Get disk usage for outputs directory
-            outputs_dir = project_root / "outputs"
-            disk_usage = psutil.disk_usage(str(outputs_dir.parent))
-            
-            system_info = {
-                "platform": platform.system(),
-                "python_version": platform.python_version(),
-                "cpu_count": psutil.cpu_count(),
-                "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-                "disk_usage": {
-                    "total_gb": round(disk_usage.total / (1024**3), 2),
-                    "used_gb": round(disk_usage.used / (1024**3), 2),
-                    "free_gb": round(disk_usage.free / (1024**3), 2)
-                }
-            }
-        except ImportError:
-            import platform
-            system_info = {
-                "platform": platform.system(),
-                "python_version": platform.python_version(),
-                "psutil_available": False
-            }
-        
-        # Add directory info
-        outputs_dir = project_root / "outputs"
-        uploads_dir = project_root / "uploads"
-        system_info["directories"] = {
-            "outputs": len(list(outputs_dir.glob("*.pptx"))) if outputs_dir.exists() else 0,
-            "uploads": len(list(uploads_dir.iterdir())) if uploads_dir.exists() else 0
-        }
+        system_info = await asyncio.to_thread(collect_system_info)
         
         return APIResponse(
             success=True,
@@ -670,26 +996,28 @@ async def get_system_info():
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return JSONResponse(
+    return Response(
         status_code=404,
-        content=APIResponse(
+        content=API_RESPONSE_ADAPTER.dump_json(APIResponse(
             success=False,
             message="Endpoint not found",
             error="The requested resource was not found"
-        ).dict()
+        )),
+        media_type="application/json"
     )
 
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     logger.error(f"Internal server error: {exc}")
-    return JSONResponse(
+    return Response(
         status_code=500,
-        content=APIResponse(
+        content=API_RESPONSE_ADAPTER.dump_json(APIResponse(
             success=False,
             message="Internal server error",
             error="An unexpected error occurred"
-        ).dict()
+        )),
+        media_type="application/json"
     )
 
 
@@ -699,10 +1027,15 @@ async def startup_event():
     """Initialize system on startup."""
     logger.info("AI-PPT Agent starting up...")
     
+    # Allow more concurrent blocking calls (file responses, background tasks) in the threadpool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+    
+    # In-memory TTL cache for read-mostly endpoints
+    if CACHE_AVAILABLE:
+        FastAPICache.init(InMemoryBackend(), coder=ORJSONCoder)
+    
     # Create necessary directories
-    directories = ["outputs", "uploads", "logs"]
-    for dir_name in directories:
-        dir_path = project_root / dir_name
+    for dir_path in (OUTPUTS_DIR, UPLOADS_DIR, LOGS_DIR):
         dir_path.mkdir(exist_ok=True)
         logger.info(f"Ensured directory exists: {dir_path}")
     
@@ -726,7 +1059,15 @@ async def shutdown_event():
     if hasattr(voice_processor, 'stop_continuous_listening'):
         voice_processor.stop_continuous_listening()
     
+    # Release the microphone held open between requests
+    if hasattr(voice_processor, 'close'):
+        voice_processor.close()
+    
     logger.info("AI-PPT Agent shutdown completed")
+    
+    # Drain the background log queue before the worker exits
+    if CONFIG_AVAILABLE:
+        stop_logging()
 
 
 # Main entry point
@@ -738,9 +1079,12 @@ if __name__ == "__main__":
             "app:app",
             host="0.0.0.0",
             port=8000,
-            reload=True,
+            reload=not IS_PRODUCTION,
+            workers=UVICORN_WORKERS if IS_PRODUCTION else 1,
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
             log_level="info",
-            access_log=True
+            access_log=not IS_PRODUCTION
         )
     except Exception as e:
         print(f"❌ Failed to start server: {e}")
@@ -750,14 +1094,14 @@ if __name__ == "__main__":
 
 # PPT action execution endpoint
 @app.post("/api/ppt-action", response_model=APIResponse)
-async def execute_ppt_action(request: PPTActionRequest):
+async def execute_ppt_action(request: PPTActionRequest, background_tasks: BackgroundTasks):
     """Execute specific PowerPoint manipulation action."""
     try:
         logger.info(f"Executing PPT action: {request.action}")
         
         # Load presentation if path provided
         if request.presentation_path and os.path.exists(request.presentation_path):
-            ppt_generator.load_presentation(request.presentation_path)
+            await run_ppt(ppt_generator.load_presentation, request.presentation_path)
         
         # Execute the action based on type
         result = None
@@ -766,27 +1110,27 @@ async def execute_ppt_action(request: PPTActionRequest):
             title = request.parameters.get("title", "New Slide")
             content = request.parameters.get("content", "")
             layout_index = request.parameters.get("layout", 1)
-            result = ppt_generator.add_slide(title, content, layout_index)
+            result = await run_ppt(ppt_generator.add_slide, title, content, layout_index)
             
         elif request.action == "delete_slide":
             slide_number = request.parameters.get("slide_number")
             if slide_number is None:
                 raise HTTPException(status_code=400, detail="slide_number parameter required")
-            result = ppt_generator.delete_slide(slide_number)
+            result = await run_ppt(ppt_generator.delete_slide, slide_number)
             
         elif request.action == "modify_layout":
             slide_number = request.parameters.get("slide_number")
             new_layout = request.parameters.get("layout")
             if slide_number is None or new_layout is None:
                 raise HTTPException(status_code=400, detail="slide_number and layout parameters required")
-            result = ppt_generator.modify_layout(slide_number, new_layout)
+            result = await run_ppt(ppt_generator.modify_layout, slide_number, new_layout)
             
         elif request.action == "insert_image":
             slide_number = request.parameters.get("slide_number")
             image_path = request.parameters.get("image_path")
             if slide_number is None or image_path is None:
                 raise HTTPException(status_code=400, detail="slide_number and image_path parameters required")
-            result = ppt_generator.insert_image(slide_number, image_path)
+            result = await run_ppt(ppt_generator.insert_image, slide_number, image_path)
             
         elif request.action == "insert_chart":
             slide_number = request.parameters.get("slide_number")
@@ -794,31 +1138,31 @@ async def execute_ppt_action(request: PPTActionRequest):
             chart_type = request.parameters.get("chart_type", "column")
             if slide_number is None or chart_data is None:
                 raise HTTPException(status_code=400, detail="slide_number and chart_data parameters required")
-            result = ppt_generator.insert_chart(slide_number, chart_data, chart_type)
+            result = await run_ppt(ppt_generator.insert_chart, slide_number, chart_data, chart_type)
             
         elif request.action == "update_text":
             slide_number = request.parameters.get("slide_number")
             new_text = request.parameters.get("text")
             if slide_number is None or new_text is None:
                 raise HTTPException(status_code=400, detail="slide_number and text parameters required")
-            result = ppt_generator.update_text(slide_number, new_text)
+            result = await run_ppt(ppt_generator.update_text, slide_number, new_text)
             
         elif request.action == "change_background":
             slide_number = request.parameters.get("slide_number")
             background_color = request.parameters.get("color")
             if slide_number is None or background_color is None:
                 raise HTTPException(status_code=400, detail="slide_number and color parameters required")
-            result = ppt_generator.change_background(slide_number, background_color)
+            result = await run_ppt(ppt_generator.change_background, slide_number, background_color)
             
         else:
             raise HTTPException(status_code=400, detail=f"Unsupported action: {request.action}")
         
-        # Auto-save if requested
+        # Auto-save if requested; the pptx is written after the response goes out
         if request.auto_save:
-            save_path = project_root / "outputs" / f"presentation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pptx"
-            ppt_generator.save_presentation(str(save_path))
+            save_path = os.path.join(OUTPUTS_STR, f"presentation_{unique_file_id()}.pptx")
+            background_tasks.add_task(save_presentation_in_background, save_path)
             result = result or {}
-            result["saved_to"] = str(save_path)
+            result["saved_to"] = save_path
         
         return APIResponse(
             success=True,
@@ -851,23 +1195,30 @@ async def generate_ai_content(request: AIContentRequest):
         if not ai_agent:
             raise HTTPException(status_code=503, detail="AI agent not available")
         
-        # Generate content based on type
+        # Generate content based on type; identical requests are served from the cache
         content = None
+        cache_key = (request.content_type, request.topic, request.tone, request.slide_count, request.additional_context)
         
         if request.content_type == "slide_content":
-            content = ai_agent.generate_slide_content(
+            content = await run_ai_cached(
+                cache_key,
+                ai_agent.generate_slide_content,
                 topic=request.topic,
                 context=request.additional_context,
                 tone=request.tone
             )
         elif request.content_type == "presentation_outline":
-            content = ai_agent.generate_presentation_outline(
+            content = await run_ai_cached(
+                cache_key,
+                ai_agent.generate_presentation_outline,
                 topic=request.topic,
                 slide_count=request.slide_count or 5,
                 context=request.additional_context
             )
         elif request.content_type == "chart_data":
-            content = ai_agent.suggest_chart_data(
+            content = await run_ai_cached(
+                cache_key,
+                ai_agent.suggest_chart_data,
                 topic=request.topic,
                 context=request.additional_context
             )
@@ -904,28 +1255,32 @@ async def upload_file(file: UploadFile = File(...)):
         logger.info(f"Uploading file: {file.filename}")
         
         # Validate file type
-        allowed_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.pdf', '.docx', '.txt'}
-        file_ext = Path(file.filename).suffix.lower()
+        file_ext = os.path.splitext(file.filename or '')[1].lower()
         
-        if file_ext not in allowed_extensions:
+        if file_ext not in ALLOWED_UPLOAD_EXTENSIONS:
             raise HTTPException(
                 status_code=400, 
-                detail=f"File type {file_ext} not allowed. Supported: {', '.join(allowed_extensions)}"
+                detail=f"File type {file_ext} not allowed. Supported: {ALLOWED_UPLOAD_HELP}"
             )
         
         # Create upload directory if it doesn't exist
-        upload_dir = project_root / "uploads"
-        upload_dir.mkdir(exist_ok=True)
+        UPLOADS_DIR.mkdir(exist_ok=True)
         
         # Generate unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{timestamp}_{file.filename}"
-        file_path = upload_dir / filename
+        filename = f"{unique_file_id()}_{file.filename}"
+        file_path = os.path.join(UPLOADS_STR, filename)
         
-        # Save file
-        content = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(content)
+        too_large = f"File exceeds the {MAX_UPLOAD_SIZE} byte upload limit"
+        if file.size and file.size > MAX_UPLOAD_SIZE:
+            raise HTTPException(status_code=413, detail=too_large)
+        
+        # Stream file to disk in chunks so large uploads never sit fully in memory
+        size = await asyncio.to_thread(copy_upload, file.file, file_path, file.size)
+        
+        # Stop copying as soon as the limit is crossed and discard the partial file
+        if size > MAX_UPLOAD_SIZE:
+            os.unlink(file_path)
+            raise HTTPException(status_code=413, detail=too_large)
         
         return APIResponse(
             success=True,
@@ -933,9 +1288,9 @@ async def upload_file(file: UploadFile = File(...)):
             data={
                 "filename": filename,
                 "original_filename": file.filename,
-                "path": str(file_path),
-                "size": len(content),
-                "type": file.content_type,
+                "path": file_path,
+                "size": size,
+                "type": UPLOAD_MIME_TYPES[file_ext],
                 "url": f"/uploads/{filename}"
             }
         )
@@ -954,25 +1309,14 @@ async def upload_file(file: UploadFile = File(...)):
 # List presentations endpoint
 @app.get("/api/presentations", response_model=APIResponse)
 async def list_presentations():
-    """List all generated presentations."""
+    """
+    List all generated presentations.
+    
+    Not response-cached: the listing must show a file as soon as it is saved,
+    and scan_presentations re-stats each file on every call.
+    """
     try:
-        outputs_dir = project_root / "outputs"
-        presentations = []
-        
-        if outputs_dir.exists():
-            for ppt_file in outputs_dir.glob("*.pptx"):
-                stat = ppt_file.stat()
-                presentations.append({
-                    "name": ppt_file.name,
-                    "path": str(ppt_file),
-                    "size": stat.st_size,
-                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "url": f"/outputs/{ppt_file.name}"
-                })
-        
-        # Sort by creation time (newest first)
-        presentations.sort(key=lambda x: x["created"], reverse=True)
+        presentations = await asyncio.to_thread(scan_presentations)
         
         return APIResponse(
             success=True,
@@ -994,21 +1338,32 @@ async def list_presentations():
 
 # Download presentation endpoint
 @app.get("/api/presentations/{filename}")
-async def download_presentation(filename: str):
+async def download_presentation(filename: str, request: Request):
     """Download a specific presentation file."""
     try:
-        file_path = project_root / "outputs" / filename
+        file_path = os.path.join(OUTPUTS_STR, filename)
         
-        if not file_path.exists():
+        try:
+            stat_result = os.stat(file_path)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Presentation not found")
         
         if not filename.endswith('.pptx'):
             raise HTTPException(status_code=400, detail="Invalid file type")
         
-        return FileResponse(
-            path=str(file_path),
+        # Revalidate repeat downloads against mtime and size instead of resending the file
+        etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        # Passing the stat result avoids a second stat
+        return PresentationFileResponse(
+            path=file_path,
             filename=filename,
-            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation"
+            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            stat_result=stat_result,
+            # Interrupted downloads can resume with Range requests (served as 206 by FileResponse)
+            headers={"ETag": etag, "Accept-Ranges": "bytes"}
         )
         
     except HTTPException:
@@ -1023,15 +1378,16 @@ async def download_presentation(filename: str):
 async def delete_presentation(filename: str):
     """Delete a specific presentation file."""
     try:
-        file_path = project_root / "outputs" / filename
-        
-        if not file_path.exists():
-            raise HTTPException(status_code=404, detail="Presentation not found")
+        file_path = os.path.join(OUTPUTS_STR, filename)
         
         if not filename.endswith('.pptx'):
             raise HTTPException(status_code=400, detail="Invalid file type")
         
-        file_path.unlink()  # Delete the file
+        # Delete the file in a worker thread; a missing file is reported by the unlink itself
+        try:
+            await asyncio.to_thread(os.unlink, file_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Presentation not found")
         
         return APIResponse(
             success=True,
@@ -1081,61 +1437,19 @@ async def test_voice_recognition():
 @app.get("/api/config", response_model=APIResponse)
 async def get_configuration():
     """Get current system configuration."""
-    try:
-        config_data = {
-            "voice_recognition_engine": config.voice_recognition_engine,
-            "voice_language": config.voice_language,
-            "enable_voice_feedback": config.enable_voice_feedback,
-            "log_level": config.log_level,
-            "ai_available": bool(config.gemini_api_key),
-            "ai_temperature": config.ai_temperature,
-            "ai_max_tokens": config.ai_max_tokens,
-            "auto_save": config.auto_save,
-            "max_slide_count": config.max_slide_count
-        }
-        
-        return APIResponse(
-            success=True,
-            message="Configuration retrieved successfully",
-            data=config_data
-        )
-        
-    except Exception as e:
-        logger.error(f"Configuration retrieval error: {e}")
-        return APIResponse(
-            success=False,
-            message="Failed to retrieve configuration",
-            error=str(e)
-        )
+    return Response(
+        content=render_api_response("Configuration retrieved successfully", CONFIG_DATA),
+        media_type="application/json"
+    )
 
 
 # System information endpoint
 @app.get("/api/system-info", response_model=APIResponse)
+@cache(expire=10)
 async def get_system_info():
     """Get system information and statistics."""
     try:
-        import psutil
-        import platform
-        
-        # Get disk usage for outputs directory
-        outputs_dir = project_root / "outputs"
-        disk_usage = psutil.disk_usage(str(outputs_dir.parent))
-        
-        system_info = {
-            "platform": platform.system(),
-            "python_version": platform.python_version(),
-            "cpu_count": psutil.cpu_count(),
-            "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-            "disk_usage": {
-                "total_gb": round(disk_usage.total / (1024**3), 2),
-                "used_gb": round(disk_usage.used / (1024**3), 2),
-                "free_gb": round(disk_usage.free / (1024**3), 2)
-            },
-            "directories": {
-                "outputs": len(list(outputs_dir.glob("*.pptx"))) if outputs_dir.exists() else 0,
-                "uploads": len(list((project_root / "uploads").iterdir())) if (project_root / "uploads").exists() else 0
-            }
-        }
+        system_info = await asyncio.to_thread(collect_system_info)
         
         return APIResponse(
             success=True,
@@ -1155,26 +1469,28 @@ async def get_system_info():
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return JSONResponse(
+    return Response(
         status_code=404,
-        content=APIResponse(
+        content=API_RESPONSE_ADAPTER.dump_json(APIResponse(
             success=False,
             message="Endpoint not found",
             error="The requested resource was not found"
-        ).dict()
+        )),
+        media_type="application/json"
     )
 
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     logger.error(f"Internal server error: {exc}")
-    return JSONResponse(
+    return Response(
         status_code=500,
-        content=APIResponse(
+        content=API_RESPONSE_ADAPTER.dump_json(APIResponse(
             success=False,
             message="Internal server error",
             error="An unexpected error occurred"
-        ).dict()
+        )),
+        media_type="application/json"
     )
 
 
@@ -1185,9 +1501,7 @@ async def startup_event():
     logger.info("AI-PPT Agent starting up...")
     
     # Create necessary directories
-    directories = ["outputs", "uploads", "logs"]
-    for dir_name in directories:
-        dir_path = project_root / dir_name
+    for dir_path in (OUTPUTS_DIR, UPLOADS_DIR, LOGS_DIR):
         dir_path.mkdir(exist_ok=True)
         logger.info(f"Ensured directory exists: {dir_path}")
     
@@ -1204,7 +1518,15 @@ async def shutdown_event():
     if hasattr(voice_processor, 'stop_continuous_listening'):
         voice_processor.stop_continuous_listening()
     
+    # Release the microphone held open between requests
+    if hasattr(voice_processor, 'close'):
+        voice_processor.close()
+    
     logger.info("AI-PPT Agent shutdown completed")
+    
+    # Drain the background log queue before the worker exits
+    if CONFIG_AVAILABLE:
+        stop_logging()
 
 
 # Main entry point
@@ -1215,7 +1537,10 @@ if __name__ == "__main__":
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=not IS_PRODUCTION,
+        workers=UVICORN_WORKERS if IS_PRODUCTION else 1,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
         log_level="info",
-        access_log=True
+        access_log=not IS_PRODUCTION
     )
\ No newline at end of file
@@ -6,7 +6,12 @@ and .env files using python-dotenv and pydantic for validation.
 """
 
 import os
+import re
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 from pathlib import Path
 from typing import Optional
 from pydantic import BaseModel, field_validator
@@ -14,6 +19,10 @@ from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
 
+# Shape of a plausible Gemini API key, compiled once at import
+GEMINI_API_KEY_PATTERN = re.compile(r'[A-Za-z0-9_\-]{20,}')
+
+
 class AppConfig(BaseSettings):
     """Application configuration with validation."""
     
@@ -24,6 +33,10 @@ class AppConfig(BaseSettings):
     voice_recognition_engine: str = "google"
     voice_language: str = "en-US"
     enable_voice_feedback: bool = True
+    # Google Web Speech API key; speech_recognition's default key is used when empty
+    google_speech_api_key: str = ""
+    # Model directory for the offline 'vosk' engine
+    vosk_model_path: str = "models/vosk-model-small-en-us-0.15"
     
     # Logging Configuration
     log_level: str = "INFO"
@@ -39,6 +52,7 @@ class AppConfig(BaseSettings):
     ai_temperature: float = 0.7
     ai_max_tokens: int = 1000
     ai_content_language: str = "english"
+    ai_concurrency: int = 4
     
     class Config:
         env_file = ".env"
@@ -58,7 +72,7 @@ class AppConfig(BaseSettings):
     @classmethod
     def validate_voice_engine(cls, v):
         """Validate voice recognition engine."""
-        valid_engines = ['google', 'sphinx', 'bing', 'azure']
+        valid_engines = ['google', 'google_cloud', 'vosk', 'sphinx', 'bing', 'azure']
         if v.lower() not in valid_engines:
             raise ValueError(f'Voice engine must be one of: {valid_engines}')
         return v.lower()
@@ -70,6 +84,14 @@ class AppConfig(BaseSettings):
         if not 0.0 <= v <= 2.0:
             raise ValueError('AI temperature must be between 0.0 and 2.0')
         return v
+    
+    @field_validator('ai_concurrency')
+    @classmethod
+    def validate_ai_concurrency(cls, v):
+        """Validate the cap on concurrent AI requests."""
+        if v < 1:
+            raise ValueError('AI concurrency must be at least 1')
+        return v
 
 
 def load_config() -> AppConfig:
@@ -103,6 +125,19 @@ def load_config() -> AppConfig:
         return AppConfig(gemini_api_key="")
 
 
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that enqueues records as they are.
+    
+    The stdlib QueueHandler formats each record on the logging thread before
+    enqueuing it; here the message and any traceback are left for the
+    listener's handlers to format.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 def setup_logging(config: AppConfig) -> logging.Logger:
     """
     Setup logging configuration based on config settings.
@@ -128,8 +163,10 @@ def setup_logging(config: AppConfig) -> logging.Logger:
     logger.setLevel(log_level)
     
     # Remove existing handlers to avoid duplicates
+    stop_logging()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        handler.close()
     
     # Create formatters
     if config.log_format == "colored":
@@ -166,19 +203,47 @@ def setup_logging(config: AppConfig) -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
     
     # File handler
     file_handler = logging.FileHandler(log_file_path)
     file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    
+    # Callers only enqueue records; formatting and I/O happen on the listener thread
+    global _log_listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(RecordQueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
     
     logger.info(f"Logging initialized - Level: {config.log_level}, File: {log_file_path}")
     
     return logger
 
 
+def stop_logging() -> None:
+    """
+    Drain queued log records and stop the background listener thread.
+    
+    The listener's handlers are moved back onto the logger, so anything logged
+    afterwards (e.g. late shutdown messages) is still written, just synchronously.
+    """
+    global _log_listener
+    if _log_listener is None:
+        return
+    
+    _log_listener.stop()
+    logger = logging.getLogger("voice_ppt")
+    for handler in logger.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            logger.removeHandler(handler)
+    for handler in _log_listener.handlers:
+        logger.addHandler(handler)
+    _log_listener = None
+
+
 def validate_gemini_api_key(api_key: str) -> bool:
     """
     Validate Gemini API key format.
@@ -189,27 +254,28 @@ def validate_gemini_api_key(api_key: str) -> bool:
     Returns:
         bool: True if API key appears valid
     """
-    if not api_key:
-        return False
-    
-    # Basic validation - Gemini API keys typically start with certain patterns
-    if len(api_key) < 20:
-        return False
-    
-    # Additional validation could be added here
-    return True
+    # Keys are URL-safe tokens of at least 20 characters
+    return bool(api_key) and GEMINI_API_KEY_PATTERN.fullmatch(api_key) is not None
 
 
 # Global configuration instance
 _config: Optional[AppConfig] = None
 _logger: Optional[logging.Logger] = None
+_log_listener: Optional[logging.handlers.QueueListener] = None
+# Guards first-time creation so concurrent callers never load config or attach handlers twice
+_init_lock = threading.RLock()
+
+# Drain any queued records before the interpreter exits
+atexit.register(stop_logging)
 
 
 def get_config() -> AppConfig:
     """Get the global configuration instance."""
     global _config
     if _config is None:
-        _config = load_config()
+        with _init_lock:
+            if _config is None:
+                _config = load_config()
     return _config
 
 
@@ -217,6 +283,7 @@ def get_logger() -> logging.Logger:
     """Get the global logger instance."""
     global _logger
     if _logger is None:
-        config = get_config()
-        _logger = setup_logging(config)
-    return _logger
\ No newline at end of file
+        with _init_lock:
+            if _logger is None:
+                _logger = setup_logging(get_config())
+    return _logger
@@ -23,6 +23,7 @@ Requirements:
 
 import sys
 import time
+import asyncio
 from pathlib import Path
 from voice_controlled_ppt import VoiceControlledPPT
 from gemini_ai import get_gemini_ai
@@ -61,6 +62,15 @@ def check_setup():
     return True
 
 
+async def generate_demo_content(ai):
+    """Run the independent Gemini requests for the content demo concurrently."""
+    return await asyncio.gather(
+        asyncio.to_thread(ai.generate_slide_content, "Machine Learning Overview", "content"),
+        asyncio.to_thread(ai.generate_presentation_outline, "Artificial Intelligence in Business", 5),
+        asyncio.to_thread(ai.suggest_chart_data, "quarterly sales performance", "column"),
+    )
+
+
 def demo_ai_content_generation():
     """Demonstrate AI content generation capabilities."""
     logger = get_logger()
@@ -68,25 +78,23 @@ def demo_ai_content_generation():
     
     ai = get_gemini_ai()
     
+    # The three requests are independent, so their round trips overlap
+    logger.info("Generating AI slide content, presentation outline and chart data...")
+    content, outline, chart_data = asyncio.run(generate_demo_content(ai))
+    
     # Test slide content generation
-    logger.info("Generating AI slide content...")
-    content = ai.generate_slide_content("Machine Learning Overview", "content")
     if content:
         logger.info(f"Generated Title: {content.title}")
         logger.info(f"Generated Content: {content.content[:100]}...")
         logger.info(f"Suggested Layout: {content.suggested_layout}")
     
     # Test presentation outline
-    logger.info("Generating presentation outline...")
-    outline = ai.generate_presentation_outline("Artificial Intelligence in Business", 5)
     if outline:
         logger.info("Generated Outline:")
         for i, title in enumerate(outline, 1):
             logger.info(f"  {i}. {title}")
     
     # Test chart data generation
-    logger.info("Generating chart data...")
-    chart_data = ai.suggest_chart_data("quarterly sales performance", "column")
     if chart_data:
         logger.info(f"Chart Categories: {chart_data['categories']}")
         for series in chart_data['series']:
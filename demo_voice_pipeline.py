@@ -19,14 +19,23 @@ Requirements:
 """
 
 import sys
-import time
-from voice_controlled_ppt import VoiceControlledPPT
-from voice_to_text import VoiceToText
-from voice_command_parser import VoiceCommandParser
+import asyncio
+import threading
+from gemini_ai import get_gemini_ai
+
+
+# Commands a pipeline stage may run ahead of the next one
+PIPELINE_QUEUE_SIZE = 2
+
+# Marks the end of the command stream between pipeline stages
+PIPELINE_DONE = object()
 
 
 def check_dependencies():
     """Check if all required packages are installed."""
+    # Start connecting to Gemini AI now so it is ready by the time a demo is chosen
+    threading.Thread(target=get_gemini_ai, name="gemini-warmup", daemon=True).start()
+    
     required_packages = [
         ('speech_recognition', 'speechrecognition'),
         ('pyttsx3', 'pyttsx3'),
@@ -53,6 +62,8 @@ def check_dependencies():
 
 def demo_basic_voice_recognition():
     """Demonstrate basic voice recognition capabilities."""
+    from voice_to_text import VoiceToText
+    
     print("\n=== Basic Voice Recognition Demo ===")
     
     voice_system = VoiceToText(enable_voice_feedback=True)
@@ -76,6 +87,8 @@ def demo_basic_voice_recognition():
 
 def demo_command_parsing():
     """Demonstrate voice command parsing."""
+    from voice_command_parser import VoiceCommandParser
+    
     print("\n=== Voice Command Parsing Demo ===")
     
     parser = VoiceCommandParser()
@@ -95,19 +108,24 @@ def demo_command_parsing():
     print("Testing command parsing:")
     for cmd_text in test_commands:
         command = parser.parse_command(cmd_text)
+        # One write per command instead of one per line
         if command:
-            print(f"  ✅ '{cmd_text}'")
-            print(f"     → Action: {command.action}")
-            print(f"     → Parameters: {command.parameters}")
+            lines = [
+                f"  ✅ '{cmd_text}'",
+                f"     → Action: {command.action}",
+                f"     → Parameters: {command.parameters}",
+            ]
         else:
-            print(f"  ❌ '{cmd_text}' → No match found")
-        print()
+            lines = [f"  ❌ '{cmd_text}' → No match found"]
+        print("\n".join(lines) + "\n")
     
     return True
 
 
 def demo_interactive_voice_commands():
     """Demonstrate interactive voice command processing."""
+    from voice_controlled_ppt import VoiceControlledPPT
+    
     print("\n=== Interactive Voice Commands Demo ===")
     print("This demo will process individual voice commands.")
     print("You can test commands like:")
@@ -120,18 +138,7 @@ def demo_interactive_voice_commands():
     
     voice_ppt = VoiceControlledPPT(enable_voice_feedback=True)
     
-    for i in range(5):  # Process up to 5 commands
-        print(f"\nCommand {i+1}/5 - Speak now (10 second timeout):")
-        success = voice_ppt.process_single_command(timeout=10)
-        
-        if not success:
-            print("No command recognized or command failed")
-        
-        # Show current status
-        status = voice_ppt.get_current_status()
-        print(f"Status: Slide {status['current_slide']}/{status['total_slides']}")
-        
-        time.sleep(1)
+    asyncio.run(run_command_pipeline(voice_ppt, command_count=5, timeout=10))
     
     # Save the presentation
     voice_ppt.ppt_generator.save("interactive_demo.pptx")
@@ -140,19 +147,75 @@ def demo_interactive_voice_commands():
     return True
 
 
+async def run_command_pipeline(voice_ppt, command_count: int = 5, timeout: int = 10):
+    """
+    Listen, enhance and apply voice commands as overlapping pipeline stages.
+    
+    While the next command is being recognized, the previous one is enhanced
+    with AI and applied to the presentation. Bounded queues keep the listener
+    at most a couple of commands ahead. With voice feedback on, the next
+    capture waits until the previous command's feedback has been spoken, so
+    the microphone does not pick it up as a command.
+    
+    Args:
+        voice_ppt (VoiceControlledPPT): System to apply the commands to
+        command_count (int): Number of commands to listen for
+        timeout (int): Listening timeout per command in seconds
+    """
+    recognized = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    enhanced = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    voice_to_text = voice_ppt.voice_to_text
+    # Set by apply() once a command's feedback has been spoken
+    feedback_done = asyncio.Event()
+    
+    async def listen():
+        for i in range(command_count):
+            if i and voice_to_text.enable_voice_feedback:
+                await feedback_done.wait()
+                feedback_done.clear()
+            print(f"\nCommand {i+1}/{command_count} - Speak now ({timeout} second timeout):")
+            text = await asyncio.to_thread(voice_to_text.listen_once, timeout=timeout)
+            await recognized.put(text or "")
+        await recognized.put(PIPELINE_DONE)
+    
+    async def enhance():
+        while (text := await recognized.get()) is not PIPELINE_DONE:
+            await enhanced.put(await voice_ppt.aenhance_command_text(text) if text else text)
+        await enhanced.put(PIPELINE_DONE)
+    
+    async def apply():
+        while (text := await enhanced.get()) is not PIPELINE_DONE:
+            success = bool(text) and await asyncio.to_thread(voice_ppt.apply_command_text, text)
+            if not success:
+                print("No command recognized or command failed")
+            
+            # Show current status
+            status = voice_ppt.get_current_status()
+            print(f"Status: Slide {status['current_slide']}/{status['total_slides']}")
+            
+            if voice_to_text.enable_voice_feedback:
+                await asyncio.to_thread(voice_to_text.wait_for_feedback)
+                feedback_done.set()
+    
+    await asyncio.gather(listen(), enhance(), apply())
+
+
 def demo_continuous_voice_control():
     """Demonstrate continuous voice control mode."""
+    from voice_controlled_ppt import VoiceControlledPPT
+    
     print("\n=== Continuous Voice Control Demo ===")
     print("This will start continuous listening mode.")
     print("You can speak multiple commands in sequence.")
     print("Say 'stop listening' to end the demo.")
     print()
     
-    print("Starting in 3 seconds...")
-    time.sleep(3)
-    
     voice_ppt = VoiceControlledPPT(enable_voice_feedback=True)
     
+    # Start as soon as the AI connection check is done instead of after a fixed pause
+    print("Getting ready...")
+    voice_ppt.wait_until_ready(timeout=3.0)
+    
     # This will run until user says "stop listening"
     voice_ppt.start_voice_control()
     
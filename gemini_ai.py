@@ -7,18 +7,115 @@ suggestions based on voice commands and context.
 """
 
 import asyncio
+import hashlib
+import importlib.util
+import re
+import threading
 import time
-from typing import Optional, List, Dict, Any, Tuple
+import weakref
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Callable, AsyncIterator, Iterator
 from dataclasses import dataclass
 from config import get_config, get_logger
+from voice_command_parser import VoiceCommandParser, get_command_parser
 
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Only check that the SDK is installed; it is imported on first use because it is slow to load
+try:
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.generativeai") is not None
 except ImportError:
     GEMINI_AVAILABLE = False
 
 
+# Maximum number of parsed AI results kept in memory per GeminiAI instance
+AI_RESULT_CACHE_SIZE = 512
+
+# Seconds a cached AI result stays fresh before the model is asked again
+AI_RESULT_CACHE_TTL = 3600.0
+
+# Sentence punctuation ignored at the end of cache key inputs ("Add a slide." == "add a slide")
+CACHE_KEY_TRAILING_PUNCTUATION = ".!?"
+
+# Section labels recognised before a colon in content responses, and the section each opens
+SECTION_LABELS = {'title': 'title', 'subtitle': 'content', 'content': 'content'}
+
+# Length of the longest section label, so longer prefixes skip the lowercase copy
+LONGEST_SECTION_LABEL = max(map(len, SECTION_LABELS))
+
+# First characters that mark a bullet point in content responses
+CONTENT_BULLET_CHARS = frozenset('•-*')
+
+# Numbered ("1.") or bulleted ("-", "•") outline line, capturing the title text
+OUTLINE_ITEM_PATTERN = re.compile(r'^[ \t]*(?:\d+\.|[-•])[ \t]*(.*\S)', re.MULTILINE)
+
+# Numbers in a chart series, ignoring brackets, currency signs and units around them
+CHART_NUMBER_PATTERN = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?')
+
+# Closing guidelines shared by every slide content prompt
+CONTENT_PROMPT_GUIDELINES = """
+Guidelines:
+- Keep content concise and presentation-friendly
+- Use bullet points where appropriate
+- Make titles engaging and descriptive
+- Ensure content is professional and informative
+"""
+
+# Requested output format plus guidelines for each slide type, assembled once at import
+CONTENT_PROMPT_INSTRUCTIONS = {
+    "title": """
+Create a compelling title slide.
+Respond only with JSON in this form:
+{"title": "Main presentation title", "content": "Brief subtitle or tagline", "bullet_points": []}
+""" + CONTENT_PROMPT_GUIDELINES,
+    "content": """
+Create engaging content.
+Respond only with JSON in this form:
+{"title": "Slide title", "content": "", "bullet_points": ["3-5 bullet points"]}
+""" + CONTENT_PROMPT_GUIDELINES,
+    "conclusion": """
+Create a conclusion slide.
+Respond only with JSON in this form:
+{"title": "Conclusion title like Key Takeaways or Summary", "content": "", "bullet_points": ["3-4 key points or conclusions"]}
+""" + CONTENT_PROMPT_GUIDELINES,
+}
+
+# Instructions for any slide type without a dedicated entry
+CONTENT_PROMPT_DEFAULT_INSTRUCTIONS = """
+Create appropriate content.
+Respond only with JSON in this form:
+{"title": "Relevant slide title", "content": "Relevant content for the slide type", "bullet_points": []}
+""" + CONTENT_PROMPT_GUIDELINES
+
+# Generation settings that make the model answer with a JSON document
+JSON_GENERATION_CONFIG = {"response_mime_type": "application/json"}
+
+# Complete "title" string in a partially streamed JSON slide, as a JSON string literal
+JSON_TITLE_PATTERN = re.compile(r'"title"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+# Markdown code fence some responses wrap their JSON in
+JSON_CODE_FENCE_PATTERN = re.compile(r'^\s*```(?:json)?|```\s*$')
+
+
+def decode_json_response(response_text: str) -> Any:
+    """
+    Decode a JSON model response, tolerating a surrounding markdown code fence.
+    
+    Args:
+        response_text (str): Raw response text
+        
+    Returns:
+        Any: Decoded JSON value, or None if the text is not valid JSON
+    """
+    try:
+        return json_loads(JSON_CODE_FENCE_PATTERN.sub('', response_text))
+    except ValueError:
+        return None
+
+
 @dataclass
 class AIGeneratedContent:
     """Container for AI-generated presentation content."""
@@ -30,23 +127,204 @@ class AIGeneratedContent:
     metadata: Dict[str, Any] = None
 
 
+class StreamingContentParser:
+    """
+    Incremental parser for slide content responses.
+    
+    Text may be fed in arbitrary chunks. JSON responses are decoded once
+    complete, but their title is picked out as soon as its string has
+    arrived; plain "Title: ..." responses are parsed line by line. Either
+    way the title is known before the rest of the response has been generated.
+    """
+    
+    def __init__(self, slide_type: str = "content"):
+        """
+        Initialize an empty parser.
+        
+        Args:
+            slide_type (str): Type of slide the response describes
+        """
+        self.slide_type = slide_type
+        self.title = ""
+        self.content = ""
+        self.bullet_points: List[str] = []
+        self._current_section = None
+        self._first_line = ""
+        self._pending = ""
+        # Whether the response is JSON, decided by its first non-blank character
+        self._is_json: Optional[bool] = None
+        self._chunks: List[str] = []
+    
+    def feed(self, text: str) -> None:
+        """
+        Consume the next chunk of response text.
+        
+        Args:
+            text (str): Response text, not necessarily ending on a line boundary
+        """
+        if self._is_json is not False:
+            self._chunks.append(text)
+            if self._is_json is None:
+                received = ''.join(self._chunks).lstrip()
+                if not received:
+                    return
+                self._is_json = received[0] in '{`'
+                if not self._is_json:
+                    # Replay what has arrived so far through the line parser
+                    self._chunks = []
+                    text = received
+            
+        if self._is_json:
+            if not self.title:
+                match = JSON_TITLE_PATTERN.search(''.join(self._chunks))
+                if match:
+                    self.title = str(json_loads(match.group(1))).strip()
+            return
+        
+        self._pending += text
+        *lines, self._pending = self._pending.split('\n')
+        for line in lines:
+            self._parse_line(line)
+    
+    def title_ready(self) -> bool:
+        """Check whether a title line has been parsed."""
+        return bool(self.title)
+    
+    def partial(self) -> AIGeneratedContent:
+        """Return the title parsed so far, without any content."""
+        return AIGeneratedContent(
+            title=self.title,
+            content="",
+            bullet_points=[],
+            suggested_layout=0 if self.slide_type == "title" else 1,
+            confidence=0.8,
+            metadata={"slide_type": self.slide_type, "partial": True}
+        )
+    
+    def finalize(self) -> AIGeneratedContent:
+        """
+        Parse any trailing text and build the complete content.
+        
+        Returns:
+            AIGeneratedContent: Structured slide content
+        """
+        if self._is_json:
+            # Join the buffered chunks once; the line-parser fallback reuses the text
+            text = ''.join(self._chunks)
+            self._chunks = []
+            data = decode_json_response(text)
+            if isinstance(data, dict):
+                self.title = str(data.get("title") or "").strip()
+                self.content = str(data.get("content") or "").strip()
+                bullet_points = data.get("bullet_points")
+                if isinstance(bullet_points, list):
+                    self.bullet_points = [point for point in (str(item).strip() for item in bullet_points) if point]
+                return self._build_content(self.title)
+            
+            # Not valid JSON after all; scan the text line by line instead
+            self._is_json = False
+            self.title = ""
+            self.feed(text)
+        
+        if self._pending:
+            self._parse_line(self._pending)
+            self._pending = ""
+        
+        # If no title found, use first line or generate from topic
+        return self._build_content(self.title or self._first_line)
+    
+    def _build_content(self, title: str) -> AIGeneratedContent:
+        """Assemble the parsed fields into AIGeneratedContent."""
+        content = self.content
+        
+        # Combine bullet points into content if content is empty
+        if not content and self.bullet_points:
+            content = '\n'.join(f"• {point}" for point in self.bullet_points)
+        
+        # Determine suggested layout based on content
+        suggested_layout = 1  # Default to content layout
+        if self.slide_type == "title":
+            suggested_layout = 0
+        elif len(self.bullet_points) > 5:
+            suggested_layout = 3  # Two content layout
+        
+        return AIGeneratedContent(
+            title=title,
+            content=content,
+            bullet_points=self.bullet_points,
+            suggested_layout=suggested_layout,
+            confidence=0.8,
+            metadata={"slide_type": self.slide_type}
+        )
+    
+    def _parse_line(self, line: str) -> None:
+        """Parse one complete response line."""
+        line = line.strip()
+        if not line:
+            return
+        if not self._first_line:
+            self._first_line = line
+            
+        head, sep, rest = line.partition(':')
+        label = head.lower() if sep and len(head) <= LONGEST_SECTION_LABEL else None
+        section = SECTION_LABELS.get(label)
+        
+        if label == 'title':
+            self.title = rest.strip()
+        elif label == 'subtitle':
+            if not self.content:
+                self.content = rest.strip()
+        elif label == 'content':
+            self.content = rest.strip()
+        elif line[:1] in CONTENT_BULLET_CHARS:
+            self.bullet_points.append(line[1:].strip())
+        elif self._current_section == 'content':
+            if self.content:
+                self.content += '\n' + line
+            else:
+                self.content = line
+        
+        if section is not None:
+            self._current_section = section
+
+
 class GeminiAI:
     """
     Gemini AI integration for intelligent presentation content generation.
     """
     
-    def __init__(self):
-        """Initialize Gemini AI with configuration from environment."""
+    def __init__(self, command_parser: Optional[VoiceCommandParser] = None):
+        """
+        Initialize Gemini AI with configuration from environment.
+        
+        Args:
+            command_parser (VoiceCommandParser, optional): Parser used to skip
+                enhancing commands that are already recognized
+        """
         self.config = get_config()
         self.logger = get_logger()
+        # Read on every content prompt, so resolve the setting once
+        self._language = self.config.ai_content_language
+        self.command_parser = command_parser if command_parser is not None else get_command_parser()
         self.model = None
         self.is_initialized = False
+        # Set once the background test request has finished, successfully or not
+        self._probe_event = threading.Event()
+        
+        # Parsed results keyed on (method, input digest), oldest first
+        self._structured_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # One request semaphore per event loop, since asyncio primitives are loop-bound
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
         
         if not GEMINI_AVAILABLE:
             self.logger.error("google-generativeai package not installed. Install with: pip install google-generativeai")
+            self._probe_event.set()
             return
         
-        self._initialize_gemini()
+        if not self._initialize_gemini():
+            # No test request will run, so nothing is left to wait for
+            self._probe_event.set()
     
     def _initialize_gemini(self) -> bool:
         """
@@ -62,30 +340,208 @@ class GeminiAI:
                 self.logger.error("Gemini API key not configured. Please set GEMINI_API_KEY in .env file")
                 return False
             
+            import google.generativeai as genai
+            
             # Configure Gemini
             genai.configure(api_key=api_key)
             
-            # Initialize the model
+            # Initialize the model. One instance is shared by every thread: all
+            # GenerativeModel objects go through the SDK's default client, whose
+            # HTTP/2 channel already multiplexes concurrent requests over one
+            # connection, so extra model handles would not add connection reuse
             self.model = genai.GenerativeModel('gemini-1.5-flash')
             
-            # Test the connection
+            # Assume the key works and confirm with a test request in the background,
+            # so construction does not wait on a network round-trip
+            self.is_initialized = True
+            threading.Thread(target=self._background_probe, name="gemini-probe", daemon=True).start()
+            return True
+                
+        except Exception as e:
+            self.logger.error(f"Failed to initialize Gemini AI: {str(e)}")
+            return False
+    
+    def _background_probe(self) -> None:
+        """Send a test request and mark the model unavailable if it fails."""
+        try:
             test_response = self.model.generate_content("Hello")
             if test_response:
                 self.logger.info("Gemini AI initialized successfully")
-                self.is_initialized = True
-                return True
             else:
+                self.is_initialized = False
                 self.logger.error("Failed to get response from Gemini AI")
-                return False
-                
         except Exception as e:
+            self.is_initialized = False
             self.logger.error(f"Failed to initialize Gemini AI: {str(e)}")
-            return False
+        finally:
+            self._probe_event.set()
     
-    def is_available(self) -> bool:
-        """Check if Gemini AI is available and initialized."""
+    def is_available(self, strict: bool = False) -> bool:
+        """
+        Check if Gemini AI is available and initialized.
+        
+        Args:
+            strict (bool): Only report available once the test request has succeeded
+            
+        Returns:
+            bool: True if the model can be used
+        """
+        if strict and not self._probe_event.is_set():
+            return False
         return GEMINI_AVAILABLE and self.is_initialized
     
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the background test request finishes.
+        
+        Args:
+            timeout (float): Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            bool: True if the model is confirmed available
+        """
+        self._probe_event.wait(timeout)
+        return self.is_available(strict=True)
+    
+    def cache_clear(self) -> None:
+        """Drop every cached AI result."""
+        with self._cache_lock:
+            self._structured_cache.clear()
+    
+    def _cache_key(self, method: str, *parts: str) -> Tuple[str, bytes]:
+        """
+        Build a compact cache key from the calling method and its inputs.
+        
+        The inputs are fed to blake2b one at a time, so a large slide context
+        is never copied into a combined string or a full prompt just to be hashed.
+        Each input is normalized first: case, runs of whitespace and trailing
+        sentence punctuation do not change the answer, so near-duplicate
+        requests (a repeated utterance, a re-typed topic) share one entry.
+        
+        Args:
+            method (str): Cache namespace for the calling method
+            *parts (str): Inputs that determine the prompt
+            
+        Returns:
+            Tuple[str, bytes]: Method name and 16-byte digest of the inputs
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            part = " ".join(part.casefold().split()).rstrip(CACHE_KEY_TRAILING_PUNCTUATION)
+            digest.update(part.encode())
+            # Separator so ("ab", "c") and ("a", "bc") hash differently
+            digest.update(b"\x00")
+        return method, digest.digest()
+    
+    def _cache_get(self, key: Tuple[str, bytes]) -> Any:
+        """
+        Look up a cached result, evicting it if it has gone stale.
+        
+        Args:
+            key (Tuple[str, bytes]): Key from _cache_key
+            
+        Returns:
+            Any: Cached result or None if missing or expired
+        """
+        with self._cache_lock:
+            entry = self._structured_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > AI_RESULT_CACHE_TTL:
+                del self._structured_cache[key]
+                return None
+            self._structured_cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, key: Tuple[str, bytes], value: Any) -> None:
+        """Store a result, evicting the least recently used entries beyond the limit."""
+        with self._cache_lock:
+            self._structured_cache[key] = (time.monotonic(), value)
+            self._structured_cache.move_to_end(key)
+            while len(self._structured_cache) > AI_RESULT_CACHE_SIZE:
+                self._structured_cache.popitem(last=False)
+    
+    def _generate(self, prompt: str, json_output: bool = False) -> str:
+        """
+        Send a prompt to the model.
+        
+        Args:
+            prompt (str): Prompt text
+            json_output (bool): Ask the model to respond with JSON
+            
+        Returns:
+            str: Response text, empty if the model returned nothing
+        """
+        generation_config = JSON_GENERATION_CONFIG if json_output else None
+        response = self.model.generate_content(prompt, generation_config=generation_config)
+        return response.text if response else ""
+    
+    async def _agenerate(self, prompt: str, json_output: bool = False) -> str:
+        """
+        Send a prompt to the model without blocking the event loop.
+        
+        At most config.ai_concurrency requests are in flight per event loop.
+        
+        Args:
+            prompt (str): Prompt text
+            json_output (bool): Ask the model to respond with JSON
+            
+        Returns:
+            str: Response text, empty if the model returned nothing
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.config.ai_concurrency)
+        
+        async with semaphore:
+            generation_config = JSON_GENERATION_CONFIG if json_output else None
+            response = await self.model.generate_content_async(prompt, generation_config=generation_config)
+        return response.text if response else ""
+    
+    def _complete(self, cache_key: Tuple[str, bytes], build_prompt: Callable[[], str],
+                  parse: Callable[[str], Any], json_output: bool = False) -> Any:
+        """
+        Run a prompt through the cache and the model, parsing the response.
+        
+        Args:
+            cache_key (Tuple[str, bytes]): Key from _cache_key
+            build_prompt (Callable[[], str]): Builds the prompt, only called on a cache miss
+            parse (Callable[[str], Any]): Turns response text into a result
+            json_output (bool): Ask the model to respond with JSON
+            
+        Returns:
+            Any: Parsed result or None if the model returned nothing usable
+        """
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        prompt = build_prompt()
+        # Lazy %-formatting: the prompt is only sliced if debug logging is on
+        self.logger.debug("Sending %s prompt: %.100s...", cache_key[0], prompt)
+        response_text = self._generate(prompt, json_output)
+        result = parse(response_text) if response_text else None
+        if result is not None:
+            self._cache_put(cache_key, result)
+        return result
+    
+    async def _acomplete(self, cache_key: Tuple[str, bytes], build_prompt: Callable[[], str],
+                         parse: Callable[[str], Any], json_output: bool = False) -> Any:
+        """Async counterpart of _complete, sharing the same cache."""
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        prompt = build_prompt()
+        self.logger.debug("Sending %s prompt: %.100s...", cache_key[0], prompt)
+        response_text = await self._agenerate(prompt, json_output)
+        result = parse(response_text) if response_text else None
+        if result is not None:
+            self._cache_put(cache_key, result)
+        return result
+    
     def generate_slide_content(self, topic: str, slide_type: str = "content", 
                              context: str = "") -> Optional[AIGeneratedContent]:
         """
@@ -104,13 +560,40 @@ class GeminiAI:
             return None
         
         try:
-            prompt = self._build_content_prompt(topic, slide_type, context)
-            self.logger.debug(f"Generating content with prompt: {prompt[:100]}...")
+            content = self._complete(
+                self._cache_key("slide_content", topic, slide_type, context, self._language),
+                lambda: self._build_content_prompt(topic, slide_type, context),
+                lambda text: self._parse_content_response(text, slide_type),
+                json_output=True
+            )
             
-            response = self.model.generate_content(prompt)
+            if content:
+                self.logger.info(f"Generated content for topic: {topic}")
+                return content
+            else:
+                self.logger.warning("Empty response from Gemini AI")
+                return None
+                
+        except Exception as e:
+            self.logger.error(f"Error generating slide content: {str(e)}")
+            return None
+    
+    async def agenerate_slide_content(self, topic: str, slide_type: str = "content",
+                                      context: str = "") -> Optional[AIGeneratedContent]:
+        """Async variant of generate_slide_content."""
+        if not self.is_available():
+            self.logger.warning("Gemini AI not available for content generation")
+            return None
+        
+        try:
+            content = await self._acomplete(
+                self._cache_key("slide_content", topic, slide_type, context, self._language),
+                lambda: self._build_content_prompt(topic, slide_type, context),
+                lambda text: self._parse_content_response(text, slide_type),
+                json_output=True
+            )
             
-            if response and response.text:
-                content = self._parse_content_response(response.text, slide_type)
+            if content:
                 self.logger.info(f"Generated content for topic: {topic}")
                 return content
             else:
@@ -121,6 +604,93 @@ class GeminiAI:
             self.logger.error(f"Error generating slide content: {str(e)}")
             return None
     
+    async def generate_slide_content_batch(self, topics: List[str], slide_type: str = "content",
+                                           context: str = "") -> List[Optional[AIGeneratedContent]]:
+        """
+        Generate content for several slides concurrently.
+        
+        Args:
+            topics (List[str]): Slide topics, one request each
+            slide_type (str): Type of slide for every topic
+            context (str): Additional context shared by all slides
+            
+        Returns:
+            List[Optional[AIGeneratedContent]]: Results in the same order as topics
+        """
+        return list(await asyncio.gather(
+            *(self.agenerate_slide_content(topic, slide_type, context) for topic in topics)
+        ))
+    
+    async def iter_slide_content(self, topics: List[str], slide_type: str = "content",
+                                 context: str = "") -> AsyncIterator[Tuple[int, Optional[AIGeneratedContent]]]:
+        """
+        Generate content for several slides concurrently, yielding each as it finishes.
+        
+        Args:
+            topics (List[str]): Slide topics, one request each
+            slide_type (str): Type of slide for every topic
+            context (str): Additional context shared by all slides
+            
+        Yields:
+            Tuple[int, Optional[AIGeneratedContent]]: Index into topics and its content
+        """
+        async def indexed(index: int, topic: str):
+            return index, await self.agenerate_slide_content(topic, slide_type, context)
+        
+        for next_done in asyncio.as_completed([indexed(i, topic) for i, topic in enumerate(topics)]):
+            yield await next_done
+    
+    def generate_slide_content_stream(self, topic: str, slide_type: str = "content",
+                                      context: str = "") -> Iterator[AIGeneratedContent]:
+        """
+        Generate slide content, yielding the title as soon as it has streamed in.
+        
+        A title-only partial result (metadata["partial"] is True) is yielded first
+        when the response contains a title line, so callers can create the slide
+        while the rest is still being generated. The last item yielded is always
+        the complete content; nothing is yielded if generation fails.
+        
+        Args:
+            topic (str): Main topic for the slide
+            slide_type (str): Type of slide ("title", "content", "conclusion", "intro")
+            context (str): Additional context or previous slides content
+            
+        Yields:
+            AIGeneratedContent: Partial, then complete slide content
+        """
+        if not self.is_available():
+            self.logger.warning("Gemini AI not available for content generation")
+            return
+        
+        try:
+            cache_key = self._cache_key("slide_content", topic, slide_type, context, self._language)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+            
+            prompt = self._build_content_prompt(topic, slide_type, context)
+            
+            parser = StreamingContentParser(slide_type)
+            title_sent = False
+            for chunk in self.model.generate_content(prompt, stream=True,
+                                                     generation_config=JSON_GENERATION_CONFIG):
+                parser.feed(chunk.text)
+                if not title_sent and parser.title_ready():
+                    title_sent = True
+                    yield parser.partial()
+            
+            content = parser.finalize()
+            if content.title or content.content:
+                self._cache_put(cache_key, content)
+                self.logger.info(f"Generated content for topic: {topic}")
+                yield content
+            else:
+                self.logger.warning("Empty response from Gemini AI")
+                
+        except Exception as e:
+            self.logger.error(f"Error generating slide content: {str(e)}")
+    
     def generate_presentation_outline(self, topic: str, slide_count: int = 5) -> Optional[List[str]]:
         """
         Generate a presentation outline with slide titles.
@@ -137,27 +707,39 @@ class GeminiAI:
             return None
         
         try:
-            prompt = f"""Create a presentation outline for the topic: "{topic}"
-
-Generate exactly {slide_count} slide titles that would make a comprehensive presentation.
-Format your response as a numbered list:
-1. [First slide title]
-2. [Second slide title]
-...
-
-Guidelines:
-- Start with an introduction/title slide
-- Include 2-3 main content slides
-- End with a conclusion if appropriate
-- Keep titles concise and engaging
-- Focus on key aspects of the topic"""
-
-            self.logger.debug(f"Generating outline for: {topic}")
+            self.logger.debug("Generating outline for: %s", topic)
+            
+            outline = self._complete(
+                self._cache_key("outline", topic, str(slide_count)),
+                lambda: self._build_outline_prompt(topic, slide_count),
+                self._parse_outline_response, json_output=True
+            )
             
-            response = self.model.generate_content(prompt)
+            if outline:
+                self.logger.info(f"Generated outline with {len(outline)} slides for: {topic}")
+                return outline
+            else:
+                self.logger.warning("Empty response from Gemini AI for outline")
+                return None
+                
+        except Exception as e:
+            self.logger.error(f"Error generating presentation outline: {str(e)}")
+            return None
+    
+    async def agenerate_presentation_outline(self, topic: str, slide_count: int = 5) -> Optional[List[str]]:
+        """Async variant of generate_presentation_outline."""
+        if not self.is_available():
+            self.logger.warning("Gemini AI not available for outline generation")
+            return None
+        
+        try:
+            outline = await self._acomplete(
+                self._cache_key("outline", topic, str(slide_count)),
+                lambda: self._build_outline_prompt(topic, slide_count),
+                self._parse_outline_response, json_output=True
+            )
             
-            if response and response.text:
-                outline = self._parse_outline_response(response.text)
+            if outline:
                 self.logger.info(f"Generated outline with {len(outline)} slides for: {topic}")
                 return outline
             else:
@@ -168,6 +750,24 @@ Guidelines:
             self.logger.error(f"Error generating presentation outline: {str(e)}")
             return None
     
+    async def agenerate_presentation(self, topic: str, slide_count: int = 5) -> Optional[List[AIGeneratedContent]]:
+        """
+        Generate an outline, then the content of every slide in it concurrently.
+        
+        Args:
+            topic (str): Main presentation topic
+            slide_count (int): Number of slides to generate
+            
+        Returns:
+            List[AIGeneratedContent]: Content for each outlined slide that succeeded, or None
+        """
+        outline = await self.agenerate_presentation_outline(topic, slide_count)
+        if not outline:
+            return None
+        
+        contents = await self.generate_slide_content_batch(outline, "content", f"Presentation topic: {topic}")
+        return [content for content in contents if content]
+    
     def enhance_voice_command(self, voice_text: str) -> Optional[str]:
         """
         Enhance and clarify voice commands using AI.
@@ -181,25 +781,45 @@ Guidelines:
         if not self.is_available():
             return voice_text  # Return original if AI not available
         
+        # A command the parser already recognizes needs no round-trip to the model
+        if self.command_parser.match_pattern(voice_text):
+            return voice_text
+        
         try:
-            prompt = f"""Analyze this voice command for presentation control and enhance it if needed:
-Voice input: "{voice_text}"
-
-If this appears to be a presentation command, enhance it for clarity and completeness.
-If it's unclear, suggest the most likely intended command.
-If it's not a presentation command, return the original text.
-
-Examples:
-"add slide about sales" → "create new slide with title Sales Report"
-"make chart" → "add column chart"
-"change color blue" → "change background to blue"
-
-Enhanced command:"""
-
-            response = self.model.generate_content(prompt)
+            enhanced = self._complete(
+                self._cache_key("voice_command", voice_text),
+                lambda: self._build_voice_command_prompt(voice_text),
+                str.strip
+            )
             
-            if response and response.text:
-                enhanced = response.text.strip()
+            if enhanced:
+                if enhanced != voice_text:
+                    self.logger.info(f"Enhanced voice command: '{voice_text}' → '{enhanced}'")
+                return enhanced
+            else:
+                return voice_text
+                
+        except Exception as e:
+            self.logger.error(f"Error enhancing voice command: {str(e)}")
+            return voice_text
+    
+    async def aenhance_voice_command(self, voice_text: str) -> Optional[str]:
+        """Async variant of enhance_voice_command."""
+        if not self.is_available():
+            return voice_text  # Return original if AI not available
+        
+        # A command the parser already recognizes needs no round-trip to the model
+        if self.command_parser.match_pattern(voice_text):
+            return voice_text
+        
+        try:
+            enhanced = await self._acomplete(
+                self._cache_key("voice_command", voice_text),
+                lambda: self._build_voice_command_prompt(voice_text),
+                str.strip
+            )
+            
+            if enhanced:
                 if enhanced != voice_text:
                     self.logger.info(f"Enhanced voice command: '{voice_text}' → '{enhanced}'")
                 return enhanced
@@ -226,28 +846,41 @@ Enhanced command:"""
             return None
         
         try:
-            prompt = f"""Generate realistic sample data for a {chart_type} chart about: "{topic}"
-
-Create data that would be appropriate for this topic with:
-- 4-6 categories/time periods
-- 2-3 data series with realistic values
-- Data that tells a meaningful story
-
-Format the response as:
-Categories: [list of categories]
-Series 1 Name: [name]
-Series 1 Values: [list of values]
-Series 2 Name: [name] 
-Series 2 Values: [list of values]"""
-
-            response = self.model.generate_content(prompt)
+            chart_data = self._complete(
+                self._cache_key("chart_data", topic, chart_type),
+                lambda: self._build_chart_prompt(topic, chart_type),
+                self._parse_chart_data_response, json_output=True
+            )
+            
+            if chart_data:
+                self.logger.info(f"Generated chart data for: {topic}")
+                return chart_data
+            else:
+                self.logger.warning("No usable chart data from Gemini AI")
+                return None
+                
+        except Exception as e:
+            self.logger.error(f"Error generating chart data: {str(e)}")
+            return None
+    
+    async def asuggest_chart_data(self, topic: str, chart_type: str = "column") -> Optional[Dict[str, Any]]:
+        """Async variant of suggest_chart_data."""
+        if not self.is_available():
+            self.logger.warning("Gemini AI not available for chart data generation")
+            return None
+        
+        try:
+            chart_data = await self._acomplete(
+                self._cache_key("chart_data", topic, chart_type),
+                lambda: self._build_chart_prompt(topic, chart_type),
+                self._parse_chart_data_response, json_output=True
+            )
             
-            if response and response.text:
-                chart_data = self._parse_chart_data_response(response.text)
+            if chart_data:
                 self.logger.info(f"Generated chart data for: {topic}")
                 return chart_data
             else:
-                self.logger.warning("Empty response from Gemini AI for chart data")
+                self.logger.warning("No usable chart data from Gemini AI")
                 return None
                 
         except Exception as e:
@@ -256,166 +889,133 @@ Series 2 Values: [list of values]"""
     
     def _build_content_prompt(self, topic: str, slide_type: str, context: str) -> str:
         """Build prompt for content generation."""
-        base_prompt = f"""Generate content for a presentation slide about: "{topic}"
+        context_line = f"Previous context: {context}\n" if context else ""
+        instructions = CONTENT_PROMPT_INSTRUCTIONS.get(slide_type, CONTENT_PROMPT_DEFAULT_INSTRUCTIONS)
+        return f"""Generate content for a presentation slide about: "{topic}"
 
 Slide type: {slide_type}
-Language: {self.config.ai_content_language}
-"""
-        
-        if context:
-            base_prompt += f"Previous context: {context}\n"
-        
-        if slide_type == "title":
-            base_prompt += """
-Create a compelling title slide with:
-Title: [Main presentation title]
-Subtitle: [Brief subtitle or tagline]
-"""
-        elif slide_type == "content":
-            base_prompt += """
-Create engaging content with:
-Title: [Slide title]
-Content: [3-5 bullet points or main content]
-"""
-        elif slide_type == "conclusion":
-            base_prompt += """
-Create a conclusion slide with:
-Title: [Conclusion title like "Key Takeaways" or "Summary"]
-Content: [3-4 key points or conclusions]
-"""
-        else:
-            base_prompt += """
-Create appropriate content with:
-Title: [Relevant slide title]
-Content: [Relevant content for the slide type]
-"""
-        
-        base_prompt += """
+Language: {self._language}
+{context_line}{instructions}"""
+    
+    def _build_outline_prompt(self, topic: str, slide_count: int) -> str:
+        """Build prompt for outline generation."""
+        return f"""Create a presentation outline for the topic: "{topic}"
+
+Generate exactly {slide_count} slide titles that would make a comprehensive presentation.
+Respond only with JSON in this form:
+{{"titles": ["First slide title", "Second slide title", ...]}}
+
 Guidelines:
-- Keep content concise and presentation-friendly
-- Use bullet points where appropriate
-- Make titles engaging and descriptive
-- Ensure content is professional and informative
-"""
-        
-        return base_prompt
+- Start with an introduction/title slide
+- Include 2-3 main content slides
+- End with a conclusion if appropriate
+- Keep titles concise and engaging
+- Focus on key aspects of the topic"""
+    
+    def _build_voice_command_prompt(self, voice_text: str) -> str:
+        """Build prompt for voice command enhancement."""
+        return f"""Analyze this voice command for presentation control and enhance it if needed:
+Voice input: "{voice_text}"
+
+If this appears to be a presentation command, enhance it for clarity and completeness.
+If it's unclear, suggest the most likely intended command.
+If it's not a presentation command, return the original text.
+
+Examples:
+"add slide about sales" → "create new slide with title Sales Report"
+"make chart" → "add column chart"
+"change color blue" → "change background to blue"
+
+Enhanced command:"""
+    
+    def _build_chart_prompt(self, topic: str, chart_type: str) -> str:
+        """Build prompt for chart data generation."""
+        return f"""Generate realistic sample data for a {chart_type} chart about: "{topic}"
+
+Create data that would be appropriate for this topic with:
+- 4-6 categories/time periods
+- 2-3 data series with realistic values
+- Data that tells a meaningful story
+
+Respond only with JSON in this form, with plain numbers as values:
+{{"categories": ["Category 1", "Category 2", ...], "series": [{{"name": "Series name", "values": [10, 20, ...]}}, ...]}}"""
     
     def _parse_content_response(self, response_text: str, slide_type: str) -> AIGeneratedContent:
         """Parse AI response into structured content."""
-        lines = response_text.strip().split('\n')
-        
-        title = ""
-        content = ""
-        bullet_points = []
-        
-        current_section = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.lower().startswith('title:'):
-                title = line[6:].strip()
-                current_section = 'title'
-            elif line.lower().startswith('subtitle:'):
-                if not content:
-                    content = line[9:].strip()
-                current_section = 'content'
-            elif line.lower().startswith('content:'):
-                content = line[8:].strip()
-                current_section = 'content'
-            elif line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                bullet_point = line[1:].strip()
-                bullet_points.append(bullet_point)
-            elif current_section == 'content' and not line.lower().startswith(('title:', 'content:')):
-                if content:
-                    content += '\n' + line
-                else:
-                    content = line
-        
-        # If no title found, use first line or generate from topic
-        if not title and lines:
-            title = lines[0].strip()
-        
-        # Combine bullet points into content if content is empty
-        if not content and bullet_points:
-            content = '\n'.join(f"• {point}" for point in bullet_points)
-        
-        # Determine suggested layout based on content
-        suggested_layout = 1  # Default to content layout
-        if slide_type == "title":
-            suggested_layout = 0
-        elif len(bullet_points) > 5:
-            suggested_layout = 3  # Two content layout
-        
-        return AIGeneratedContent(
-            title=title,
-            content=content,
-            bullet_points=bullet_points,
-            suggested_layout=suggested_layout,
-            confidence=0.8,
-            metadata={"slide_type": slide_type}
-        )
+        parser = StreamingContentParser(slide_type)
+        parser.feed(response_text)
+        return parser.finalize()
     
     def _parse_outline_response(self, response_text: str) -> List[str]:
         """Parse outline response into list of slide titles."""
-        lines = response_text.strip().split('\n')
-        titles = []
+        data = decode_json_response(response_text)
+        if isinstance(data, dict) and isinstance(data.get("titles"), list):
+            return [title for title in (str(item).strip() for item in data["titles"]) if title]
         
-        for line in lines:
-            line = line.strip()
-            if not line:
+        # Numbered list items and bullet points, with any [placeholder] brackets removed
+        titles = (title.strip('[]').strip() for title in OUTLINE_ITEM_PATTERN.findall(response_text))
+        return [title for title in titles if title]
+    
+    def _chart_data_from_json(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Validate decoded JSON chart data, keeping only series with numeric values."""
+        categories = data.get("categories")
+        raw_series = data.get("series")
+        if not isinstance(categories, list) or not isinstance(raw_series, list):
+            return None
+        
+        series = []
+        for item in raw_series:
+            if not isinstance(item, dict) or not isinstance(item.get("values"), list):
                 continue
-                
-            # Look for numbered list items
-            if line[0].isdigit() and '.' in line:
-                # Extract title after number
-                parts = line.split('.', 1)
-                if len(parts) > 1:
-                    title = parts[1].strip()
-                    titles.append(title)
-            elif line.startswith('-') or line.startswith('•'):
-                # Handle bullet points
-                title = line[1:].strip()
-                titles.append(title)
-        
-        return titles
+            try:
+                values = [float(value) for value in item["values"]]
+            except (TypeError, ValueError):
+                continue
+            if values:
+                series.append({'name': str(item.get("name") or "").strip(), 'values': values})
+        
+        if not categories or not series:
+            return None
+        return {
+            'categories': [str(category).strip() for category in categories],
+            'series': series
+        }
     
     def _parse_chart_data_response(self, response_text: str) -> Optional[Dict[str, Any]]:
         """Parse chart data response into structured format."""
         try:
-            lines = response_text.strip().split('\n')
+            data = decode_json_response(response_text)
+            if isinstance(data, dict):
+                chart_data = self._chart_data_from_json(data)
+                if chart_data:
+                    return chart_data
             
+            # Fall back to the line-oriented "Categories: ..." format
             categories = []
             series = []
             
             current_series = None
             
-            for line in lines:
-                line = line.strip()
-                if not line:
+            for line in response_text.splitlines():
+                head, sep, rest = line.strip().partition(':')
+                if not sep:
                     continue
+                label = head.lower()
                     
-                if line.lower().startswith('categories:'):
+                if label == 'categories':
                     # Extract categories
-                    cat_text = line[11:].strip()
-                    categories = [cat.strip() for cat in cat_text.replace('[', '').replace(']', '').split(',')]
-                elif line.lower().startswith('series') and 'name:' in line.lower():
+                    categories = [cat.strip() for cat in rest.replace('[', '').replace(']', '').split(',')]
+                elif label.startswith('series') and label.endswith('name'):
                     # Start new series
-                    name = line.split(':', 1)[1].strip()
-                    current_series = {'name': name, 'values': []}
-                elif line.lower().startswith('series') and 'values:' in line.lower():
+                    current_series = {'name': rest.strip(), 'values': []}
+                elif label.startswith('series') and label.endswith('values'):
                     # Add values to current series
                     if current_series:
-                        values_text = line.split(':', 1)[1].strip()
-                        try:
-                            values = [float(val.strip()) for val in values_text.replace('[', '').replace(']', '').split(',')]
+                        values = [float(value) for value in CHART_NUMBER_PATTERN.findall(rest)]
+                        if values:
                             current_series['values'] = values
                             series.append(current_series)
                             current_series = None
-                        except ValueError:
-                            continue
             
             if categories and series:
                 return {
@@ -433,11 +1033,15 @@ Guidelines:
 
 # Global AI instance
 _gemini_ai: Optional[GeminiAI] = None
+# Guards first-time creation so a warm-up thread and the main thread share one instance
+_gemini_ai_lock = threading.Lock()
 
 
 def get_gemini_ai() -> GeminiAI:
     """Get the global Gemini AI instance."""
     global _gemini_ai
     if _gemini_ai is None:
-        _gemini_ai = GeminiAI()
+        with _gemini_ai_lock:
+            if _gemini_ai is None:
+                _gemini_ai = GeminiAI()
     return _gemini_ai
\ No newline at end of file
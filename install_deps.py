@@ -6,16 +6,33 @@ This script will check for and install missing dependencies.
 
 import subprocess
 import sys
-import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
-def install_package(package):
-    """Install a package using pip."""
+# Module availability results, so each module is only looked up once
+_module_availability = {}
+
+def is_module_available(module):
+    """Check whether a module is importable without executing it."""
+    available = _module_availability.get(module)
+    if available is None:
+        try:
+            # find_spec only locates the module, so heavy packages are not imported
+            available = module in sys.modules or importlib.util.find_spec(module) is not None
+        except (ImportError, ValueError):
+            available = False
+        _module_availability[module] = available
+    return available
+
+def install_packages(packages):
+    """Install packages with a single pip run, so dependencies are resolved once."""
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        print(f"✅ Installed {package}")
+        subprocess.check_call([sys.executable, "-m", "pip", "install",
+                               "--disable-pip-version-check", "--no-input", *packages])
+        print(f"✅ Installed {', '.join(packages)}")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install {package}: {e}")
+        print(f"❌ Failed to install {', '.join(packages)}: {e}")
         return False
 
 def check_and_install_dependencies():
@@ -33,32 +50,37 @@ def check_and_install_dependencies():
         ("psutil", "psutil"),
     ]
     
+    # Look every module up in parallel; find_spec is mostly filesystem stats,
+    # and is_module_available remembers the answers for the loops below
+    all_modules = [module for module, _ in api_dependencies + optional_dependencies]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(is_module_available, all_modules))
+    
     print("🔍 Checking API dependencies...")
     
     missing_core = []
     for module, package in api_dependencies:
-        try:
-            importlib.import_module(module)
+        if is_module_available(module):
             print(f"✅ {module} - available")
-        except ImportError:
+        else:
             print(f"❌ {module} - missing")
             missing_core.append(package)
     
-    if missing_core:
-        print(f"\n📦 Installing {len(missing_core)} missing core dependencies...")
-        for package in missing_core:
-            install_package(package)
-    
     print(f"\n🔍 Checking optional dependencies...")
+    missing_optional = []
     for module, package in optional_dependencies:
-        try:
-            importlib.import_module(module)
+        if is_module_available(module):
             print(f"✅ {module} - available")
-        except ImportError:
+        else:
             print(f"⚠️  {module} - missing (optional)")
             choice = input(f"Install {package}? (y/N): ").lower().strip()
             if choice == 'y':
-                install_package(package)
+                missing_optional.append(package)
+    
+    to_install = missing_core + missing_optional
+    if to_install:
+        print(f"\n📦 Installing {len(missing_core)} core and {len(missing_optional)} optional dependencies...")
+        install_packages(to_install)
     
     print(f"\n✅ Dependency check completed!")
     print(f"🚀 You can now run: python app.py")
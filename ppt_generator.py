@@ -10,23 +10,54 @@ Install with: pip install python-pptx
 
 from pptx import Presentation
 from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
-from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
+from pptx.opc.packuri import PackURI
+import hashlib
+import io
 import os
-from typing import Optional, Tuple, List, Union
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from stat import S_ISREG
+from typing import Optional, Tuple, List, Union, Dict, Iterator, Iterable
 from config import get_config, get_logger
 
 
+# Image files (and distinct image contents) kept in memory for reuse by read_image
+IMAGE_CACHE_SIZE = 16
+
+# Default chart and image placement in EMUs; Length values are immutable ints, so sharing is safe
+DEFAULT_CHART_POSITION = (Inches(1), Inches(2))
+DEFAULT_CHART_SIZE = (Inches(8), Inches(5))
+DEFAULT_IMAGE_POSITION = (Inches(1), Inches(1))
+
+# Chart type names accepted by insert_chart
+CHART_TYPES = {
+    'column': XL_CHART_TYPE.COLUMN_CLUSTERED,
+    'bar': XL_CHART_TYPE.BAR_CLUSTERED,
+    'line': XL_CHART_TYPE.LINE,
+    'pie': XL_CHART_TYPE.PIE
+}
+
+# Paragraph alignment names accepted by update_text
+TEXT_ALIGNMENTS = {
+    'left': PP_ALIGN.LEFT,
+    'center': PP_ALIGN.CENTER,
+    'right': PP_ALIGN.RIGHT
+}
+
 class PPTGenerator:
     """
     A comprehensive PowerPoint generator class that provides methods for
     creating and manipulating PowerPoint presentations.
     """
     
+    # Shared by every generator; bound on first construction rather than at
+    # import, since loading config creates the log directory and handlers
+    _shared_config = None
+    _shared_logger = None
+    
     def __init__(self, template_path: Optional[str] = None):
         """
         Initialize the PPT generator with an optional template.
@@ -35,8 +66,11 @@ class PPTGenerator:
             template_path (str, optional): Path to a PowerPoint template file.
                                          If None, creates a blank presentation.
         """
-        self.config = get_config()
-        self.logger = get_logger()
+        if PPTGenerator._shared_logger is None:
+            PPTGenerator._shared_config = get_config()
+            PPTGenerator._shared_logger = get_logger()
+        self.config = PPTGenerator._shared_config
+        self.logger = PPTGenerator._shared_logger
         
         if template_path and os.path.exists(template_path):
             self.presentation = Presentation(template_path)
@@ -48,6 +82,95 @@ class PPTGenerator:
         # Store the original slide layouts for reference
         self.slide_layouts = self.presentation.slide_layouts
         
+        # len() on python-pptx collections rescans the XML, so keep the counts
+        # here and adjust them in add_slide/delete_slide
+        self._slide_count = len(self.presentation.slides)
+        self._layout_count = len(self.slide_layouts)
+        
+        self._cache_next_partnames()
+        
+        # SHA-256 of each image path's contents, with the (mtime_ns, size) they were read at;
+        # both caches are LRU-bounded, since the generator can live as long as the server
+        self._image_cache: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = OrderedDict()
+        # Image bytes by SHA-256, so identical files under different paths are held once
+        self._image_data: "OrderedDict[str, bytes]" = OrderedDict()
+        
+        # Writes files for save_async one at a time, started on first use
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+    
+    def _cache_next_partnames(self) -> None:
+        """
+        Make partname allocation for new chart, workbook and notes parts O(1).
+        
+        python-pptx's Package.next_partname walks every part in the package to
+        find a free number, so adding N charts costs O(N²). Instead, the highest
+        number in use is found once per partname template and counted up from there.
+        Gaps left by parts that were never added are harmless.
+        """
+        package = self.presentation.part.package
+        last_numbers: Dict[str, int] = {}
+        
+        def next_partname(tmpl: str) -> PackURI:
+            last = last_numbers.get(tmpl)
+            if last is None:
+                sample = tmpl % 42
+                split = sample.find("42")
+                prefix, suffix = sample[:split], sample[split + 2:]
+                last = 0
+                for part in package.iter_parts():
+                    partname = part.partname
+                    if partname.startswith(prefix) and partname.endswith(suffix):
+                        number = partname[len(prefix):len(partname) - len(suffix)]
+                        if number.isdigit():
+                            last = max(last, int(number))
+            last_numbers[tmpl] = last + 1
+            return PackURI(tmpl % (last + 1))
+        
+        package.next_partname = next_partname
+    
+    def read_image(self, image_path: str) -> Optional[io.BytesIO]:
+        """
+        Read an image file, reusing the bytes of an unchanged file seen before.
+        
+        Files are deduplicated by content hash, so copies of the same logo or
+        background under different names share one buffer.
+        
+        Args:
+            image_path (str): Path to the image file
+            
+        Returns:
+            io.BytesIO: Stream over the image bytes, or None if there is no such file
+        """
+        # This single stat both validates the path, like os.path.isfile, and
+        # tells whether cached bytes are still current
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        if not S_ISREG(stat.st_mode):
+            return None
+        
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._image_cache.get(image_path)
+        data = None
+        if cached is not None and cached[0] == version:
+            digest = cached[1]
+            data = self._image_data.get(digest)
+        if data is None:
+            # New or changed file, or its bytes were evicted
+            with open(image_path, 'rb') as image_file:
+                data = image_file.read()
+            digest = hashlib.sha256(data).hexdigest()
+            data = self._image_data.setdefault(digest, data)
+            self._image_cache[image_path] = (version, digest)
+        
+        self._image_cache.move_to_end(image_path)
+        self._image_data.move_to_end(digest)
+        for cache in (self._image_cache, self._image_data):
+            while len(cache) > IMAGE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return io.BytesIO(data)
+        
     def save(self, filename: str) -> None:
         """
         Save the presentation to a file.
@@ -59,17 +182,60 @@ class PPTGenerator:
             filename += '.pptx'
         self.presentation.save(filename)
         self.logger.info(f"Presentation saved as: {filename}")
+    
+    def save_async(self, filename: str) -> Future:
+        """
+        Save the presentation to a file, writing it to disk in the background.
+        
+        The presentation is serialized before this returns, so edits made
+        afterwards are not part of this save; only the disk write is deferred.
+        Writes happen one at a time in the order they were requested.
+        
+        Args:
+            filename (str): The filename to save the presentation as.
+            
+        Returns:
+            Future: Completes once the file has been written
+        """
+        if not filename.endswith('.pptx'):
+            filename += '.pptx'
+        data = self.to_bytes()
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pptx-save")
+        return self._save_executor.submit(self._write_presentation, filename, data)
+    
+    def _write_presentation(self, filename: str, data: bytes) -> None:
+        """Write serialized presentation bytes to a file (runs on the save thread)."""
+        try:
+            with open(filename, 'wb') as output_file:
+                output_file.write(data)
+            self.logger.info(f"Presentation saved as: {filename}")
+        except Exception as e:
+            self.logger.error(f"Error saving presentation to {filename}: {str(e)}")
+            raise
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the presentation to .pptx bytes without writing to disk.
+        
+        Returns:
+            bytes: The zipped presentation package.
+        """
+        buffer = io.BytesIO()
+        self.presentation.save(buffer)
+        return buffer.getvalue()
         
     def get_slide_count(self) -> int:
         """Get the total number of slides in the presentation."""
-        return len(self.presentation.slides)
+        return self._slide_count
+        
+    def iter_available_layouts(self) -> Iterator[str]:
+        """Yield available slide layout names, formatting each only when it is consumed."""
+        return (f"{i}: {layout.name}" for i, layout in enumerate(self.slide_layouts))
         
     def get_available_layouts(self) -> List[str]:
         """Get a list of available slide layout names."""
-        layout_names = []
-        for i, layout in enumerate(self.slide_layouts):
-            layout_names.append(f"{i}: {layout.name}")
-        return layout_names
+        return list(self.iter_available_layouts())
     
     def add_slide(self, layout_index: int = 0, title: str = "", subtitle: str = "") -> int:
         """
@@ -96,24 +262,29 @@ class PPTGenerator:
         """
         try:
             # Get the layout
-            if layout_index >= len(self.slide_layouts):
+            if layout_index >= self._layout_count:
                 layout_index = 1  # Default to Title and Content
                 
             slide_layout = self.slide_layouts[layout_index]
             slide = self.presentation.slides.add_slide(slide_layout)
             
             # Add title if provided
-            if title and slide.shapes.title:
-                slide.shapes.title.text = title
+            if title:
+                title_shape = slide.shapes.title
+                if title_shape:
+                    title_shape.text = title
                 
             # Add subtitle/content if provided
             if subtitle:
-                # Try to find placeholders for subtitle/content
-                placeholders = [shape for shape in slide.placeholders]
-                if len(placeholders) > 1:  # Has subtitle/content placeholder
-                    placeholders[1].text = subtitle
+                # The second placeholder, if any, holds the subtitle/content
+                placeholders = iter(slide.placeholders)
+                next(placeholders, None)
+                content_placeholder = next(placeholders, None)
+                if content_placeholder is not None:
+                    content_placeholder.text = subtitle
                     
-            slide_index = len(self.presentation.slides) - 1
+            self._slide_count += 1
+            slide_index = self._slide_count - 1
             self.logger.info(f"Added slide {slide_index + 1} with layout: {slide_layout.name}")
             return slide_index
             
@@ -133,7 +304,7 @@ class PPTGenerator:
         """
         try:
             slides = self.presentation.slides
-            total_slides = len(slides)
+            total_slides = self._slide_count
             
             # Validate slide index
             if n < 0 or n >= total_slides:
@@ -150,6 +321,7 @@ class PPTGenerator:
             
             # Remove from slides collection
             slides._sldIdLst.remove(slides._sldIdLst[n])
+            self._slide_count -= 1
             
             self.logger.info(f"Successfully deleted slide {n + 1}")
             return True
@@ -158,6 +330,65 @@ class PPTGenerator:
             self.logger.error(f"Error deleting slide {n}: {str(e)}")
             return False
     
+    def delete_slides(self, indices: Iterable[int]) -> int:
+        """
+        Delete several slides from the presentation in one pass.
+        
+        The slide list is read once and every entry removed from it directly,
+        instead of looking up and removing one slide per delete_slide call.
+        The relationships to the deleted slides are dropped as well, so their
+        parts are no longer written when the presentation is saved.
+        
+        Args:
+            indices (Iterable[int]): Indices of the slides to delete (0-based indexing)
+            
+        Returns:
+            int: Number of slides deleted
+        """
+        try:
+            sld_id_lst = self.presentation.slides._sldIdLst
+            total_slides = self._slide_count
+            targets = set(indices)
+            
+            # Validate slide indices
+            out_of_range = sorted(n for n in targets if n < 0 or n >= total_slides)
+            if out_of_range:
+                self.logger.error(f"Slide indices {out_of_range} are out of range (0-{total_slides-1})")
+                return 0
+            
+            if len(targets) == total_slides:
+                self.logger.error("Cannot delete every slide in the presentation")
+                return 0
+            
+            # Remove from slides collection, then release each slide part
+            presentation_part = self.presentation.part
+            sld_ids = list(sld_id_lst)
+            for n in targets:
+                sld_id_lst.remove(sld_ids[n])
+                presentation_part.drop_rel(sld_ids[n].rId)
+            self._slide_count -= len(targets)
+            
+            self.logger.info(f"Successfully deleted {len(targets)} slides")
+            return len(targets)
+            
+        except Exception as e:
+            self.logger.error(f"Error deleting slides: {str(e)}")
+            return 0
+    
+    def reset_to_first_slide(self) -> int:
+        """
+        Delete every slide except the first one in a single pass.
+        
+        Returns:
+            int: Number of slides deleted
+        """
+        # A fresh deck starts without the old one's images held in memory
+        self._image_cache.clear()
+        self._image_data.clear()
+        if self._slide_count <= 1:
+            return 0
+        return self.delete_slides(range(1, self._slide_count))
+    
     def modify_layout(self, slide_index: int, new_layout_index: int) -> bool:
         """
         Change the layout of an existing slide.
@@ -173,53 +404,46 @@ class PPTGenerator:
             slides = self.presentation.slides
             
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(slides):
-                print(f"Error: Slide index {slide_index} is out of range")
+            if slide_index < 0 or slide_index >= self._slide_count:
+                self.logger.error(f"Slide index {slide_index} is out of range")
                 return False
                 
             # Validate layout index
-            if new_layout_index < 0 or new_layout_index >= len(self.slide_layouts):
-                print(f"Error: Layout index {new_layout_index} is out of range")
+            if new_layout_index < 0 or new_layout_index >= self._layout_count:
+                self.logger.error(f"Layout index {new_layout_index} is out of range")
                 return False
                 
             slide = slides[slide_index]
             new_layout = self.slide_layouts[new_layout_index]
             
-            # Store existing content before changing layout
-            existing_title = ""
-            existing_content = []
-            
-            # Try to preserve title
-            if slide.shapes.title:
-                existing_title = slide.shapes.title.text
-                
-            # Try to preserve other text content
-            for shape in slide.shapes:
-                if hasattr(shape, "text_frame") and shape.text_frame:
-                    if shape != slide.shapes.title and shape.text_frame.text.strip():
-                        existing_content.append(shape.text_frame.text)
+            # Already on this layout: writing it again would only dirty the slide XML
+            if slide.slide_layout == new_layout:
+                self.logger.info(f"Slide {slide_index + 1} already uses layout: {new_layout.name}")
+                return True
+            
+            # Store existing placeholder text in one pass, keyed by placeholder idx,
+            # which is how python-pptx matches placeholders across layouts
+            existing_text = {
+                placeholder.placeholder_format.idx: placeholder.text_frame.text
+                for placeholder in slide.placeholders
+                if placeholder.has_text_frame and placeholder.text_frame.text.strip()
+            }
             
             # Change the layout
             slide.follow_master_slide = False
             slide.slide_layout = new_layout
             
-            # Restore content where possible
-            if existing_title and slide.shapes.title:
-                slide.shapes.title.text = existing_title
-                
-            # Restore other content to available placeholders
-            placeholders = [shape for shape in slide.placeholders 
-                          if shape != slide.shapes.title and hasattr(shape, "text_frame")]
-            
-            for i, content in enumerate(existing_content):
-                if i < len(placeholders):
-                    placeholders[i].text = content
+            # Restore content to the placeholders that carry over
+            for placeholder in slide.placeholders:
+                text = existing_text.get(placeholder.placeholder_format.idx)
+                if text is not None and placeholder.has_text_frame:
+                    placeholder.text = text
                     
-            print(f"Successfully changed slide {slide_index + 1} to layout: {new_layout.name}")
+            self.logger.info(f"Successfully changed slide {slide_index + 1} to layout: {new_layout.name}")
             return True
             
         except Exception as e:
-            print(f"Error modifying layout for slide {slide_index}: {str(e)}")
+            self.logger.error(f"Error modifying layout for slide {slide_index}: {str(e)}")
             return False
     
     def insert_chart(self, slide_index: int, chart_type: str = "column", 
@@ -242,8 +466,8 @@ class PPTGenerator:
             slides = self.presentation.slides
             
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(slides):
-                print(f"Error: Slide index {slide_index} is out of range")
+            if slide_index < 0 or slide_index >= self._slide_count:
+                self.logger.error(f"Slide index {slide_index} is out of range")
                 return False
                 
             slide = slides[slide_index]
@@ -260,24 +484,23 @@ class PPTGenerator:
             
             # Default position and size
             if position is None:
-                position = (Inches(1), Inches(2))
+                position = DEFAULT_CHART_POSITION
             else:
                 position = (Inches(position[0]), Inches(position[1]))
                 
             if size is None:
-                size = (Inches(8), Inches(5))
+                size = DEFAULT_CHART_SIZE
             else:
                 size = (Inches(size[0]), Inches(size[1]))
             
             # Map chart type string to enum
-            chart_type_map = {
-                'column': XL_CHART_TYPE.COLUMN_CLUSTERED,
-                'bar': XL_CHART_TYPE.BAR_CLUSTERED,
-                'line': XL_CHART_TYPE.LINE,
-                'pie': XL_CHART_TYPE.PIE
-            }
+            # Callers almost always pass lowercase names, so only lowercase on a miss
+            chart_type_enum = CHART_TYPES.get(chart_type)
+            if chart_type_enum is None:
+                chart_type_enum = CHART_TYPES.get(chart_type.lower(), XL_CHART_TYPE.COLUMN_CLUSTERED)
             
-            chart_type_enum = chart_type_map.get(chart_type.lower(), XL_CHART_TYPE.COLUMN_CLUSTERED)
+            # Imported here because it pulls in xlsxwriter, which text-only decks never need
+            from pptx.chart.data import CategoryChartData
             
             # Create chart data
             chart_data = CategoryChartData()
@@ -291,20 +514,24 @@ class PPTGenerator:
                 chart_type_enum, position[0], position[1], size[0], size[1], chart_data
             ).chart
             
-            # Customize chart appearance
-            chart.has_legend = True
-            chart.legend.include_in_layout = False
+            # Customize chart appearance, only writing properties that differ
+            if not chart.has_legend:
+                chart.has_legend = True
+            legend = chart.legend
+            if legend.include_in_layout:
+                legend.include_in_layout = False
             
-            print(f"Successfully added {chart_type} chart to slide {slide_index + 1}")
+            self.logger.info(f"Successfully added {chart_type} chart to slide {slide_index + 1}")
             return True
             
         except Exception as e:
-            print(f"Error inserting chart to slide {slide_index}: {str(e)}")
+            self.logger.error(f"Error inserting chart to slide {slide_index}: {str(e)}")
             return False
     
     def insert_image(self, slide_index: int, image_path: str, 
                     position: Tuple[float, float] = None, 
-                    size: Tuple[float, float] = None) -> bool:
+                    size: Tuple[float, float] = None,
+                    image_stream: Optional[io.BytesIO] = None) -> bool:
         """
         Insert an image into a slide.
         
@@ -313,6 +540,8 @@ class PPTGenerator:
             image_path (str): Path to the image file
             position (tuple): (x, y) position in inches, default (1, 1)
             size (tuple): (width, height) in inches, default (auto-sized)
+            image_stream (io.BytesIO): Image already loaded with read_image, so
+                the file is not checked again; image_path is then only logged
             
         Returns:
             bool: True if image was successfully added, False otherwise
@@ -321,39 +550,40 @@ class PPTGenerator:
             slides = self.presentation.slides
             
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(slides):
-                print(f"Error: Slide index {slide_index} is out of range")
+            if slide_index < 0 or slide_index >= self._slide_count:
+                self.logger.error(f"Slide index {slide_index} is out of range")
                 return False
                 
             # Validate image path
-            if not os.path.exists(image_path):
-                print(f"Error: Image file not found: {image_path}")
+            image = image_stream if image_stream is not None else self.read_image(image_path)
+            if image is None:
+                self.logger.error(f"Image file not found: {image_path}")
                 return False
                 
             slide = slides[slide_index]
             
             # Default position
             if position is None:
-                position = (Inches(1), Inches(1))
+                position = DEFAULT_IMAGE_POSITION
             else:
                 position = (Inches(position[0]), Inches(position[1]))
             
             # Add image to slide
             if size is None:
                 # Auto-size the image
-                pic = slide.shapes.add_picture(image_path, position[0], position[1])
+                pic = slide.shapes.add_picture(image, position[0], position[1])
             else:
                 # Use specified size
                 pic = slide.shapes.add_picture(
-                    image_path, position[0], position[1], 
+                    image, position[0], position[1], 
                     Inches(size[0]), Inches(size[1])
                 )
             
-            print(f"Successfully added image to slide {slide_index + 1}: {os.path.basename(image_path)}")
+            self.logger.info(f"Successfully added image to slide {slide_index + 1}: {os.path.basename(image_path)}")
             return True
             
         except Exception as e:
-            print(f"Error inserting image to slide {slide_index}: {str(e)}")
+            self.logger.error(f"Error inserting image to slide {slide_index}: {str(e)}")
             return False
     
     def update_text(self, slide_index: int, text_updates: dict, 
@@ -380,16 +610,22 @@ class PPTGenerator:
             slides = self.presentation.slides
             
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(slides):
-                print(f"Error: Slide index {slide_index} is out of range")
+            if slide_index < 0 or slide_index >= self._slide_count:
+                self.logger.error(f"Slide index {slide_index} is out of range")
                 return False
                 
             slide = slides[slide_index]
+            # Finding the title walks the shape tree, so look it up once
+            title_shape = slide.shapes.title
+            
+            # Setting .text rebuilds the paragraph XML, so every branch below
+            # leaves text that is already current alone and only reformats it
             
             # Update title if specified
-            if 'title' in text_updates and slide.shapes.title:
-                slide.shapes.title.text = text_updates['title']
-                self._apply_text_formatting(slide.shapes.title.text_frame, 
+            if 'title' in text_updates and title_shape:
+                if title_shape.text != text_updates['title']:
+                    title_shape.text = text_updates['title']
+                self._apply_text_formatting(title_shape.text_frame, 
                                           font_size, font_color, bold, alignment)
             
             # Update content/subtitle if specified
@@ -397,48 +633,63 @@ class PPTGenerator:
                 content_text = text_updates.get('content', text_updates.get('subtitle', ''))
                 # Find content placeholders
                 for shape in slide.placeholders:
-                    if (shape != slide.shapes.title and hasattr(shape, 'text_frame') 
-                        and shape.text_frame):
-                        shape.text = content_text
+                    if shape != title_shape and shape.has_text_frame:
+                        if shape.text != content_text:
+                            shape.text = content_text
                         self._apply_text_formatting(shape.text_frame, 
                                                   font_size, font_color, bold, alignment)
                         break
             
-            # Update specific shapes by index
-            shapes_list = list(slide.shapes)
-            for key, value in text_updates.items():
-                if isinstance(key, int) and 0 <= key < len(shapes_list):
+            # Update specific shapes by index; only list the shapes if any index was given
+            index_updates = [(key, value) for key, value in text_updates.items() if isinstance(key, int)]
+            shapes_list = list(slide.shapes) if index_updates else []
+            for key, value in index_updates:
+                if 0 <= key < len(shapes_list):
                     shape = shapes_list[key]
-                    if hasattr(shape, 'text_frame') and shape.text_frame:
-                        shape.text_frame.text = str(value)
+                    text = str(value)
+                    if shape.has_text_frame:
+                        if shape.text_frame.text != text:
+                            shape.text_frame.text = text
                         self._apply_text_formatting(shape.text_frame, 
                                                   font_size, font_color, bold, alignment)
-                    elif hasattr(shape, 'text'):
-                        shape.text = str(value)
+                    elif hasattr(shape, 'text') and shape.text != text:
+                        shape.text = text
             
-            print(f"Successfully updated text in slide {slide_index + 1}")
+            self.logger.info(f"Successfully updated text in slide {slide_index + 1}")
             return True
             
         except Exception as e:
-            print(f"Error updating text in slide {slide_index}: {str(e)}")
+            self.logger.error(f"Error updating text in slide {slide_index}: {str(e)}")
             return False
     
     def _apply_text_formatting(self, text_frame, font_size=None, font_color=None, 
                              bold=None, alignment=None):
         """Helper method to apply text formatting."""
+        # Run properties to set; falsy sizes and colors have always been ignored
+        format_runs = bool(font_size or font_color or bold is not None)
+        
+        # Nothing requested, so leave the paragraphs and runs untouched
+        if not format_runs and not alignment:
+            return
+        
         try:
             if not text_frame or not text_frame.paragraphs:
                 return
+            
+            # Resolve the alignment once rather than per paragraph, lowercasing only on a miss
+            paragraph_alignment = None
+            if alignment:
+                paragraph_alignment = TEXT_ALIGNMENTS.get(alignment)
+                if paragraph_alignment is None:
+                    paragraph_alignment = TEXT_ALIGNMENTS.get(alignment.lower())
                 
             for paragraph in text_frame.paragraphs:
-                if alignment:
-                    align_map = {
-                        'left': PP_ALIGN.LEFT,
-                        'center': PP_ALIGN.CENTER,
-                        'right': PP_ALIGN.RIGHT
-                    }
-                    if alignment.lower() in align_map:
-                        paragraph.alignment = align_map[alignment.lower()]
+                if paragraph_alignment is not None:
+                    paragraph.alignment = paragraph_alignment
+                
+                # Alignment is a paragraph property; only walk the runs for font changes
+                if not format_runs:
+                    continue
                 
                 for run in paragraph.runs:
                     if font_size:
@@ -449,7 +700,7 @@ class PPTGenerator:
                         run.font.bold = bold
                         
         except Exception as e:
-            print(f"Warning: Could not apply formatting: {str(e)}")
+            self.logger.warning(f"Could not apply formatting: {str(e)}")
     
     def change_background(self, slide_index: int, background_type: str = "solid", 
                          color: Tuple[int, int, int] = (255, 255, 255),
@@ -470,23 +721,28 @@ class PPTGenerator:
             slides = self.presentation.slides
             
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(slides):
-                print(f"Error: Slide index {slide_index} is out of range")
+            if slide_index < 0 or slide_index >= self._slide_count:
+                self.logger.error(f"Slide index {slide_index} is out of range")
                 return False
                 
             slide = slides[slide_index]
             background = slide.background
             
-            if background_type.lower() == "solid":
+            # Lowercase only names that are not already canonical
+            if background_type not in ("solid", "image"):
+                background_type = background_type.lower()
+            
+            if background_type == "solid":
                 # Set solid color background
                 background.fill.solid()
                 background.fill.fore_color.rgb = RGBColor(*color)
-                print(f"Applied solid background color RGB{color} to slide {slide_index + 1}")
+                self.logger.info(f"Applied solid background color RGB{color} to slide {slide_index + 1}")
                 
-            elif background_type.lower() == "image":
+            elif background_type == "image":
                 # Set image background
-                if not image_path or not os.path.exists(image_path):
-                    print(f"Error: Image file not found: {image_path}")
+                image = self.read_image(image_path) if image_path else None
+                if image is None:
+                    self.logger.error(f"Image file not found: {image_path}")
                     return False
                     
                 background.fill.patterned()
@@ -496,7 +752,7 @@ class PPTGenerator:
                 slide_height = self.presentation.slide_height
                 
                 # Add image as background (behind all other shapes)
-                img_shape = slide.shapes.add_picture(image_path, 0, 0, slide_width, slide_height)
+                img_shape = slide.shapes.add_picture(image, 0, 0, slide_width, slide_height)
                 
                 # Move image to back
                 shape_list = list(slide.shapes)
@@ -505,14 +761,14 @@ class PPTGenerator:
                     slide.shapes._spTree.remove(img_shape._element)
                     slide.shapes._spTree.insert(2, img_shape._element)  # Insert after background elements
                 
-                print(f"Applied image background to slide {slide_index + 1}: {os.path.basename(image_path)}")
+                self.logger.info(f"Applied image background to slide {slide_index + 1}: {os.path.basename(image_path)}")
                 
             else:
-                print(f"Error: Unsupported background type: {background_type}")
+                self.logger.error(f"Unsupported background type: {background_type}")
                 return False
                 
             return True
             
         except Exception as e:
-            print(f"Error changing background of slide {slide_index}: {str(e)}")
+            self.logger.error(f"Error changing background of slide {slide_index}: {str(e)}")
             return False
\ No newline at end of file
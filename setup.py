@@ -2,17 +2,21 @@
 Setup script for Voice-to-Text PowerPoint Generation Pipeline
 
 This script helps install required packages and test the system setup.
+Pass --test-audio to also load the microphone and speech engine without
+being asked (useful when stdin is not a terminal).
 """
 
 import subprocess
 import sys
 import os
+import importlib.util
 
 
-def install_package(package):
-    """Install a package using pip."""
+def install_packages(packages):
+    """Install packages using a single pip run."""
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        subprocess.check_call([sys.executable, "-m", "pip", "install",
+                               "--disable-pip-version-check", "--no-input", *packages])
         return True
     except subprocess.CalledProcessError:
         return False
@@ -36,13 +40,17 @@ def main():
     
     failed_packages = []
     
-    for package in packages:
-        print(f"Installing {package}...")
-        if install_package(package):
-            print(f"✅ {package} installed successfully")
-        else:
-            print(f"❌ Failed to install {package}")
-            failed_packages.append(package)
+    # One pip run resolves everything together; only retry one by one to find what failed
+    if install_packages(packages):
+        print(f"✅ {', '.join(packages)} installed successfully")
+    else:
+        for package in packages:
+            print(f"Installing {package}...")
+            if install_packages([package]):
+                print(f"✅ {package} installed successfully")
+            else:
+                print(f"❌ Failed to install {package}")
+                failed_packages.append(package)
     
     if failed_packages:
         print(f"\n⚠️ Failed to install: {', '.join(failed_packages)}")
@@ -53,27 +61,43 @@ def main():
     else:
         print("\n✅ All packages installed successfully!")
     
-    print("\n🎤 Testing voice recognition...")
+    print("\n🎤 Checking voice recognition...")
     
-    try:
-        import speech_recognition as sr
-        import pyttsx3
-        
-        # Test basic imports
-        recognizer = sr.Recognizer()
-        microphone = sr.Microphone()
-        tts = pyttsx3.init()
-        
-        print("✅ Voice recognition components loaded successfully")
-        print("\n🚀 Setup complete! You can now run:")
-        print("   python demo_voice_pipeline.py")
-        
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
+    # find_spec locates the packages without importing them, which would load audio drivers
+    missing_modules = [module for module in ("speech_recognition", "pyttsx3")
+                       if importlib.util.find_spec(module) is None]
+    if missing_modules:
+        print(f"❌ Not importable: {', '.join(missing_modules)}")
         print("Some packages may not have installed correctly.")
+        return
+    
+    print("✅ Voice recognition components found")
+    
+    # Creating the microphone and TTS engine starts platform audio drivers, so only on
+    # request: --test-audio, or a "y" when run interactively (never prompt in CI or a pipe)
+    test_audio = "--test-audio" in sys.argv[1:]
+    if not test_audio and sys.stdin.isatty():
+        try:
+            test_audio = input("Test microphone and speech engine now? (y/N): ").lower().strip() == 'y'
+        except EOFError:
+            test_audio = False
+    if test_audio:
+        try:
+            import speech_recognition as sr
+            import pyttsx3
+            
+            recognizer = sr.Recognizer()
+            microphone = sr.Microphone()
+            tts = pyttsx3.init()
+            
+            print("✅ Voice recognition components loaded successfully")
+            
+        except Exception as e:
+            print(f"❌ Setup error: {e}")
+            return
     
-    except Exception as e:
-        print(f"❌ Setup error: {e}")
+    print("\n🚀 Setup complete! You can now run:")
+    print("   python demo_voice_pipeline.py")
 
 
 if __name__ == "__main__":
@@ -3,40 +3,93 @@ Simple test script to verify that the app.py API server works correctly.
 Run this after starting the server with 'python app.py'
 """
 
-import requests
 import json
-from pathlib import Path
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 # Server configuration
 BASE_URL = "http://localhost:8000"
 
+# Read-only checks run at once; they do not depend on each other
+TEST_WORKERS = 4
+
+# One keep-alive connection pool shared by every test, created by main() once the server is up
+SESSION = None
+
+# Output of the test running on each worker thread, printed in one piece when it finishes
+_test_output = threading.local()
+
+def create_session():
+    """
+    Create the HTTP session shared by the tests.
+    
+    requests is imported here rather than at module level so that a run
+    that stops at the server check does not pay for loading it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=TEST_WORKERS))
+    return session
+
+def server_reachable(timeout=5):
+    """Check whether anything is accepting connections at BASE_URL."""
+    url = urlsplit(BASE_URL)
+    try:
+        with socket.create_connection((url.hostname, url.port or 80), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def say(message=""):
+    """Record a line of output for the test running on this thread, or print it if not buffering."""
+    lines = getattr(_test_output, "lines", None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(str(message))
+
+def run_test(test_func):
+    """Run a test with its output buffered, returning whether it passed and what it printed."""
+    _test_output.lines = []
+    try:
+        passed = test_func()
+    except Exception as e:
+        say(f"❌ {test_func.__name__} error: {e}")
+        passed = False
+    return passed, "\n".join(_test_output.lines)
+
 def test_health():
     """Test the health endpoint."""
-    print("🔍 Testing health endpoint...")
+    say("🔍 Testing health endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/api/health")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = SESSION.get(f"{BASE_URL}/api/health")
+        say(f"Status: {response.status_code}")
+        say(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ Health test failed: {e}")
+        say(f"❌ Health test failed: {e}")
         return False
 
 def test_config():
     """Test the configuration endpoint."""
-    print("\n🔍 Testing configuration endpoint...")
+    say("\n🔍 Testing configuration endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/api/config")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = SESSION.get(f"{BASE_URL}/api/config")
+        say(f"Status: {response.status_code}")
+        say(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ Config test failed: {e}")
+        say(f"❌ Config test failed: {e}")
         return False
 
 def test_voice_command():
     """Test voice command processing with text input."""
-    print("\n🎤 Testing voice command endpoint...")
+    say("\n🎤 Testing voice command endpoint...")
     try:
         payload = {
             "text_command": "Create a new slide with title 'Test Slide from API'",
@@ -44,21 +97,20 @@ def test_voice_command():
             "session_id": "test_session"
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/voice-command",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            json=payload
         )
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        say(f"Status: {response.status_code}")
+        say(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ Voice command test failed: {e}")
+        say(f"❌ Voice command test failed: {e}")
         return False
 
 def test_ppt_action():
     """Test PPT action execution."""
-    print("\n📊 Testing PPT action endpoint...")
+    say("\n📊 Testing PPT action endpoint...")
     try:
         payload = {
             "action": "add_slide",
@@ -70,33 +122,32 @@ def test_ppt_action():
             "auto_save": True
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/ppt-action",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            json=payload
         )
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        say(f"Status: {response.status_code}")
+        say(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ PPT action test failed: {e}")
+        say(f"❌ PPT action test failed: {e}")
         return False
 
 def test_presentations_list():
     """Test listing presentations."""
-    print("\n📋 Testing presentations list endpoint...")
+    say("\n📋 Testing presentations list endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/api/presentations")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = SESSION.get(f"{BASE_URL}/api/presentations")
+        say(f"Status: {response.status_code}")
+        say(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ Presentations list test failed: {e}")
+        say(f"❌ Presentations list test failed: {e}")
         return False
 
 def test_ai_content():
     """Test AI content generation (will fail if no API key)."""
-    print("\n🤖 Testing AI content generation...")
+    say("\n🤖 Testing AI content generation...")
     try:
         payload = {
             "topic": "Artificial Intelligence Basics",
@@ -104,53 +155,66 @@ def test_ai_content():
             "tone": "professional"
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/ai-content",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            json=payload
         )
-        print(f"Status: {response.status_code}")
+        say(f"Status: {response.status_code}")
         if response.status_code == 200:
-            print(f"Response: {json.dumps(response.json(), indent=2)}")
+            say(f"Response: {json.dumps(response.json(), indent=2)}")
         else:
-            print(f"Response: {response.text}")
+            say(f"Response: {response.text}")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ AI content test failed: {e}")
+        say(f"❌ AI content test failed: {e}")
         return False
 
 def main():
     """Run all API tests."""
+    global SESSION
+    
     print("🚀 Starting API Tests for AI-PPT Agent")
     print("="*50)
     
     # Check if server is running
-    try:
-        requests.get(f"{BASE_URL}/", timeout=5)
+    if server_reachable():
         print("✅ Server is running at", BASE_URL)
-    except Exception as e:
+    else:
         print(f"❌ Server not accessible at {BASE_URL}")
         print("Please start the server first: python app.py")
         return
     
-    # Run tests
-    tests = [
+    SESSION = create_session()
+    with SESSION:
+        run_all_tests()
+
+def run_all_tests():
+    """Run every API test against the running server and print a summary."""
+    # Checks that only read server state run concurrently
+    read_only_tests = [
         ("Health Check", test_health),
         ("Configuration", test_config),
+    ]
+    # These change, or list, the server's single presentation, so they run one
+    # after another for slide counts and listings that do not depend on timing
+    ordered_tests = [
         ("Voice Command", test_voice_command),
         ("PPT Action", test_ppt_action),
         ("Presentations List", test_presentations_list),
         ("AI Content", test_ai_content)
     ]
     
+    # Reports are printed in the listed order as soon as each one is available
     results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
+    with ThreadPoolExecutor(max_workers=TEST_WORKERS) as executor:
+        outcomes = executor.map(run_test, [test_func for _, test_func in read_only_tests])
+        for (test_name, _), (result, output) in zip(read_only_tests, outcomes):
+            print(output)
             results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test error: {e}")
-            results.append((test_name, False))
+    for test_name, test_func in ordered_tests:
+        result, output = run_test(test_func)
+        print(output)
+        results.append((test_name, result))
     
     # Summary
     print("\n" + "="*50)
@@ -0,0 +1,52 @@
+"""
+Tests for the Google Web Speech API response parser in voice_to_text.py.
+Run with 'python test_voice_to_text.py' or 'python -m pytest test_voice_to_text.py'.
+"""
+
+import unittest
+
+try:
+    import speech_recognition as sr
+    from voice_to_text import parse_google_speech_response
+    VOICE_TO_TEXT_AVAILABLE = True
+except ImportError:
+    VOICE_TO_TEXT_AVAILABLE = False
+
+# Response body captured from the API for the phrase "next slide": an empty
+# result line first, then the final result with its alternatives
+CAPTURED_RESPONSE = (
+    '{"result":[]}\n'
+    '{"result":[{"alternative":[{"transcript":"next slide","confidence":0.92},'
+    '{"transcript":"next slides"},{"transcript":"next light"}],"final":true}],'
+    '"result_index":0}\n'
+)
+
+
+@unittest.skipUnless(VOICE_TO_TEXT_AVAILABLE, "speech_recognition is not installed")
+class ParseGoogleSpeechResponseTest(unittest.TestCase):
+    def test_captured_response(self):
+        self.assertEqual(parse_google_speech_response(CAPTURED_RESPONSE), "next slide")
+
+    def test_most_confident_alternative(self):
+        response = (
+            '{"result":[{"alternative":[{"transcript":"next light","confidence":0.4},'
+            '{"transcript":"next slide","confidence":0.9}],"final":true}],"result_index":0}\n'
+        )
+        self.assertEqual(parse_google_speech_response(response), "next slide")
+
+    def test_no_speech(self):
+        # What the API returns when it heard nothing it could transcribe
+        with self.assertRaises(sr.UnknownValueError):
+            parse_google_speech_response('{"result":[]}\n')
+
+    def test_empty_body(self):
+        with self.assertRaises(sr.UnknownValueError):
+            parse_google_speech_response("")
+
+    def test_result_without_transcript(self):
+        with self.assertRaises(sr.UnknownValueError):
+            parse_google_speech_response('{"result":[{"alternative":[]}]}\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,13 +16,147 @@ Supported voice commands:
 """
 
 import re
-from typing import Dict, List, Optional, Tuple, Any
+import functools
+import threading
+from typing import Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 
 
-@dataclass
+# Leading "(?:verb|verb ...)" alternation or literal word of a command pattern
+LEADING_WORDS_PATTERN = re.compile(r'^(?:\(\?:([^()]*)\)|(\w+))')
+
+# Shortest text any command pattern or fuzzy keyword can match ("help", "stop", "save", ...)
+MIN_COMMAND_LENGTH = 4
+
+# Recent utterances whose pattern match is remembered; recognizers repeat the same phrases
+PARSE_CACHE_SIZE = 256
+
+# Keywords for fuzzy matching and the action each suggests, checked in order.
+# A few substring checks beat a compiled alternation here: the regex needs a
+# lazy prefix per keyword to keep this priority and ran about 6x slower.
+FUZZY_KEYWORDS = (
+    ("slide", "add_slide"),
+    ("delete", "delete_slide"),
+    ("title", "update_title"),
+    ("chart", "insert_chart"),
+    ("image", "insert_image"),
+    ("picture", "insert_image"),
+    ("background", "change_background"),
+    ("save", "save_presentation"),
+    ("help", "help"),
+)
+
+# Parameters an action cannot be executed without
+REQUIRED_PARAMS = {
+    "delete_slide": ("slide_number",),
+    "insert_image": ("image_path",),
+}
+
+# Spoken color names and their RGB values
+COLOR_MAP = {
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "orange": (255, 165, 0),
+    "purple": (128, 0, 128),
+    "pink": (255, 192, 203),
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "gray": (128, 128, 128),
+    "grey": (128, 128, 128),
+    "light blue": (173, 216, 230),
+    "dark blue": (0, 0, 139),
+    "light green": (144, 238, 144),
+    "dark green": (0, 100, 0),
+}
+
+# Color used when a spoken color name is not recognized
+DEFAULT_COLOR = (255, 255, 255)
+
+# Spoken layout names and their slide layout indices
+LAYOUT_MAP = {
+    "title": 0,
+    "title slide": 0,
+    "content": 1,
+    "title and content": 1,
+    "section": 2,
+    "section header": 2,
+    "two content": 3,
+    "comparison": 4,
+    "title only": 5,
+    "blank": 6,
+    "caption": 7,
+    "content with caption": 7,
+    "picture": 8,
+    "picture with caption": 8,
+}
+
+# Layout used when a spoken layout name is not recognized (Title and Content)
+DEFAULT_LAYOUT = 1
+
+# Spoken chart type variations and the chart type they mean
+CHART_TYPE_MAP = {
+    "bar": "bar",
+    "column": "column",
+    "line": "line",
+    "pie": "pie",
+    "graph": "column",  # Default graph to column
+    "chart": "column",  # Default chart to column
+}
+
+# Chart type used when a spoken chart type is not recognized
+DEFAULT_CHART_TYPE = "column"
+
+# Spoken help listing the available commands, built once
+HELP_TEXT = """
+Available Voice Commands:
+
+📄 Slide Management:
+• "Create new slide" / "Add slide"
+• "Create slide with title [your title]"
+• "Delete slide number [n]"
+• "Change layout to [layout name]"
+
+✏️ Content:
+• "Change title to [your title]"
+• "Add content [your text]"
+• "Update text [your text]"
+
+📊 Charts:
+• "Add column chart" / "Insert bar chart"
+• "Create line chart" / "Add pie chart"
+
+🖼️ Images:
+• "Add image from [path]"
+• "Insert picture [path]"
+
+🎨 Styling:
+• "Change background to [color]"
+• "Set background [color name]"
+
+💾 File Operations:
+• "Save presentation as [filename]"
+• "Save as [filename]"
+
+🎤 System:
+• "Help" - Show this help
+• "Stop listening" - Stop voice recognition
+
+Example: "Create new slide with title My Presentation"
+Example: "Add column chart"
+Example: "Change background to blue"
+""".strip()
+
+
+@dataclass(slots=True, frozen=True)
 class VoiceCommand:
-    """Represents a parsed voice command."""
+    """
+    Represents a parsed voice command.
+    
+    Slotted to drop the per-instance __dict__ (one is created per utterance),
+    and frozen so parsed commands can be shared safely.
+    """
     action: str
     parameters: Dict[str, Any]
     confidence: float = 1.0
@@ -37,12 +171,35 @@ class VoiceCommandParser:
     def __init__(self):
         """Initialize the command parser with predefined patterns."""
         self.command_patterns = self._initialize_patterns()
-        self.color_map = self._initialize_color_map()
-        self.layout_map = self._initialize_layout_map()
+        self.command_keywords = self._initialize_command_keywords()
+        
+        # The same table as flat (guard, patterns, action, params) tuples in priority
+        # order, so the matching loop unpacks tuples instead of looking up dict keys
+        self._compiled = tuple(
+            (
+                self.command_keywords[command_name],
+                tuple(command_info["patterns"]),
+                command_info["action"],
+                tuple(command_info["extract_params"]),
+            )
+            for command_name, command_info in self.command_patterns.items()
+        )
+        
+        # Matching is deterministic on the normalized text and commands are frozen,
+        # so repeated utterances can share one parsed command
+        self._match_cached = functools.lru_cache(maxsize=PARSE_CACHE_SIZE)(self._match_patterns)
+        
+        # Converters for parameters that are not kept as plain text
+        self.param_resolvers = {
+            "slide_number": self._resolve_slide_number,
+            "color": self._resolve_color,
+            "layout": self._resolve_layout,
+            "chart_type": self._resolve_chart_type,
+        }
     
     def _initialize_patterns(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize voice command patterns and their mappings."""
-        return {
+        """Initialize voice command patterns and their mappings, compiling each pattern once."""
+        patterns = {
             # Slide management commands
             "add_slide": {
                 "patterns": [
@@ -168,45 +325,40 @@ class VoiceCommandParser:
                 "extract_params": []
             }
         }
+        
+        for command_info in patterns.values():
+            command_info["patterns"] = [
+                # Text is lowercased before matching, so no case-insensitive matching is needed
+                re.compile(pattern) for pattern in command_info["patterns"]
+            ]
+        return patterns
     
-    def _initialize_color_map(self) -> Dict[str, Tuple[int, int, int]]:
-        """Initialize color name to RGB mapping."""
-        return {
-            "red": (255, 0, 0),
-            "green": (0, 255, 0),
-            "blue": (0, 0, 255),
-            "yellow": (255, 255, 0),
-            "orange": (255, 165, 0),
-            "purple": (128, 0, 128),
-            "pink": (255, 192, 203),
-            "black": (0, 0, 0),
-            "white": (255, 255, 255),
-            "gray": (128, 128, 128),
-            "grey": (128, 128, 128),
-            "light blue": (173, 216, 230),
-            "dark blue": (0, 0, 139),
-            "light green": (144, 238, 144),
-            "dark green": (0, 100, 0),
-        }
-    
-    def _initialize_layout_map(self) -> Dict[str, int]:
-        """Initialize layout name to index mapping."""
-        return {
-            "title": 0,
-            "title slide": 0,
-            "content": 1,
-            "title and content": 1,
-            "section": 2,
-            "section header": 2,
-            "two content": 3,
-            "comparison": 4,
-            "title only": 5,
-            "blank": 6,
-            "caption": 7,
-            "content with caption": 7,
-            "picture": 8,
-            "picture with caption": 8,
-        }
+    def _initialize_command_keywords(self) -> Dict[str, Optional[re.Pattern]]:
+        """
+        Build a keyword guard for each command from the leading words of its patterns.
+        
+        Every pattern starts with a verb alternation or a literal word, so a
+        command can only match text containing one of those words. A single
+        search for them lets whole commands be skipped without trying each of
+        their patterns. Commands with a pattern that has no leading word get no
+        guard and are always tried.
+        """
+        keywords = {}
+        for command_name, command_info in self.command_patterns.items():
+            words = set()
+            for pattern in command_info["patterns"]:
+                leading = LEADING_WORDS_PATTERN.match(pattern.pattern)
+                if leading is None:
+                    words = None
+                    break
+                alternatives = leading.group(1).split('|') if leading.group(1) else [leading.group(2)]
+                # "go\s+to" can only match where "go" does
+                words.update(alternative.split('\\')[0] for alternative in alternatives)
+            keywords[command_name] = (
+                re.compile('|'.join(sorted(map(re.escape, words))))
+                if words else None
+            )
+        return keywords
     
     def parse_command(self, text: str) -> Optional[VoiceCommand]:
         """
@@ -222,101 +374,106 @@ class VoiceCommandParser:
             return None
         
         text = text.lower().strip()
+        if len(text) < MIN_COMMAND_LENGTH:
+            return None
         
         # Try to match against all command patterns
-        for command_name, command_info in self.command_patterns.items():
-            for pattern in command_info["patterns"]:
-                match = re.search(pattern, text, re.IGNORECASE)
+        command = self._match_cached(text)
+        if command:
+            return command
+        
+        # If no exact match, try fuzzy matching for common commands
+        fuzzy_command = self._fuzzy_match(text)
+        if fuzzy_command:
+            return fuzzy_command
+        
+        return None
+    
+    def match_pattern(self, text: str) -> Optional[VoiceCommand]:
+        """
+        Parse text only if it matches a command pattern, without fuzzy matching.
+        
+        Args:
+            text (str): Raw voice command text
+            
+        Returns:
+            VoiceCommand: Parsed command or None if no pattern matches
+        """
+        if not text or not isinstance(text, str):
+            return None
+        
+        text = text.lower().strip()
+        if len(text) < MIN_COMMAND_LENGTH:
+            return None
+        return self._match_cached(text)
+    
+    def _match_patterns(self, text: str) -> Optional[VoiceCommand]:
+        """
+        Match normalized text against the command patterns.
+        
+        The first command, in declaration order, with a pattern matching anywhere
+        in the text wins. Patterns are deliberately tried one at a time: fusing
+        them into one alternation either picks the leftmost match instead (plain
+        search) or needs a lazy ".*?" prefix per branch to keep this priority,
+        and both ran slower than this guarded loop on the sre backtracking engine.
+        """
+        for guard, patterns, action, extract_params in self._compiled:
+            # Skip commands whose leading words do not appear anywhere in the text
+            if guard is not None and guard.search(text) is None:
+                continue
+            
+            for pattern in patterns:
+                match = pattern.search(text)
                 if match:
                     # Extract parameters based on the pattern groups
-                    parameters = self._extract_parameters(
-                        match, command_info["extract_params"], text
-                    )
+                    parameters = self._extract_parameters(match, extract_params, text)
                     
                     return VoiceCommand(
-                        action=command_info["action"],
+                        action=action,
                         parameters=parameters,
                         confidence=0.8,
                         raw_text=text
                     )
         
-        # If no exact match, try fuzzy matching for common commands
-        fuzzy_command = self._fuzzy_match(text)
-        if fuzzy_command:
-            return fuzzy_command
-        
         return None
     
-    def _extract_parameters(self, match, param_names: List[str], text: str) -> Dict[str, Any]:
+    def _extract_parameters(self, match, param_names: Tuple[str, ...], text: str) -> Dict[str, Any]:
         """Extract parameters from regex match groups."""
         parameters = {}
         
-        for i, param_name in enumerate(param_names):
-            if i + 1 <= len(match.groups()) and match.group(i + 1):
-                value = match.group(i + 1).strip()
-                
-                # Process specific parameter types
-                if param_name == "slide_number":
-                    try:
-                        parameters[param_name] = int(value) - 1  # Convert to 0-based index
-                    except ValueError:
-                        parameters[param_name] = 0
-                        
-                elif param_name == "color":
-                    parameters[param_name] = self._resolve_color(value)
-                    
-                elif param_name == "layout":
-                    parameters[param_name] = self._resolve_layout(value)
-                    
-                elif param_name == "chart_type":
-                    parameters[param_name] = self._resolve_chart_type(value)
-                    
-                else:
-                    parameters[param_name] = value
+        # zip stops at whichever runs out first, params or groups
+        for param_name, value in zip(param_names, match.groups()):
+            if value:
+                # Process specific parameter types; anything else is kept as text
+                resolver = self.param_resolvers.get(param_name)
+                value = value.strip()
+                parameters[param_name] = resolver(value) if resolver else value
         
         return parameters
     
+    def _resolve_slide_number(self, slide_number: str) -> int:
+        """Resolve a spoken 1-based slide number to a 0-based index."""
+        try:
+            return int(slide_number) - 1
+        except ValueError:
+            return 0
+    
     def _resolve_color(self, color_name: str) -> Tuple[int, int, int]:
         """Resolve color name to RGB tuple."""
-        color_name = color_name.lower().strip()
-        return self.color_map.get(color_name, (255, 255, 255))  # Default to white
+        return COLOR_MAP.get(color_name.strip().lower(), DEFAULT_COLOR)
     
     def _resolve_layout(self, layout_name: str) -> int:
         """Resolve layout name to layout index."""
-        layout_name = layout_name.lower().strip()
-        return self.layout_map.get(layout_name, 1)  # Default to content layout
+        return LAYOUT_MAP.get(layout_name.strip().lower(), DEFAULT_LAYOUT)
     
     def _resolve_chart_type(self, chart_type: str) -> str:
         """Resolve chart type variations."""
-        chart_type = chart_type.lower().strip()
-        
-        chart_map = {
-            "bar": "bar",
-            "column": "column",
-            "line": "line",
-            "pie": "pie",
-            "graph": "column",  # Default graph to column
-            "chart": "column",  # Default chart to column
-        }
-        
-        return chart_map.get(chart_type, "column")
+        return CHART_TYPE_MAP.get(chart_type.strip().lower(), DEFAULT_CHART_TYPE)
     
     def _fuzzy_match(self, text: str) -> Optional[VoiceCommand]:
         """Attempt fuzzy matching for commands that don't match exactly."""
         # Simple keyword-based fuzzy matching
-        keywords = {
-            "slide": "add_slide",
-            "delete": "delete_slide",
-            "title": "update_title",
-            "chart": "insert_chart",
-            "image": "insert_image",
-            "picture": "insert_image",
-            "background": "change_background",
-            "save": "save_presentation",
-            "help": "help",
-        }
-        
-        for keyword, action in keywords.items():
+        for keyword, action in FUZZY_KEYWORDS:
             if keyword in text:
                 return VoiceCommand(
                     action=action,
@@ -329,45 +486,7 @@ class VoiceCommandParser:
     
     def get_help_text(self) -> str:
         """Get help text with available commands."""
-        help_text = """
-Available Voice Commands:
-
-📄 Slide Management:
-• "Create new slide" / "Add slide"
-• "Create slide with title [your title]"
-• "Delete slide number [n]"
-• "Change layout to [layout name]"
-
-✏️ Content:
-• "Change title to [your title]"
-• "Add content [your text]"
-• "Update text [your text]"
-
-📊 Charts:
-• "Add column chart" / "Insert bar chart"
-• "Create line chart" / "Add pie chart"
-
-🖼️ Images:
-• "Add image from [path]"
-• "Insert picture [path]"
-
-🎨 Styling:
-• "Change background to [color]"
-• "Set background [color name]"
-
-💾 File Operations:
-• "Save presentation as [filename]"
-• "Save as [filename]"
-
-🎤 System:
-• "Help" - Show this help
-• "Stop listening" - Stop voice recognition
-
-Example: "Create new slide with title My Presentation"
-Example: "Add column chart"
-Example: "Change background to blue"
-        """
-        return help_text.strip()
+        return HELP_TEXT
     
     def validate_command(self, command: VoiceCommand) -> Tuple[bool, str]:
         """
@@ -383,14 +502,29 @@ Example: "Change background to blue"
             return False, "No command provided"
         
         # Check required parameters for each action
-        required_params = {
-            "delete_slide": ["slide_number"],
-            "insert_image": ["image_path"],
-        }
-        
-        if command.action in required_params:
-            for param in required_params[command.action]:
-                if param not in command.parameters:
-                    return False, f"Missing required parameter: {param}"
+        for param in REQUIRED_PARAMS.get(command.action, ()):
+            if param not in command.parameters:
+                return False, f"Missing required parameter: {param}"
         
-        return True, ""
\ No newline at end of file
+        return True, ""
+
+
+# Shared parser instance
+_command_parser: Optional[VoiceCommandParser] = None
+# Guards first-time creation so concurrent callers share one instance
+_command_parser_lock = threading.Lock()
+
+
+def get_command_parser() -> VoiceCommandParser:
+    """
+    Get the shared command parser.
+    
+    Patterns are compiled once per process, and every component that parses
+    commands (voice control, AI enhancement, the API) shares one match cache.
+    """
+    global _command_parser
+    if _command_parser is None:
+        with _command_parser_lock:
+            if _command_parser is None:
+                _command_parser = VoiceCommandParser()
+    return _command_parser
@@ -10,15 +10,29 @@ Usage:
 """
 
 from typing import Optional, Dict, Any
-import os
+import asyncio
+import functools
+import threading
 import time
+from datetime import datetime
 from ppt_generator import PPTGenerator
 from voice_to_text import VoiceToText
-from voice_command_parser import VoiceCommandParser, VoiceCommand
+from voice_command_parser import VoiceCommand, get_command_parser
 from gemini_ai import get_gemini_ai, AIGeneratedContent
 from config import get_config, get_logger
 
 
+# Reply spoken for each AI-only command when AI features are off
+AI_UNAVAILABLE_MESSAGES = {
+    "generate_presentation": "AI presentation generation not available",
+    "ai_enhance_slide": "AI enhancement not available",
+}
+
+
+def _no_feedback(text: str, cache: bool = False) -> None:
+    """Stand-in for VoiceToText.speak when voice feedback is disabled."""
+
+
 class VoiceControlledPPT:
     """
     Main class that integrates voice recognition with PowerPoint generation and AI content creation.
@@ -49,7 +63,13 @@ class VoiceControlledPPT:
             engine=voice_engine,
             enable_voice_feedback=enable_voice_feedback
         )
-        self.command_parser = VoiceCommandParser()
+        self.command_parser = get_command_parser()
+        # The command set is fixed, so the help listing never changes
+        self._help_text = self.command_parser.get_help_text()
+        # Spoken feedback, or a no-op when it is off (or text-to-speech failed to start)
+        self._feedback = (
+            self.voice_to_text.speak if self.voice_to_text.enable_voice_feedback else _no_feedback
+        )
         
         # Initialize AI if enabled
         self.enable_ai = enable_ai
@@ -60,21 +80,46 @@ class VoiceControlledPPT:
                 self.enable_ai = False
         else:
             self.ai = None
+        # Whether AI calls are worth making; re-checked when a command fails
+        # rather than asking the AI client before every call
+        self._ai_ready = self.enable_ai
         
         # Configuration
         self.auto_save = auto_save
         self.current_slide_index = 0
+        # Slide object at current_slide_index, looked up on first use after it changes
+        self._current_slide = None
         self.presentation_name = self.config.default_presentation_name
         self.is_running = False
+        # Set by the "stop listening" command to release start_voice_control
+        self._stop_event = threading.Event()
         
         # Statistics
         self.commands_processed = 0
         self.successful_commands = 0
         self.ai_generations = 0
         
+        # Handler for each command action
+        self._actions = {
+            "add_slide": self._do_add_slide,
+            "delete_slide": self._do_delete_slide,
+            "update_text": self._do_update_text,
+            "insert_chart": self._do_insert_chart,
+            "insert_image": self._do_insert_image,
+            "change_background": self._do_change_background,
+            "modify_layout": self._do_modify_layout,
+            "save": self._do_save,
+            "go_to_slide": self._do_go_to_slide,
+            "help": self._do_help,
+            "stop_listening": self._do_stop_listening,
+            "generate_presentation": self._do_generate_presentation,
+            "ai_enhance_slide": self._do_ai_enhance_slide,
+        }
+        if not self.enable_ai:
+            self._disable_ai()
+        
         self.logger.info("Voice-Controlled PowerPoint system initialized")
-        if enable_voice_feedback:
-            self.voice_to_text.speak("Voice controlled PowerPoint system ready")
+        self._feedback("Voice controlled PowerPoint system ready", cache=True)
     
     def start_voice_control(self):
         """Start the voice control system with continuous listening."""
@@ -87,24 +132,23 @@ class VoiceControlledPPT:
         self.logger.info("Say 'stop listening' to quit")
         
         self.is_running = True
+        self._stop_event.clear()
         
         # Add initial title slide
         self.ppt_generator.add_slide(
             layout_index=0, 
             title="AI-Powered Voice Presentation",
-            subtitle=f"Created on {time.strftime('%Y-%m-%d %H:%M:%S')}"
+            subtitle=f"Created on {datetime.now().isoformat(sep=' ', timespec='seconds')}"
         )
         
-        if self.voice_to_text.enable_voice_feedback:
-            self.voice_to_text.speak("Starting voice control. Say help for commands.")
+        self._feedback("Starting voice control. Say help for commands.", cache=True)
         
         # Start continuous listening
         self.voice_to_text.start_continuous_listening(self._process_voice_command)
         
         try:
-            # Keep the main thread alive
-            while self.is_running:
-                time.sleep(1)
+            # Keep the main thread alive until a stop command arrives
+            self._stop_event.wait()
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
         finally:
@@ -138,32 +182,62 @@ class VoiceControlledPPT:
         Returns:
             bool: True if command was processed successfully
         """
-        self.commands_processed += 1
+        return self.apply_command_text(self.enhance_command_text(text))
+    
+    def enhance_command_text(self, text: str) -> str:
+        """
+        Clarify recognized text with AI, if available.
         
-        # Enhance command with AI if available
-        if self.enable_ai and self.ai.is_available():
+        Args:
+            text (str): Recognized voice command text
+            
+        Returns:
+            str: Enhanced text, or the original if AI is unavailable
+        """
+        # Text that already matches a command pattern is used as is
+        if self._ai_ready and not self.command_parser.match_pattern(text):
             enhanced_text = self.ai.enhance_voice_command(text)
             if enhanced_text and enhanced_text != text:
-                self.logger.info(f"AI enhanced command: '{text}' → '{enhanced_text}'")
-                text = enhanced_text
+                self.logger.info("AI enhanced command: '%s' → '%s'", text, enhanced_text)
+                return enhanced_text
+        return text
+    
+    async def aenhance_command_text(self, text: str) -> str:
+        """Async variant of enhance_command_text."""
+        if self._ai_ready and not self.command_parser.match_pattern(text):
+            enhanced_text = await self.ai.aenhance_voice_command(text)
+            if enhanced_text and enhanced_text != text:
+                self.logger.info("AI enhanced command: '%s' → '%s'", text, enhanced_text)
+                return enhanced_text
+        return text
+    
+    def apply_command_text(self, text: str) -> bool:
+        """
+        Parse, validate and execute an (already enhanced) command text.
+        
+        Args:
+            text (str): Command text
+            
+        Returns:
+            bool: True if command was processed successfully
+        """
+        self.commands_processed += 1
         
         # Parse the command
         command = self.command_parser.parse_command(text)
         
         if not command:
-            self.logger.warning(f"Unknown command: '{text}'")
-            if self.voice_to_text.enable_voice_feedback:
-                self.voice_to_text.speak("I didn't understand that command. Say help for available commands.")
+            self.logger.warning("Unknown command: '%s'", text)
+            self._feedback("I didn't understand that command. Say help for available commands.", cache=True)
             return False
         
-        self.logger.info(f"Processing command: {command.action}")
+        self.logger.info("Processing command: %s", command.action)
         
         # Validate command
         is_valid, error_msg = self.command_parser.validate_command(command)
         if not is_valid:
-            self.logger.error(f"Command validation failed: {error_msg}")
-            if self.voice_to_text.enable_voice_feedback:
-                self.voice_to_text.speak(f"Command error: {error_msg}")
+            self.logger.error("Command validation failed: %s", error_msg)
+            self._feedback(f"Command error: {error_msg}")
             return False
         
         # Execute command
@@ -174,6 +248,7 @@ class VoiceControlledPPT:
             self.logger.info("Command executed successfully")
         else:
             self.logger.error("Command execution failed")
+            self._refresh_ai_ready()
         
         return success
     
@@ -188,280 +263,341 @@ class VoiceControlledPPT:
             bool: True if execution was successful
         """
         try:
-            action = command.action
-            params = command.parameters
-            
-            if action == "add_slide":
-                title = params.get("title", "New Slide")
-                layout = params.get("layout", 1)
-                
-                # Use AI to generate content if no specific title provided
-                if self.enable_ai and title == "New Slide":
-                    ai_content = self.ai.generate_slide_content("presentation slide", "content")
-                    if ai_content:
-                        title = ai_content.title
-                        layout = ai_content.suggested_layout
-                        self.ai_generations += 1
-                        self.logger.info(f"AI generated slide title: {title}")
-                
-                slide_index = self.ppt_generator.add_slide(
-                    layout_index=layout,
-                    title=title
-                )
-                
-                if slide_index >= 0:
-                    self.current_slide_index = slide_index
-                    if self.voice_to_text.enable_voice_feedback:
-                        self.voice_to_text.speak(f"Added slide: {title}")
-                    return True
-                    
-            elif action == "delete_slide":
-                slide_number = params.get("slide_number", 0)
-                success = self.ppt_generator.delete_slide(slide_number)
-                
-                if success and self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak(f"Deleted slide {slide_number + 1}")
-                return success
-                
-            elif action == "update_text":
-                updates = {}
-                
-                if "title" in params:
-                    updates["title"] = params["title"]
-                if "content" in params:
-                    updates["content"] = params["content"]
-                
-                # Use AI to enhance content if available
-                if self.enable_ai and self.ai.is_available():
-                    if "title" in updates:
-                        ai_content = self.ai.generate_slide_content(updates["title"], "content")
-                        if ai_content and not updates.get("content"):
-                            updates["content"] = ai_content.content
-                            self.ai_generations += 1
-                            self.logger.info("AI generated slide content")
-                
-                success = self.ppt_generator.update_text(
-                    slide_index=self.current_slide_index,
-                    text_updates=updates,
-                    font_size=16,
-                    bold=True
-                )
-                
-                if success and self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak("Updated slide text")
-                return success
-                
-            elif action == "insert_chart":
-                chart_type = params.get("chart_type", "column")
-                
-                # Use AI to generate relevant chart data
-                chart_data = None
-                if self.enable_ai and self.ai.is_available():
-                    chart_data = self.ai.suggest_chart_data("sample data visualization", chart_type)
-                    if chart_data:
-                        self.ai_generations += 1
-                        self.logger.info("AI generated chart data")
-                
-                # Fallback to sample data if AI not available or failed
-                if not chart_data:
-                    chart_data = {
-                        'categories': ['Q1', 'Q2', 'Q3', 'Q4'],
-                        'series': [
-                            {'name': 'Sales', 'values': [100, 120, 110, 140]},
-                            {'name': 'Profit', 'values': [20, 25, 22, 30]}
-                        ]
-                    }
-                
-                success = self.ppt_generator.insert_chart(
-                    slide_index=self.current_slide_index,
-                    chart_type=chart_type,
-                    data=chart_data
-                )
-                
-                if success and self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak(f"Added {chart_type} chart")
-                return success
-                
-            elif action == "insert_image":
-                image_path = params.get("image_path", "")
-                
-                if not os.path.exists(image_path):
-                    print(f"Image not found: {image_path}")
-                    if self.voice_to_text.enable_voice_feedback:
-                        self.voice_to_text.speak("Image file not found")
-                    return False
-                
-                success = self.ppt_generator.insert_image(
-                    slide_index=self.current_slide_index,
-                    image_path=image_path
-                )
-                
-                if success and self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak("Added image to slide")
-                return success
-                
-            elif action == "change_background":
-                color = params.get("color", (255, 255, 255))
-                
-                success = self.ppt_generator.change_background(
-                    slide_index=self.current_slide_index,
-                    background_type="solid",
-                    color=color
-                )
-                
-                if success and self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak("Changed background color")
-                return success
-                
-            elif action == "modify_layout":
-                layout_index = params.get("layout", 1)
-                
-                success = self.ppt_generator.modify_layout(
-                    slide_index=self.current_slide_index,
-                    new_layout_index=layout_index
-                )
-                
-                if success and self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak("Changed slide layout")
-                return success
-                
-            elif action == "save":
-                filename = params.get("filename", self.presentation_name)
-                
-                if not filename.endswith('.pptx'):
-                    filename += '.pptx'
-                
-                self.ppt_generator.save(filename)
+            handler = self._actions.get(command.action)
+            if handler is None:
+                self.logger.warning("Unknown action: %s", command.action)
+                return False
+            return handler(command.parameters)
                 
-                if self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak(f"Presentation saved as {filename}")
+        except Exception as e:
+            self.logger.error("Error executing command: %s", e)
+            self._refresh_ai_ready()
+            self._feedback("Command execution error", cache=True)
+            return False
+    
+    def _get_current_slide(self):
+        """
+        Get the slide object at current_slide_index.
+        
+        Indexing python-pptx's slide collection rebuilds the slide id list, so
+        the result is kept until the current slide changes or slides are deleted.
+        """
+        if self._current_slide is None:
+            self._current_slide = self.ppt_generator.presentation.slides[self.current_slide_index]
+        return self._current_slide
+    
+    def _refresh_ai_ready(self):
+        """Re-check whether the AI is usable, e.g. after its background connection test failed."""
+        if self.enable_ai and not self.ai.is_available():
+            self.logger.warning("Gemini AI not available - disabling AI features")
+            self._disable_ai()
+    
+    def _disable_ai(self):
+        """
+        Turn AI features off for the rest of the session.
+        
+        AI-only commands are rerouted straight to their "not available" reply,
+        so their handlers no longer need to be entered just to find that out.
+        """
+        self.enable_ai = False
+        self._ai_ready = False
+        for action, message in AI_UNAVAILABLE_MESSAGES.items():
+            self._actions[action] = functools.partial(self._report_ai_unavailable, message)
+    
+    def _report_ai_unavailable(self, message: str, params: Dict[str, Any]) -> bool:
+        """Handle an AI-only command while AI features are off."""
+        self._feedback(message, cache=True)
+        return False
+    
+    def _do_add_slide(self, params: Dict[str, Any]) -> bool:
+        """Add a slide, letting the AI pick a title when none was given."""
+        title = params.get("title", "New Slide")
+        layout = params.get("layout", 1)
+        
+        # Use AI to generate content if no specific title provided
+        if self._ai_ready and title == "New Slide":
+            ai_content = self.ai.generate_slide_content("presentation slide", "content")
+            if ai_content:
+                title = ai_content.title
+                layout = ai_content.suggested_layout
+                self.ai_generations += 1
+                self.logger.info("AI generated slide title: %s", title)
+        
+        slide_index = self.ppt_generator.add_slide(
+            layout_index=layout,
+            title=title
+        )
+        
+        if slide_index >= 0:
+            self.current_slide_index = slide_index
+            self._current_slide = None
+            self._feedback(f"Added slide: {title}")
+            return True
+        
+        return False
+    
+    def _do_delete_slide(self, params: Dict[str, Any]) -> bool:
+        """Delete the requested slide."""
+        slide_number = params.get("slide_number", 0)
+        success = self.ppt_generator.delete_slide(slide_number)
+        # Slides after the deleted one shift down a place
+        self._current_slide = None
+        
+        if success:
+            self._feedback(f"Deleted slide {slide_number + 1}")
+        return success
+    
+    def _do_update_text(self, params: Dict[str, Any]) -> bool:
+        """Update the current slide's text, filling in content with AI if available."""
+        updates = {}
+        
+        if "title" in params:
+            updates["title"] = params["title"]
+        if "content" in params:
+            updates["content"] = params["content"]
+        
+        # Use AI to enhance content if available
+        if self._ai_ready:
+            if "title" in updates:
+                ai_content = self.ai.generate_slide_content(updates["title"], "content")
+                if ai_content and not updates.get("content"):
+                    updates["content"] = ai_content.content
+                    self.ai_generations += 1
+                    self.logger.info("AI generated slide content")
+        
+        success = self.ppt_generator.update_text(
+            slide_index=self.current_slide_index,
+            text_updates=updates,
+            font_size=16,
+            bold=True
+        )
+        
+        if success:
+            self._feedback("Updated slide text", cache=True)
+        return success
+    
+    def _do_insert_chart(self, params: Dict[str, Any]) -> bool:
+        """Insert a chart on the current slide, with AI-suggested data if available."""
+        chart_type = params.get("chart_type", "column")
+        
+        # Use AI to generate relevant chart data
+        chart_data = None
+        if self._ai_ready:
+            chart_data = self.ai.suggest_chart_data("sample data visualization", chart_type)
+            if chart_data:
+                self.ai_generations += 1
+                self.logger.info("AI generated chart data")
+        
+        # Fallback to sample data if AI not available or failed
+        if not chart_data:
+            chart_data = {
+                'categories': ['Q1', 'Q2', 'Q3', 'Q4'],
+                'series': [
+                    {'name': 'Sales', 'values': [100, 120, 110, 140]},
+                    {'name': 'Profit', 'values': [20, 25, 22, 30]}
+                ]
+            }
+        
+        success = self.ppt_generator.insert_chart(
+            slide_index=self.current_slide_index,
+            chart_type=chart_type,
+            data=chart_data
+        )
+        
+        if success:
+            self._feedback(f"Added {chart_type} chart")
+        return success
+    
+    def _do_insert_image(self, params: Dict[str, Any]) -> bool:
+        """Insert an image file on the current slide."""
+        image_path = params.get("image_path", "")
+        
+        # Load the image once: this both checks the file and hands over its
+        # (cached) bytes, so insert_image does not stat and read it again
+        image = self.ppt_generator.read_image(image_path)
+        if image is None:
+            print(f"Image not found: {image_path}")
+            self._feedback("Image file not found", cache=True)
+            return False
+        
+        success = self.ppt_generator.insert_image(
+            slide_index=self.current_slide_index,
+            image_path=image_path,
+            image_stream=image
+        )
+        
+        if success:
+            self._feedback("Added image to slide", cache=True)
+        return success
+    
+    def _do_change_background(self, params: Dict[str, Any]) -> bool:
+        """Set a solid background color on the current slide."""
+        color = params.get("color", (255, 255, 255))
+        
+        success = self.ppt_generator.change_background(
+            slide_index=self.current_slide_index,
+            background_type="solid",
+            color=color
+        )
+        
+        if success:
+            self._feedback("Changed background color", cache=True)
+        return success
+    
+    def _do_modify_layout(self, params: Dict[str, Any]) -> bool:
+        """Change the current slide's layout."""
+        layout_index = params.get("layout", 1)
+        
+        success = self.ppt_generator.modify_layout(
+            slide_index=self.current_slide_index,
+            new_layout_index=layout_index
+        )
+        
+        if success:
+            self._feedback("Changed slide layout", cache=True)
+        return success
+    
+    def _do_save(self, params: Dict[str, Any]) -> bool:
+        """Save the presentation."""
+        filename = params.get("filename", self.presentation_name)
+        
+        if not filename.endswith('.pptx'):
+            filename += '.pptx'
+        
+        # The write finishes in the background while the next command is heard
+        self.ppt_generator.save_async(filename)
+        
+        self._feedback(f"Presentation saved as {filename}")
+        return True
+    
+    def _do_go_to_slide(self, params: Dict[str, Any]) -> bool:
+        """Make another slide the current one."""
+        slide_number = params.get("slide_number", 0)
+        max_slides = self.ppt_generator.get_slide_count()
+        
+        if 0 <= slide_number < max_slides:
+            self.current_slide_index = slide_number
+            self._current_slide = None
+            self._feedback(f"Moved to slide {slide_number + 1}")
+            return True
+        else:
+            self._feedback("Invalid slide number", cache=True)
+            return False
+    
+    def _do_help(self, params: Dict[str, Any]) -> bool:
+        """Print the available commands."""
+        print(self._help_text)
+        
+        self._feedback("Available commands printed to console", cache=True)
+        return True
+    
+    def _do_stop_listening(self, params: Dict[str, Any]) -> bool:
+        """Stop voice control."""
+        self.logger.info("Stopping voice control...")
+        self._feedback("Stopping voice control", cache=True)
+        
+        self.is_running = False
+        self._stop_event.set()
+        return True
+    
+    def _do_generate_presentation(self, params: Dict[str, Any]) -> bool:
+        """Build a whole presentation on a topic from an AI outline."""
+        topic = params.get("topic", "presentation")
+        slide_count = params.get("slide_count", 5)
+        
+        if self._ai_ready:
+            outline = self.ai.generate_presentation_outline(topic, slide_count)
+            if outline:
+                self._create_ai_presentation(outline, topic)
+                self.ai_generations += 1
+                self._feedback(f"Generated {len(outline)} slide presentation about {topic}")
                 return True
-                
-            elif action == "go_to_slide":
-                slide_number = params.get("slide_number", 0)
-                max_slides = self.ppt_generator.get_slide_count()
-                
-                if 0 <= slide_number < max_slides:
-                    self.current_slide_index = slide_number
-                    if self.voice_to_text.enable_voice_feedback:
-                        self.voice_to_text.speak(f"Moved to slide {slide_number + 1}")
-                    return True
-                else:
-                    if self.voice_to_text.enable_voice_feedback:
-                        self.voice_to_text.speak("Invalid slide number")
-                    return False
+        
+        self._feedback(AI_UNAVAILABLE_MESSAGES["generate_presentation"], cache=True)
+        return False
+    
+    def _do_ai_enhance_slide(self, params: Dict[str, Any]) -> bool:
+        """Regenerate the current slide's content with AI."""
+        if self._ai_ready:
+            # Get current slide title to use as context
+            if self.current_slide_index < self.ppt_generator.get_slide_count():
+                current_slide = self._get_current_slide()
+                title = current_slide.shapes.title.text if current_slide.shapes.title else "slide content"
+                
+                ai_content = self.ai.generate_slide_content(title, "content")
+                if ai_content:
+                    updates = {
+                        "title": ai_content.title,
+                        "content": ai_content.content
+                    }
                     
-            elif action == "help":
-                help_text = self.command_parser.get_help_text()
-                print(help_text)
-                
-                if self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak("Available commands printed to console")
-                return True
-                
-            elif action == "stop_listening":
-                self.logger.info("Stopping voice control...")
-                if self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak("Stopping voice control")
-                
-                self.is_running = False
-                return True
-            
-            # New AI-powered commands
-            elif action == "generate_presentation":
-                topic = params.get("topic", "presentation")
-                slide_count = params.get("slide_count", 5)
-                
-                if self.enable_ai and self.ai.is_available():
-                    outline = self.ai.generate_presentation_outline(topic, slide_count)
-                    if outline:
-                        self._create_ai_presentation(outline, topic)
+                    success = self.ppt_generator.update_text(
+                        slide_index=self.current_slide_index,
+                        text_updates=updates,
+                        font_size=16,
+                        bold=True
+                    )
+                    
+                    if success:
                         self.ai_generations += 1
-                        if self.voice_to_text.enable_voice_feedback:
-                            self.voice_to_text.speak(f"Generated {len(outline)} slide presentation about {topic}")
+                        self._feedback("Enhanced slide with AI content", cache=True)
                         return True
-                
-                if self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak("AI presentation generation not available")
-                return False
-            
-            elif action == "ai_enhance_slide":
-                if self.enable_ai and self.ai.is_available():
-                    # Get current slide title to use as context
-                    current_slides = self.ppt_generator.presentation.slides
-                    if self.current_slide_index < len(current_slides):
-                        current_slide = current_slides[self.current_slide_index]
-                        title = current_slide.shapes.title.text if current_slide.shapes.title else "slide content"
-                        
-                        ai_content = self.ai.generate_slide_content(title, "content")
-                        if ai_content:
-                            updates = {
-                                "title": ai_content.title,
-                                "content": ai_content.content
-                            }
-                            
-                            success = self.ppt_generator.update_text(
-                                slide_index=self.current_slide_index,
-                                text_updates=updates,
-                                font_size=16,
-                                bold=True
-                            )
-                            
-                            if success:
-                                self.ai_generations += 1
-                                if self.voice_to_text.enable_voice_feedback:
-                                    self.voice_to_text.speak("Enhanced slide with AI content")
-                                return True
-                
-                if self.voice_to_text.enable_voice_feedback:
-                    self.voice_to_text.speak("AI enhancement not available")
-                return False
-                
-            else:
-                self.logger.warning(f"Unknown action: {action}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Error executing command: {str(e)}")
-            if self.voice_to_text.enable_voice_feedback:
-                self.voice_to_text.speak("Command execution error")
-            return False
+        
+        self._feedback(AI_UNAVAILABLE_MESSAGES["ai_enhance_slide"], cache=True)
+        return False
     
     def _create_ai_presentation(self, outline: list, topic: str):
         """Create a full presentation from AI-generated outline."""
         try:
             # Clear existing slides (except first one)
-            slides_count = self.ppt_generator.get_slide_count()
-            for i in range(slides_count - 1, 0, -1):
-                self.ppt_generator.delete_slide(i)
+            self.ppt_generator.reset_to_first_slide()
+            self._current_slide = None
             
-            # Update first slide as title slide
-            title_content = self.ai.generate_slide_content(topic, "title") if self.ai else None
-            if title_content:
-                self.ppt_generator.update_text(0, {
-                    "title": title_content.title,
-                    "content": title_content.content
-                })
+            # Generate the slides concurrently, writing each as soon as it is ready
+            asyncio.run(self._build_ai_presentation(outline, topic))
             
-            # Generate slides from outline
-            for i, slide_title in enumerate(outline[1:], 1):  # Skip first title
-                ai_content = self.ai.generate_slide_content(slide_title, "content")
-                if ai_content:
-                    slide_index = self.ppt_generator.add_slide(
-                        layout_index=ai_content.suggested_layout,
-                        title=ai_content.title
-                    )
-                    
-                    if slide_index >= 0:
-                        self.ppt_generator.update_text(slide_index, {
-                            "content": ai_content.content
-                        })
-                        
             self.logger.info(f"Created AI presentation with {len(outline)} slides")
             
         except Exception as e:
             self.logger.error(f"Error creating AI presentation: {str(e)}")
     
+    async def _build_ai_presentation(self, outline: list, topic: str):
+        """
+        Fill the presentation from an outline while the AI is still generating it.
+        
+        Content for every slide is requested at once (the AI client caps how many
+        requests are in flight). Each slide is written as soon as it and every
+        slide before it have arrived, so python-pptx work on one slide overlaps
+        the generation of the next ones while slides stay in outline order.
+        """
+        title_task = asyncio.ensure_future(self.ai.agenerate_slide_content(topic, "title"))
+        
+        ready = {}
+        next_index = 0
+        async for index, ai_content in self.ai.iter_slide_content(outline[1:], "content"):  # Skip first title
+            ready[index] = ai_content
+            while next_index in ready:
+                ai_content = ready.pop(next_index)
+                next_index += 1
+                if not ai_content:
+                    continue
+                slide_index = self.ppt_generator.add_slide(
+                    layout_index=ai_content.suggested_layout,
+                    title=ai_content.title
+                )
+                if slide_index >= 0:
+                    self.ppt_generator.update_text(slide_index, {
+                        "content": ai_content.content
+                    })
+        
+        # Update first slide as title slide
+        title_content = await title_task
+        if title_content:
+            self.ppt_generator.update_text(0, {
+                "title": title_content.title,
+                "content": title_content.content
+            })
+    
     def _shutdown(self):
         """Shutdown the voice control system."""
         self.logger.info("Shutting down voice control system...")
@@ -469,11 +605,11 @@ class VoiceControlledPPT:
         # Stop voice recognition
         self.voice_to_text.stop_continuous_listening()
         
-        # Auto-save if enabled
+        # Auto-save if enabled, writing the file while the statistics are reported
+        pending_save = None
         if self.auto_save:
             filename = f"{self.presentation_name}_{int(time.time())}.pptx"
-            self.ppt_generator.save(filename)
-            self.logger.info(f"Auto-saved presentation as: {filename}")
+            pending_save = self.ppt_generator.save_async(filename)
         
         # Print statistics
         self.logger.info("Session Statistics:")
@@ -484,8 +620,17 @@ class VoiceControlledPPT:
         if self.enable_ai:
             self.logger.info(f"  AI generations: {self.ai_generations}")
         
-        if self.voice_to_text.enable_voice_feedback:
-            self.voice_to_text.speak("Voice control system stopped")
+        self._feedback("Voice control system stopped", cache=True)
+        
+        if pending_save is not None:
+            try:
+                pending_save.result()
+                self.logger.info(f"Auto-saved presentation as: {filename}")
+            except Exception as e:
+                self.logger.error(f"Auto-save failed: {str(e)}")
+        
+        # Release the microphone and audio output
+        self.voice_to_text.close()
         
         self.logger.info("Voice control system shutdown complete")
     
@@ -520,6 +665,28 @@ class VoiceControlledPPT:
         print("\n✅ System test complete")
         return True
     
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the background Gemini AI check to finish.
+        
+        Args:
+            timeout (float): Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            bool: True if AI features are confirmed available
+        """
+        if not self.enable_ai:
+            return False
+        
+        if self.ai.wait_until_ready(timeout):
+            return True
+        
+        # Still not confirmed: either the check timed out or it failed
+        if not self.ai.is_available():
+            self.logger.warning("Gemini AI not available - disabling AI features")
+            self._disable_ai()
+        return False
+    
     def get_current_status(self) -> Dict[str, Any]:
         """Get current system status."""
         return {
@@ -9,6 +9,9 @@ Required packages:
 - speechrecognition
 - pyaudio (for microphone access)
 - pyttsx3 (for text-to-speech feedback)
+- google-cloud-speech (optional, for streaming recognition with the 'google_cloud' engine)
+- webrtcvad (optional, skips recognizing continuous-mode phrases that contain no speech)
+- vosk (optional, offline recognition of the command vocabulary with the 'vosk' engine)
 
 Install with: pip install speechrecognition pyaudio pyttsx3
 """
@@ -17,10 +20,152 @@ import speech_recognition as sr
 import pyttsx3
 import time
 import threading
-from typing import Optional, Callable, Dict, List
-import re
+from typing import Optional, Callable, Dict, List, Tuple
+import functools
+import hashlib
+import os
 import queue
+import wave
+import json
+import http.client
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
 from config import get_config, get_logger
+from voice_command_parser import CHART_TYPE_MAP, COLOR_MAP, LAYOUT_MAP
+
+try:
+    import pyaudio
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+
+try:
+    from google.cloud import speech
+    GOOGLE_CLOUD_SPEECH_AVAILABLE = True
+except ImportError:
+    GOOGLE_CLOUD_SPEECH_AVAILABLE = False
+
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+try:
+    import vosk
+    VOSK_AVAILABLE = True
+except ImportError:
+    VOSK_AVAILABLE = False
+
+
+# Text-to-speech speaking rate in words per minute
+TTS_RATE = 150
+
+# Directory holding synthesized feedback phrases, replayed instead of re-running the TTS engine
+TTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "voice_ppt", "tts")
+
+# Cached phrases kept decoded in memory
+TTS_MEMORY_CACHE_SIZE = 64
+
+# Fixed feedback prompts synthesized into the phrase cache when the system starts
+FEEDBACK_PROMPTS = (
+    "Voice recognition system ready",
+    "Listening",
+    "Sorry, I couldn't understand that",
+    "Started continuous listening",
+    "Stopped listening",
+)
+
+# Google Web Speech API endpoint used by the default 'google' engine
+GOOGLE_SPEECH_HOST = "www.google.com"
+GOOGLE_SPEECH_PATH = "/speech-api/v2/recognize"
+
+# Seconds to wait for the Google Web Speech API
+GOOGLE_SPEECH_TIMEOUT = 10
+
+# Voice activity detector aggressiveness, from 0 (keeps most audio) to 3
+VAD_AGGRESSIVENESS = 2
+
+# Sample rate and frame length (10, 20 or 30 ms) the voice activity detector checks
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_MS = 30
+
+# Bytes in one voice activity detector frame of 16-bit samples
+VAD_FRAME_BYTES = VAD_SAMPLE_RATE * VAD_FRAME_MS // 1000 * 2
+
+# Share of speech frames below which a phrase is treated as noise and not recognized
+VAD_MIN_SPEECH_RATIO = 0.3
+
+# Sample rate the Vosk models are trained on
+VOSK_SAMPLE_RATE = 16000
+
+# Lowest word confidence accepted from Vosk before asking Google instead
+VOSK_MIN_CONFIDENCE = 0.7
+
+# Spoken slide numbers and the digits the command patterns expect
+VOSK_NUMBER_WORDS = {
+    "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
+    "six": "6", "seven": "7", "eight": "8", "nine": "9", "ten": "10",
+    "eleven": "11", "twelve": "12", "thirteen": "13", "fourteen": "14", "fifteen": "15",
+    "sixteen": "16", "seventeen": "17", "eighteen": "18", "nineteen": "19", "twenty": "20",
+    "first": "1st", "second": "2nd", "third": "3rd", "fourth": "4th", "fifth": "5th",
+    "sixth": "6th", "seventh": "7th", "eighth": "8th", "ninth": "9th", "tenth": "10th",
+}
+
+# Words of the fixed voice commands, besides colors, layouts, chart types and numbers
+VOSK_COMMAND_WORDS = (
+    "create", "add", "make", "new", "a", "an", "the", "slide", "with", "title",
+    "delete", "remove", "number", "change", "update", "set", "to", "should", "be",
+    "content", "text", "write", "type", "insert", "chart", "of", "image", "picture",
+    "from", "load", "open", "background", "layout", "use", "apply", "this",
+    "save", "export", "as", "file", "presentation", "go", "show", "help", "what",
+    "can", "you", "do", "list", "available", "commands", "stop", "quit", "exit",
+    "listening", "recognition",
+)
+
+# Vosk grammar restricting recognition to the command vocabulary; anything else comes back as [unk]
+VOSK_GRAMMAR = json.dumps(sorted(
+    {*VOSK_COMMAND_WORDS, *VOSK_NUMBER_WORDS,
+     *(word for name in (*COLOR_MAP, *LAYOUT_MAP, *CHART_TYPE_MAP) for word in name.split())}
+) + ["[unk]"])
+
+# Seconds continuous mode waits for a phrase to start before checking for a stop request;
+# the microphone stays open, so a short wait costs nothing but bounds how long stopping takes
+CONTINUOUS_LISTEN_TIMEOUT = 0.5
+
+# Phrases one VoiceToText recognizes at the same time in continuous mode
+RECOGNITION_WORKERS = 4
+
+# Recognition threads shared by every VoiceToText in the process
+RECOGNITION_POOL_SIZE = 8
+
+# Engines usable with the packages installed; Google needs none beyond speech_recognition
+AVAILABLE_ENGINES = (
+    "google",
+    *(("google_cloud",) if GOOGLE_CLOUD_SPEECH_AVAILABLE else ()),
+    *(("vosk",) if VOSK_AVAILABLE else ()),
+    *(("sphinx",) if hasattr(sr.Recognizer, "recognize_sphinx") else ()),
+)
+
+# Microphone capture rate; speech recognition needs no more than 16 kHz, and
+# capturing less keeps uploads and FLAC encoding about three times smaller than at 48 kHz
+CAPTURE_SAMPLE_RATE = 16000
+
+# Frames read from the microphone at a time
+CAPTURE_CHUNK_SIZE = 1024
+
+# Seconds of silence that end a phrase; voice commands are short, so this is
+# well below the speech_recognition default of 0.8
+PAUSE_THRESHOLD = 0.5
+
+# Seconds of silence kept around a phrase; must not exceed the pause threshold
+NON_SPEAKING_DURATION = 0.3
+
+# Seconds of speech needed before a sound counts as a phrase rather than a click
+PHRASE_THRESHOLD = 0.15
+
+# Longest phrase in seconds; enough for "create new slide with title ..."
+PHRASE_TIME_LIMIT = 6
 
 
 class VoiceToText:
@@ -32,73 +177,323 @@ class VoiceToText:
     def __init__(self, 
                  engine: str = "google", 
                  language: str = "en-US",
-                 enable_voice_feedback: bool = True):
+                 enable_voice_feedback: bool = True,
+                 pause_threshold: float = PAUSE_THRESHOLD,
+                 phrase_time_limit: Optional[float] = PHRASE_TIME_LIMIT):
         """
         Initialize the Voice to Text system.
         
         Args:
-            engine (str): Speech recognition engine ('google', 'sphinx', 'bing', 'azure')
+            engine (str): Speech recognition engine ('google', 'google_cloud', 'vosk', 'sphinx', 'bing', 'azure')
             language (str): Language for speech recognition (default: 'en-US')
             enable_voice_feedback (bool): Enable text-to-speech feedback
+            pause_threshold (float): Seconds of silence that end a phrase;
+                raise it for dictation, where speakers pause mid-sentence
+            phrase_time_limit (float): Longest phrase in seconds, or None for no limit
         """
         self.config = get_config()
         self.logger = get_logger()
         
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        self.recognizer.pause_threshold = pause_threshold
+        self.recognizer.non_speaking_duration = min(NON_SPEAKING_DURATION, pause_threshold)
+        self.recognizer.phrase_threshold = PHRASE_THRESHOLD
+        self.phrase_time_limit = phrase_time_limit
+        self.microphone = sr.Microphone(sample_rate=CAPTURE_SAMPLE_RATE, chunk_size=CAPTURE_CHUNK_SIZE)
+        # Open microphone stream, kept between phrases and calls; guarded by the
+        # microphone lock so only one caller reads from it at a time
+        self._source = None
+        self._microphone_lock = threading.Lock()
         self.engine = engine.lower()
         self.language = language
+        # Recognition function for the engine, looked up once; unknown engines use Google
+        self._recognize_with_engine = {
+            "google": self._recognize_google,
+            # Requires Google Cloud credentials
+            "google_cloud": (
+                self._recognize_google_cloud if GOOGLE_CLOUD_SPEECH_AVAILABLE
+                else lambda audio: self.recognizer.recognize_google_cloud(audio, language=self.language)
+            ),
+            "vosk": self._recognize_vosk,
+            "sphinx": lambda audio: self.recognizer.recognize_sphinx(audio),
+            # Requires Bing API key
+            "bing": lambda audio: self.recognizer.recognize_bing(audio, language=self.language),
+            # Requires Azure API key
+            "azure": lambda audio: self.recognizer.recognize_azure(audio, language=self.language),
+        }.get(self.engine, self._recognize_google)
         self.is_listening = False
-        self.command_queue = queue.Queue()
+        # Set to make the continuous listening worker stop
+        self._stop_listening = threading.Event()
+        # Recognitions for the continuous mode callback, in the order the phrases were spoken
+        self.command_queue = queue.SimpleQueue()
+        # Continuous mode keeps listening while earlier phrases are still being
+        # recognized; the cap keeps one busy session from filling the shared pool
+        self._recognition_slots = threading.BoundedSemaphore(RECOGNITION_WORKERS)
+        # Filters coughs and background noise out before they reach the recognition service
+        self._vad = webrtcvad.Vad(VAD_AGGRESSIVENESS) if WEBRTCVAD_AVAILABLE else None
         self.listening_thread = None
+        self.callback_thread = None
+        # Offline command model for the vosk engine, and a recognizer for each recognizing thread
+        self._vosk_model = self._load_vosk_model() if self.engine == "vosk" else None
+        self._vosk_local = threading.local()
+        # pyttsx3 engines cannot run two utterances at once
+        self._speech_lock = threading.Lock()
+        # Feedback waiting to be spoken, in order, by the speech thread
+        self._speech_queue = queue.SimpleQueue()
+        self._speech_thread = None
+        self._speech_thread_lock = threading.RLock()
+        
+        # Output device for cached phrases, opened on first use
+        self._audio = None
+        self._phrase_audio = functools.lru_cache(maxsize=TTS_MEMORY_CACHE_SIZE)(self._load_phrase_audio)
+        # Part of every cached phrase's key, so changing the voice re-synthesizes
+        self._voice_key = ""
         
         # Voice feedback setup
         self.enable_voice_feedback = enable_voice_feedback
         if enable_voice_feedback:
             try:
                 self.tts_engine = pyttsx3.init()
-                self.tts_engine.setProperty('rate', 150)  # Speaking rate
+                self.tts_engine.setProperty('rate', TTS_RATE)  # Speaking rate
                 voices = self.tts_engine.getProperty('voices')
                 if voices:
                     self.tts_engine.setProperty('voice', voices[0].id)
+                    self._voice_key = voices[0].id
             except Exception as e:
                 self.logger.warning(f"Could not initialize text-to-speech: {e}")
                 self.enable_voice_feedback = False
+        if self.enable_voice_feedback and PYAUDIO_AVAILABLE:
+            self._prepare_feedback_prompts()
         
         # Calibrate microphone for ambient noise
         self._calibrate_microphone()
         
+        # Connect to the recognition service while the user is still getting ready
+        threading.Thread(target=self._prewarm_recognition, name="speech-prewarm", daemon=True).start()
+        
         self.logger.info(f"Voice recognition initialized with {engine} engine")
         if self.enable_voice_feedback:
-            self.speak("Voice recognition system ready")
+            self.speak("Voice recognition system ready", cache=True)
     
     def _calibrate_microphone(self):
         """Calibrate microphone for ambient noise."""
         self.logger.info("Calibrating microphone for ambient noise...")
         try:
-            with self.microphone as source:
+            with self._microphone_lock:
+                source = self._open_microphone()
                 self.recognizer.adjust_for_ambient_noise(source, duration=1)
             self.logger.info("Microphone calibrated successfully")
         except Exception as e:
             self.logger.warning(f"Could not calibrate microphone: {e}")
     
-    def speak(self, text: str):
+    def _open_microphone(self):
+        """
+        Get the open microphone stream, opening the device if needed.
+        
+        Must be called with the microphone lock held.
+        """
+        if self._source is None:
+            try:
+                source = self.microphone.__enter__()
+            except (OSError, ValueError):
+                source = None
+            # Depending on the version, speech_recognition raises or leaves the
+            # stream unset when the device rejects the requested rate
+            if getattr(source, "stream", None) is None and self.microphone.SAMPLE_RATE == CAPTURE_SAMPLE_RATE:
+                self.logger.info(f"Microphone cannot capture at {CAPTURE_SAMPLE_RATE} Hz, using its native rate")
+                self.microphone = sr.Microphone(chunk_size=CAPTURE_CHUNK_SIZE)
+                source = self.microphone.__enter__()
+            self._source = source
+        return self._source
+    
+    def _close_microphone(self):
+        """
+        Close the microphone stream if it is open.
+        
+        Must be called with the microphone lock held.
+        """
+        if self._source is None:
+            return
+        try:
+            self.microphone.__exit__(None, None, None)
+        except Exception as e:
+            self.logger.debug(f"Error closing microphone: {e}")
+        finally:
+            self._source = None
+    
+    def _discard_buffered_audio(self, source):
+        """Drop audio captured since the last read, such as the spoken prompt."""
+        pyaudio_stream = getattr(source.stream, "pyaudio_stream", None)
+        if pyaudio_stream is None:
+            return
+        available = pyaudio_stream.get_read_available()
+        if available:
+            source.stream.read(available)
+    
+    def close(self):
+        """Release the microphone and audio output; they are reopened on next use."""
+        if self.is_listening:
+            self.stop_continuous_listening()
+        with self._microphone_lock:
+            self._close_microphone()
+        # Let queued feedback finish before the audio output goes away
+        with self._speech_thread_lock:
+            speech_thread, self._speech_thread = self._speech_thread, None
+            if speech_thread is not None:
+                self._speech_queue.put(None)
+        if speech_thread is not None:
+            speech_thread.join()
+        with self._speech_lock:
+            if self._audio is not None:
+                self._audio.terminate()
+                self._audio = None
+    
+    def speak(self, text: str, cache: bool = False):
         """
-        Convert text to speech for voice feedback.
+        Convert text to speech for voice feedback without waiting for it to be spoken.
         
         Args:
             text (str): Text to speak
+            cache (bool): Keep the synthesized audio on disk and replay it next
+                time; meant for fixed phrases, not ones built from user input
         """
         if not self.enable_voice_feedback:
             return
-            
+        
+        with self._speech_thread_lock:
+            if self._speech_thread is None:
+                self._speech_thread = threading.Thread(
+                    target=self._speech_worker, name="voice-feedback", daemon=True
+                )
+                self._speech_thread.start()
+            self._speech_queue.put((text, cache))
+    
+    def speak_sync(self, text: str, cache: bool = False):
+        """
+        Convert text to speech and wait until it, and any feedback queued before it, has been spoken.
+        
+        Args:
+            text (str): Text to speak
+            cache (bool): Keep the synthesized audio on disk and replay it next time
+        """
+        if not self.enable_voice_feedback:
+            return
+        
+        spoken = threading.Event()
+        with self._speech_thread_lock:
+            self.speak(text, cache)
+            # Marker right behind the text; set once the speech thread reaches it
+            self._speech_queue.put(spoken)
+        spoken.wait()
+    
+    def wait_for_feedback(self):
+        """Wait until all feedback queued so far has been spoken."""
+        with self._speech_thread_lock:
+            if self._speech_thread is None:
+                return
+            spoken = threading.Event()
+            self._speech_queue.put(spoken)
+        spoken.wait()
+    
+    def _speech_worker(self):
+        """Worker thread speaking queued feedback one phrase at a time."""
+        while (item := self._speech_queue.get()) is not None:
+            if isinstance(item, threading.Event):
+                item.set()
+            else:
+                self._say(*item)
+    
+    def _say(self, text: str, cache: bool):
+        """Speak text on the calling thread, from the phrase cache when allowed."""
         try:
             self.logger.debug(f"Speaking: {text}")
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+            with self._speech_lock:
+                if cache and PYAUDIO_AVAILABLE:
+                    try:
+                        if self._play_cached_phrase(text):
+                            return
+                    except Exception as e:
+                        self.logger.debug(f"Cached phrase playback failed, speaking live: {e}")
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
         except Exception as e:
             self.logger.error(f"Error in text-to-speech: {e}")
     
+    def _prepare_feedback_prompts(self):
+        """Synthesize any missing feedback prompts into the phrase cache and load them into memory."""
+        try:
+            with self._speech_lock:
+                for text in FEEDBACK_PROMPTS:
+                    self._phrase_audio(self._cached_phrase_path(text))
+        except Exception as e:
+            self.logger.debug(f"Could not prepare feedback prompts: {e}")
+    
+    def _cached_phrase_path(self, text: str) -> str:
+        """
+        Get the phrase cache file for a phrase, synthesizing it first if needed.
+        
+        Must be called with the speech lock held.
+        
+        Args:
+            text (str): Phrase to look up
+            
+        Returns:
+            str: Path of the cached audio file
+        """
+        digest = hashlib.blake2b(f"{self._voice_key}\x00{TTS_RATE}\x00{text}".encode(), digest_size=16)
+        path = os.path.join(TTS_CACHE_DIR, f"{digest.hexdigest()}.wav")
+        
+        if not os.path.exists(path):
+            os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+            # Synthesize next to the final name so a half-written file is never replayed
+            partial_path = f"{path[:-4]}.partial.wav"
+            self.tts_engine.save_to_file(text, partial_path)
+            self.tts_engine.runAndWait()
+            os.replace(partial_path, path)
+        return path
+    
+    def _play_cached_phrase(self, text: str) -> bool:
+        """
+        Play a phrase from the audio cache, synthesizing it into the cache first if needed.
+        
+        Must be called with the speech lock held.
+        
+        Args:
+            text (str): Phrase to play
+            
+        Returns:
+            bool: True if the phrase was played, False if the engine's output
+                cannot be replayed (it is then spoken live as before)
+        """
+        audio = self._phrase_audio(self._cached_phrase_path(text))
+        if audio is None:
+            return False
+        
+        params, frames = audio
+        if self._audio is None:
+            self._audio = pyaudio.PyAudio()
+        stream = self._audio.open(
+            format=self._audio.get_format_from_width(params.sampwidth),
+            channels=params.nchannels,
+            rate=params.framerate,
+            output=True
+        )
+        try:
+            stream.write(frames)
+        finally:
+            stream.stop_stream()
+            stream.close()
+        return True
+    
+    def _load_phrase_audio(self, path: str) -> Optional[Tuple[tuple, bytes]]:
+        """Read a cached phrase's WAV parameters and frames, or None if it is not playable WAV audio."""
+        try:
+            with wave.open(path, 'rb') as wav:
+                frames = wav.readframes(wav.getnframes())
+                return (wav.getparams(), frames) if frames else None
+        except (OSError, EOFError, wave.Error):
+            return None
+    
     def listen_once(self, timeout: int = 5) -> Optional[str]:
         """
         Listen for a single voice command.
@@ -112,22 +507,29 @@ class VoiceToText:
         try:
             self.logger.info("Listening for voice input...")
             if self.enable_voice_feedback:
-                self.speak("Listening")
+                # Finish the prompt before capturing, so it is not heard as a command
+                self.speak_sync("Listening", cache=True)
             
-            with self.microphone as source:
-                # Listen for audio with timeout
-                audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=10)
+            if self.engine == "google_cloud" and GOOGLE_CLOUD_SPEECH_AVAILABLE:
+                # Recognition runs while the user is still speaking
+                text = self.listen_once_streaming(timeout).lower()
+            else:
+                with self._microphone_lock:
+                    source = self._open_microphone()
+                    self._discard_buffered_audio(source)
+                    # Listen for audio with timeout
+                    audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=self.phrase_time_limit)
+                    
+                self.logger.debug("Processing speech recognition...")
                 
-            self.logger.debug("Processing speech recognition...")
-            
-            # Recognize speech using selected engine
-            text = self._recognize_speech(audio)
+                # Recognize speech using selected engine
+                text = self._recognize_speech(audio)
             
             if text:
                 self.logger.info(f"Speech recognized: '{text}'")
                 if self.enable_voice_feedback:
                     self.speak(f"I heard: {text}")
-                return text.lower()
+                return text
             else:
                 self.logger.warning("No speech recognized")
                 return None
@@ -138,7 +540,7 @@ class VoiceToText:
         except sr.UnknownValueError:
             self.logger.warning("Could not understand speech")
             if self.enable_voice_feedback:
-                self.speak("Sorry, I couldn't understand that")
+                self.speak("Sorry, I couldn't understand that", cache=True)
             return None
         except sr.RequestError as e:
             self.logger.error(f"Recognition service error: {e}")
@@ -147,6 +549,234 @@ class VoiceToText:
             self.logger.error(f"Unexpected error in speech recognition: {e}")
             return None
     
+    def listen_once_streaming(self, timeout: int = 5) -> Optional[str]:
+        """
+        Recognize a single utterance with Google Cloud Speech while it is being spoken.
+        
+        Microphone audio is streamed to the service as it is captured instead of
+        being uploaded after the phrase ends, so the transcript arrives shortly
+        after the user stops talking. The service ends the utterance itself
+        (single_utterance mode).
+        
+        Args:
+            timeout (int): Seconds to wait for speech to start
+            
+        Returns:
+            str: Recognized text
+            
+        Raises:
+            sr.WaitTimeoutError: If nothing was said before the time ran out
+            sr.UnknownValueError: If speech ended but could not be transcribed
+        """
+        client = get_speech_client()
+        
+        with self._microphone_lock:
+            source = self._open_microphone()
+            self._discard_buffered_audio(source)
+            streaming_config = speech.StreamingRecognitionConfig(
+                config=speech.RecognitionConfig(
+                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                    sample_rate_hertz=source.SAMPLE_RATE,
+                    language_code=self.language,
+                ),
+                single_utterance=True,
+                interim_results=False,
+            )
+            deadline = time.monotonic() + timeout + (self.phrase_time_limit or PHRASE_TIME_LIMIT)
+            finished = threading.Event()
+            # Held around each read, so the request stream (consumed on a gRPC
+            # thread) never reads after this call has handed the microphone back
+            read_lock = threading.Lock()
+            speech_ended = False
+            
+            def audio_requests():
+                while not finished.is_set() and time.monotonic() < deadline:
+                    with read_lock:
+                        if finished.is_set():
+                            return
+                        chunk = source.stream.read(source.CHUNK)
+                    yield speech.StreamingRecognizeRequest(audio_content=chunk)
+            
+            try:
+                responses = client.streaming_recognize(
+                    config=streaming_config, requests=audio_requests()
+                )
+                for response in responses:
+                    for result in response.results:
+                        if result.is_final and result.alternatives:
+                            return result.alternatives[0].transcript
+                    if (response.speech_event_type ==
+                            speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE):
+                        # Stop sending audio; the final result follows
+                        speech_ended = True
+                        finished.set()
+            finally:
+                with read_lock:
+                    finished.set()
+        
+        if speech_ended:
+            raise sr.UnknownValueError()
+        raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+    
+    def _load_vosk_model(self):
+        """Load the Vosk model for the vosk engine, or None to recognize with Google instead."""
+        if not VOSK_AVAILABLE:
+            self.logger.warning("vosk package not installed, using Google recognition. Install with: pip install vosk")
+            return None
+        try:
+            return load_vosk_model(self.config.vosk_model_path)
+        except Exception as e:
+            self.logger.warning(f"Could not load Vosk model from {self.config.vosk_model_path}: {e}")
+            return None
+    
+    def _recognize_vosk(self, audio) -> str:
+        """
+        Recognize a captured phrase offline against the command vocabulary.
+        
+        Phrases outside the vocabulary (titles, file names, free text) or
+        recognized with low confidence are passed on to Google.
+        
+        Args:
+            audio: Audio data from microphone
+            
+        Returns:
+            str: Recognized text
+        """
+        if self._vosk_model is None:
+            return self._recognize_google(audio)
+        
+        recognizer = getattr(self._vosk_local, "recognizer", None)
+        if recognizer is None:
+            recognizer = vosk.KaldiRecognizer(self._vosk_model, VOSK_SAMPLE_RATE, VOSK_GRAMMAR)
+            recognizer.SetWords(True)
+            self._vosk_local.recognizer = recognizer
+        
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=VOSK_SAMPLE_RATE, convert_width=2))
+        # Ends the utterance, so the recognizer is ready for the next phrase
+        result = json.loads(recognizer.FinalResult())
+        words = result.get("result")
+        text = result.get("text", "")
+        if words and "[unk]" not in text and min(word["conf"] for word in words) >= VOSK_MIN_CONFIDENCE:
+            return " ".join(VOSK_NUMBER_WORDS.get(word, word) for word in text.split())
+        
+        self.logger.debug(f"Vosk result '{text}' not confident, recognizing with Google")
+        return self._recognize_google(audio)
+    
+    def _prewarm_recognition(self):
+        """Set up the recognition service connection ahead of the first phrase."""
+        try:
+            if self.engine == "google_cloud":
+                if GOOGLE_CLOUD_SPEECH_AVAILABLE:
+                    get_speech_client()
+            elif self.engine not in ("sphinx", "bing", "azure"):
+                # Google, and Vosk's fallback: resolve, connect and finish the TLS
+                # handshake now, and run the FLAC encoder once so its setup is done
+                if self.config.google_speech_api_key:
+                    connection = http.client.HTTPSConnection(GOOGLE_SPEECH_HOST, timeout=GOOGLE_SPEECH_TIMEOUT)
+                    connection.connect()
+                    _idle_google_connections.put(connection)
+                sr.AudioData(bytes(3200), 16000, 2).get_flac_data()
+        except Exception as e:
+            self.logger.debug(f"Could not pre-warm speech recognition: {e}")
+    
+    def _recognize_google_cloud(self, audio) -> Optional[str]:
+        """
+        Recognize a captured phrase with Google Cloud Speech.
+        
+        The phrase is sent as raw 16-bit PCM, which the service accepts
+        directly, instead of being FLAC-encoded by an external process first.
+        
+        Args:
+            audio: Audio data from microphone
+            
+        Returns:
+            str: Recognized text or None
+        """
+        response = get_speech_client().recognize(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=audio.sample_rate,
+                language_code=self.language,
+            ),
+            audio=speech.RecognitionAudio(content=audio.get_raw_data(convert_width=2)),
+        )
+        for result in response.results:
+            if result.alternatives:
+                return result.alternatives[0].transcript
+        return None
+    
+    def _recognize_google(self, audio) -> str:
+        """
+        Recognize a captured phrase with the Google Web Speech API.
+        
+        With an API key configured, the request is sent over a kept-alive
+        connection so each phrase does not pay for a new TCP and TLS handshake.
+        Without one, recognize_google sends it with speech_recognition's
+        default key.
+        
+        Args:
+            audio: Audio data from microphone
+            
+        Returns:
+            str: Recognized text
+            
+        Raises:
+            sr.UnknownValueError: If the speech could not be transcribed
+            sr.RequestError: If the request failed
+        """
+        api_key = self.config.google_speech_api_key
+        if not api_key:
+            return self.recognizer.recognize_google(audio, language=self.language)
+        
+        sample_rate = max(audio.sample_rate, 8000)
+        flac_data = audio.get_flac_data(
+            convert_rate=None if audio.sample_rate >= 8000 else 8000, convert_width=2
+        )
+        query = urlencode({"client": "chromium", "lang": self.language,
+                           "key": api_key, "pFilter": 0})
+        response_text = self._post_google_speech(
+            f"{GOOGLE_SPEECH_PATH}?{query}", flac_data,
+            {"Content-Type": f"audio/x-flac; rate={sample_rate}"}
+        )
+        return parse_google_speech_response(response_text)
+    
+    def _post_google_speech(self, url: str, body: bytes, headers: Dict[str, str]) -> str:
+        """
+        POST to the Google Web Speech API on an idle kept-alive connection, or a new one.
+        
+        Args:
+            url (str): Request path and query
+            body (bytes): Request body
+            headers (dict): Request headers
+            
+        Returns:
+            str: Response body
+            
+        Raises:
+            sr.RequestError: If the request failed
+        """
+        while True:
+            try:
+                connection = _idle_google_connections.get_nowait()
+                fresh = False
+            except queue.Empty:
+                connection = http.client.HTTPSConnection(GOOGLE_SPEECH_HOST, timeout=GOOGLE_SPEECH_TIMEOUT)
+                fresh = True
+            try:
+                connection.request("POST", url, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                connection.close()
+                if fresh:
+                    raise sr.RequestError(f"recognition connection failed: {e}")
+                # The server closed the idle connection; retry on another one
+                continue
+            _idle_google_connections.put(connection)
+            if response.status != 200:
+                raise sr.RequestError(f"recognition request failed: {response.reason}")
+            return data.decode("utf-8")
+    
     def _recognize_speech(self, audio) -> Optional[str]:
         """
         Recognize speech using the selected engine.
@@ -155,22 +785,12 @@ class VoiceToText:
             audio: Audio data from microphone
             
         Returns:
-            str: Recognized text or None
+            str: Recognized text in lower case, or None
         """
         try:
-            if self.engine == "google":
-                return self.recognizer.recognize_google(audio, language=self.language)
-            elif self.engine == "sphinx":
-                return self.recognizer.recognize_sphinx(audio)
-            elif self.engine == "bing":
-                # Requires Bing API key
-                return self.recognizer.recognize_bing(audio, language=self.language)
-            elif self.engine == "azure":
-                # Requires Azure API key
-                return self.recognizer.recognize_azure(audio, language=self.language)
-            else:
-                # Default to Google
-                return self.recognizer.recognize_google(audio, language=self.language)
+            # Lower-cased here, on the recognizing thread, so callers get command-ready text
+            text = self._recognize_with_engine(audio)
+            return text.lower() if text else None
         except Exception as e:
             self.logger.error(f"Recognition error with {self.engine}: {e}")
             return None
@@ -187,16 +807,24 @@ class VoiceToText:
             return
         
         self.is_listening = True
+        self._stop_listening.clear()
         self.listening_thread = threading.Thread(
-            target=self._continuous_listen_worker, 
-            args=(callback,)
+            target=self._continuous_listen_worker
         )
         self.listening_thread.daemon = True
         self.listening_thread.start()
         
+        # Commands run on their own thread, so a slow callback never holds up listening
+        self.callback_thread = threading.Thread(
+            target=self._command_callback_worker,
+            args=(callback,)
+        )
+        self.callback_thread.daemon = True
+        self.callback_thread.start()
+        
         self.logger.info("Started continuous listening mode")
         if self.enable_voice_feedback:
-            self.speak("Started continuous listening")
+            self.speak("Started continuous listening", cache=True)
     
     def stop_continuous_listening(self):
         """Stop continuous listening."""
@@ -205,32 +833,50 @@ class VoiceToText:
             return
         
         self.is_listening = False
+        self._stop_listening.set()
         if self.listening_thread:
+            # At most one wait for a phrase, or the phrase being captured, away
             self.listening_thread.join(timeout=2)
+        # Wake the callback thread; it may be the one stopping us, so never join it from itself
+        self.command_queue.put(None)
+        if self.callback_thread and self.callback_thread is not threading.current_thread():
+            self.callback_thread.join(timeout=2)
         
         self.logger.info("Stopped continuous listening mode")
         if self.enable_voice_feedback:
-            self.speak("Stopped listening")
+            self.speak("Stopped listening", cache=True)
     
-    def _continuous_listen_worker(self, callback: Callable[[str], None]):
+    def _continuous_listen_worker(self):
         """Worker thread for continuous listening."""
         self.logger.debug("Continuous listening worker thread started")
         
-        while self.is_listening:
+        while not self._stop_listening.is_set():
             try:
-                with self.microphone as source:
+                # The stream stays open between phrases, so audio spoken while
+                # the previous phrase was handed off is not lost
+                with self._microphone_lock:
+                    source = self._open_microphone()
                     # Listen for audio with shorter timeout for responsiveness
-                    audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=10)
+                    audio = self.recognizer.listen(
+                        source, timeout=CONTINUOUS_LISTEN_TIMEOUT, phrase_time_limit=self.phrase_time_limit
+                    )
                 
-                if not self.is_listening:
+                if self._stop_listening.is_set():
                     break
                 
-                # Recognize speech
-                text = self._recognize_speech(audio)
+                # Resample once for both the voice activity detector and Vosk
+                if self._vad is not None or self._vosk_model is not None:
+                    audio = self._to_16k_pcm(audio)
+                
+                if not self._contains_speech(audio):
+                    self.logger.debug("Skipping phrase without speech")
+                    continue
                 
-                if text and self.is_listening:
-                    self.logger.info(f"Continuous mode recognized: '{text}'")
-                    callback(text.lower())
+                # Recognize speech in the background and go straight back to listening
+                self._recognition_slots.acquire()
+                future = get_recognition_pool().submit(self._recognize_speech, audio)
+                future.add_done_callback(lambda _: self._recognition_slots.release())
+                self.command_queue.put(future)
                     
             except sr.WaitTimeoutError:
                 # Normal timeout, continue listening
@@ -240,10 +886,74 @@ class VoiceToText:
                 continue
             except Exception as e:
                 self.logger.error(f"Error in continuous listening: {e}")
-                time.sleep(0.5)  # Brief pause before retrying
+                # Reopen the microphone on the next attempt
+                with self._microphone_lock:
+                    self._close_microphone()
+                # Brief pause before retrying, cut short by a stop request
+                self._stop_listening.wait(0.5)
         
         self.logger.debug("Continuous listening worker thread stopped")
     
+    def _to_16k_pcm(self, audio):
+        """
+        Get a phrase as 16 kHz 16-bit audio, the format webrtcvad and Vosk work on.
+        
+        Converting it up front lets both reuse the result; asking AudioData for
+        the format it already has returns its frames without converting again.
+        
+        Args:
+            audio: Audio data from microphone
+            
+        Returns:
+            sr.AudioData: The phrase at VAD_SAMPLE_RATE (== VOSK_SAMPLE_RATE), 2 bytes per sample
+        """
+        if audio.sample_rate == VAD_SAMPLE_RATE and audio.sample_width == 2:
+            return audio
+        return sr.AudioData(
+            audio.get_raw_data(convert_rate=VAD_SAMPLE_RATE, convert_width=2), VAD_SAMPLE_RATE, 2
+        )
+    
+    def _contains_speech(self, audio) -> bool:
+        """
+        Check whether enough of a captured phrase is speech to be worth recognizing.
+        
+        Args:
+            audio: Audio data from microphone
+            
+        Returns:
+            bool: False if the phrase is mostly noise; always True without webrtcvad
+        """
+        if self._vad is None:
+            return True
+        
+        # Frames are views into the phrase's buffer rather than copies of it
+        raw = memoryview(audio.get_raw_data(convert_rate=VAD_SAMPLE_RATE, convert_width=2))
+        frame_count = len(raw) // VAD_FRAME_BYTES
+        if not frame_count:
+            return False
+        
+        # Stop as soon as enough speech has been found
+        speech_needed = frame_count * VAD_MIN_SPEECH_RATIO
+        speech_frames = 0
+        for offset in range(0, frame_count * VAD_FRAME_BYTES, VAD_FRAME_BYTES):
+            if self._vad.is_speech(raw[offset:offset + VAD_FRAME_BYTES], VAD_SAMPLE_RATE):
+                speech_frames += 1
+                if speech_frames >= speech_needed:
+                    return True
+        return False
+    
+    def _command_callback_worker(self, callback: Callable[[str], None]):
+        """Worker thread passing recognized commands to the callback in spoken order."""
+        while (future := self.command_queue.get()) is not None:
+            text = future.result()
+            if not text or not self.is_listening:
+                continue
+            self.logger.info(f"Continuous mode recognized: '{text}'")
+            try:
+                callback(text)
+            except Exception as e:
+                self.logger.error(f"Error handling voice command '{text}': {e}")
+    
     def test_microphone(self):
         """Test microphone and recognition system."""
         self.logger.info("Starting microphone test")
@@ -265,13 +975,103 @@ class VoiceToText:
     
     def get_available_engines(self) -> List[str]:
         """Get list of available speech recognition engines."""
-        engines = ["google"]  # Google is usually always available
+        return list(AVAILABLE_ENGINES)
+
+
+def parse_google_speech_response(response_text: str) -> str:
+    """
+    Get the transcript from a Google Web Speech API response.
+    
+    The response holds one JSON object per line. The first ones usually have
+    an empty result; the first non-empty result is used, and its most
+    confident alternative when confidences are given.
+    
+    Args:
+        response_text (str): Response body
         
-        # Test other engines
-        try:
-            sr.Recognizer().recognize_sphinx
-            engines.append("sphinx")
-        except AttributeError:
-            pass
+    Returns:
+        str: Recognized text
         
-        return engines
\ No newline at end of file
+    Raises:
+        sr.UnknownValueError: If the response has no transcript
+    """
+    for line in response_text.split("\n"):
+        if not line:
+            continue
+        result = json.loads(line)["result"]
+        if result:
+            best_result = result[0]
+            break
+    else:
+        raise sr.UnknownValueError()
+    
+    alternatives = best_result.get("alternative") if isinstance(best_result, dict) else None
+    if not alternatives:
+        raise sr.UnknownValueError()
+    best = max(alternatives, key=lambda alternative: alternative.get("confidence", 0))
+    if "transcript" not in best:
+        raise sr.UnknownValueError()
+    return best["transcript"]
+
+
+# Kept-alive Google Web Speech connections not in use by a recognition, shared
+# by every VoiceToText in the process
+_idle_google_connections = queue.SimpleQueue()
+
+# Shared recognition thread pool
+_recognition_pool: Optional[ThreadPoolExecutor] = None
+# Guards first-time creation so concurrent callers share one pool
+_recognition_pool_lock = threading.Lock()
+
+# Shared Google Cloud Speech client
+_speech_client = None
+# Guards first-time creation so concurrent callers share one client
+_speech_client_lock = threading.Lock()
+
+
+def get_recognition_pool() -> ThreadPoolExecutor:
+    """
+    Get the thread pool continuous mode recognizes phrases on.
+    
+    Every listening session in the process submits to the same pool, so
+    concurrent sessions share one set of recognition threads instead of each
+    starting its own.
+    """
+    global _recognition_pool
+    if _recognition_pool is None:
+        with _recognition_pool_lock:
+            if _recognition_pool is None:
+                _recognition_pool = ThreadPoolExecutor(
+                    max_workers=RECOGNITION_POOL_SIZE, thread_name_prefix="speech-recognition"
+                )
+    return _recognition_pool
+
+
+def get_speech_client():
+    """
+    Get the shared Google Cloud Speech client.
+    
+    Creating a client loads credentials and opens a gRPC channel, so it is
+    done once per process; the client is safe to use from several threads.
+    """
+    global _speech_client
+    if _speech_client is None:
+        with _speech_client_lock:
+            if _speech_client is None:
+                _speech_client = speech.SpeechClient()
+    return _speech_client
+
+
+@functools.lru_cache(maxsize=None)
+def load_vosk_model(model_path: str):
+    """
+    Load a Vosk model once per process.
+    
+    Models are read-only once loaded, so every VoiceToText using the same
+    model directory shares one copy.
+    
+    Args:
+        model_path (str): Model directory
+    """
+    vosk.SetLogLevel(-1)
+    return vosk.Model(model_path)